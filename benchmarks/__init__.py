@@ -0,0 +1,14 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Benchmarks    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+
+## Imports
+from pathlib import Path
+
+## Constants
+PROGRAMS: Path = Path(__file__).parent / "programs"
+__all__: tuple[str, ...] = (
+    "PROGRAMS",
+)
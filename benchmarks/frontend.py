@@ -0,0 +1,172 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Benchmarks    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Frontend Throughput           ##
+##-------------------------------##
+
+## Imports
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from .generator import ProgramGenerator
+from emberc.frontend import Lexer, Parser
+from emberc.middleware.passes import NodeCounter
+
+## Constants
+ROOT: Path = Path(__file__).parent.parent
+RATES: tuple[str, ...] = ("tokens_per_second", "nodes_per_second", "lines_per_second")
+
+
+## Functions
+def lex(src: Path) -> tuple[int, float]:
+    """
+    Lexes a file; Returns the token count and lex time
+    """
+    start = time.perf_counter()
+    tokens = sum(1 for _ in Lexer(src).lex())
+    return (tokens, time.perf_counter() - start)
+
+
+def parse(src: Path) -> tuple[int, float]:
+    """
+    Lexes and parses a file; Returns the node count and total time
+    """
+    start = time.perf_counter()
+    ast = Parser(Lexer(src).lex()).parse()
+    elapsed = time.perf_counter() - start
+    return (NodeCounter(ast).total, elapsed)
+
+
+def peak_memory(src: Path) -> tuple[int, int]:
+    """
+    Returns the peak traced memory of lexing and of parsing a file
+    (measured separately from timing since tracing slows both down)
+    """
+    tracemalloc.start()
+    for _ in Lexer(src).lex():
+        pass
+    lexing = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    ast = Parser(Lexer(src).lex()).parse()
+    parsing = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del ast
+    return (lexing, parsing)
+
+
+def commit() -> str | None:
+    """
+    Returns the current git commit of the repository if known
+    """
+    try:
+        return subprocess.run(
+            ("git", "rev-parse", "--short", "HEAD"), cwd=ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure(src: Path, repeat: int) -> dict[str, Any]:
+    """
+    Benchmarks the frontend on a file keeping the best of repeated runs
+    """
+    lines = sum(1 for _ in src.open())
+    tokens, lex_time = min((lex(src) for _ in range(repeat)), key=lambda run: run[1])
+    nodes, total_time = min((parse(src) for _ in range(repeat)), key=lambda run: run[1])
+    parse_time = max(total_time - lex_time, 1e-9)
+    lexing, parsing = peak_memory(src)
+    return {
+        "file": str(src), "lines": lines, "bytes": src.stat().st_size,
+        "tokens": tokens, "nodes": nodes,
+        "phases": {"lex": lex_time, "parse": parse_time, "total": total_time},
+        "tokens_per_second": tokens / lex_time,
+        "nodes_per_second": nodes / parse_time,
+        "lines_per_second": lines / total_time,
+        "peak_memory": {"lex": lexing, "parse": parsing},
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> bool:
+    """
+    Prints rate changes against a baseline result file
+    Returns False if any rate dropped by more than the tolerance
+    """
+    passed = True
+    for rate in RATES:
+        old, new = baseline["frontend"][rate], results["frontend"][rate]
+        change = new / old - 1
+        regressed = change < -tolerance
+        passed = passed and not regressed
+        print(f"{rate:>20} {old:>14.0f} {new:>14.0f} {change:>+9.1%}"
+              f"{'  REGRESSION' if regressed else ''}")
+    return passed
+
+
+## Body
+arguments = argparse.ArgumentParser(
+    prog="benchmarks.frontend", description="Ember lexer/parser throughput benchmark"
+)
+arguments.add_argument("files", nargs='*', type=Path, help="benchmark these files instead")
+arguments.add_argument("--lines", type=int, default=20_000)
+arguments.add_argument("--seed", type=int, default=0)
+arguments.add_argument("--depth", type=int, default=3)
+arguments.add_argument("--expression-size", type=int, default=8)
+arguments.add_argument("--comment-density", type=float, default=0.1)
+arguments.add_argument("--repeat", type=int, default=3)
+arguments.add_argument("--output", type=Path, help="write JSON results here")
+arguments.add_argument("--compare", type=Path, help="baseline JSON results to compare against")
+arguments.add_argument("--tolerance", type=float, default=0.10)
+options = arguments.parse_args()
+
+generator = ProgramGenerator(
+    options.seed, options.depth, options.expression_size, options.comment_density
+)
+results: dict[str, Any] = {
+    "commit": commit(), "python": platform.python_version(), "generator": {
+        "seed": options.seed, "depth": options.depth,
+        "expression_size": options.expression_size,
+        "comment_density": options.comment_density, "lines": options.lines,
+    },
+}
+with tempfile.TemporaryDirectory() as directory:
+    sources: list[Path] = options.files
+    if not sources:
+        src = Path(directory) / "generated.ember"
+        start = time.perf_counter()
+        generator.write(src, options.lines)
+        results["generator"]["seconds"] = time.perf_counter() - start
+        sources = [src]
+    runs = [measure(src, options.repeat) for src in sources]
+results["runs"] = runs
+totals = {key: sum(run[key] for run in runs) for key in ("lines", "tokens", "nodes")}
+lex_time = sum(run["phases"]["lex"] for run in runs)
+parse_time = sum(run["phases"]["parse"] for run in runs)
+results["frontend"] = {
+    **totals,
+    "tokens_per_second": totals["tokens"] / lex_time,
+    "nodes_per_second": totals["nodes"] / parse_time,
+    "lines_per_second": totals["lines"] / (lex_time + parse_time),
+    "peak_memory": max(max(run["peak_memory"].values()) for run in runs),
+}
+frontend = results["frontend"]
+print(f"lines={frontend['lines']} tokens={frontend['tokens']} nodes={frontend['nodes']}")
+print(f"lex    {lex_time:>10.3f}s {frontend['tokens_per_second']:>14.0f} tokens/s")
+print(f"parse  {parse_time:>10.3f}s {frontend['nodes_per_second']:>14.0f} nodes/s")
+print(f"peak memory {frontend['peak_memory'] / 1024 ** 2:.2f} MiB")
+if options.output:
+    options.output.write_text(json.dumps(results, indent=2) + '\n')
+if options.compare:
+    print(f"\n{'':>20} {'baseline':>14} {'current':>14} {'change':>9}")
+    if not compare(results, json.loads(options.compare.read_text()), options.tolerance):
+        sys.exit(1)
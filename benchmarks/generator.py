@@ -0,0 +1,207 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Benchmarks    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Synthetic Program Generator   ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import random
+from collections.abc import Generator
+from pathlib import Path
+
+## Constants
+Type_LineGenerator = Generator[str, None, None]
+BINARY_OPERATORS: tuple[str, ...] = (
+    '+', '-', '*', '/', '%', '<', '>', '<=', '>=', '==', '!=',
+)
+TYPES: tuple[str, ...] = (
+    "int8", "int16", "int32", "int64", "uint8", "uint16", "uint32", "uint64",
+)
+MAX_CALL_NESTING: int = 2
+WORDS: tuple[str, ...] = (
+    "compute", "update", "check", "the", "value", "loop", "bound", "result",
+    "index", "total", "carry", "step", "next", "state", "count",
+)
+
+
+## Classes
+class ProgramGenerator:
+    """
+    Ember Benchmark Program Generator
+    - Generates syntactically valid Ember programs from a seed; the same
+    seed and settings always give the same program
+    Programs are a series of functions whose bodies mix declarations,
+    assignments, calls to earlier functions, conditionals and all three
+    loop forms nested up to depth, with expressions of up to expression_size
+    operators; comment_density is the chance a statement gets a comment
+    Symbols are declared before use but programs are not meant to be run
+    """
+
+    # -Constructor
+    def __init__(
+        self, seed: int = 0, depth: int = 3, expression_size: int = 8,
+        comment_density: float = 0.1, statements: int = 12
+    ) -> None:
+        self.seed: int = seed
+        self.depth: int = depth
+        self.expression_size: int = expression_size
+        self.comment_density: float = comment_density
+        self.statements: int = statements
+        self._random: random.Random = random.Random(seed)
+        self._functions: list[tuple[str, int]] = []
+        self._scopes: list[list[str]] = []
+        self._names: int = 0
+        self._calls: int = 0
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"ProgramGenerator(seed={self.seed}, depth={self.depth}, "
+                f"expression_size={self.expression_size}, "
+                f"comment_density={self.comment_density})")
+
+    # -Instance Methods
+    def generate(self, lines: int) -> Type_LineGenerator:
+        '''
+        Yields lines of a program at least the given number of lines long
+        '''
+        self._random.seed(self.seed)
+        self._functions = []
+        self._names = 0
+        count = 0
+        while count < lines:
+            for line in self._function():
+                count += 1
+                yield line
+
+    def write(self, path: Path, lines: int) -> int:
+        '''
+        Writes a generated program to a file; Returns its line count
+        '''
+        count = 0
+        with path.open('w') as fp:
+            for line in self.generate(lines):
+                fp.write(line + '\n')
+                count += 1
+        return count
+
+    def _name(self, prefix: str) -> str:
+        self._names += 1
+        return f"{prefix}{self._names}"
+
+    def _comment(self, indent: str) -> Type_LineGenerator:
+        '''
+        Yields a comment line (or none) for a statement
+        '''
+        if self._random.random() >= self.comment_density:
+            return
+        text = ' '.join(self._random.choices(WORDS, k=self._random.randint(2, 8)))
+        if self._random.random() < 0.5:
+            yield f"{indent}// {text}"
+        else:
+            yield f"{indent}/* {text} */"
+
+    def _function(self) -> Type_LineGenerator:
+        '''
+        Yields a function declaration callable by later functions
+        '''
+        _id = self._name("fn_")
+        parameters = [self._name("p") for _ in range(self._random.randint(0, 3))]
+        yield from self._comment('')
+        signature = ', '.join(f"{self._random.choice(TYPES)} {p}" for p in parameters)
+        yield f"fn {_id}({signature}) : {self._random.choice(TYPES)}"
+        yield '{'
+        self._scopes = [parameters, []]
+        for _ in range(self._random.randint(1, self.statements)):
+            yield from self._statement(1)
+        yield f"\treturn {self._expression()};"
+        yield '}'
+        yield ''
+        self._scopes = []
+        self._functions.append((_id, len(parameters)))
+
+    def _statement(self, depth: int) -> Type_LineGenerator:
+        '''
+        Yields the lines of a random statement nested at the given depth
+        '''
+        indent = '\t' * depth
+        yield from self._comment(indent)
+        roll = self._random.random()
+        nested = depth <= self.depth
+        if roll < 0.35 or not self._symbols():
+            _id = self._name("v")
+            yield f"{indent}{self._random.choice(TYPES)} {_id} = {self._expression()};"
+            self._scopes[-1].append(_id)
+        elif roll < 0.55:
+            yield f"{indent}{self._random.choice(self._symbols())} = {self._expression()};"
+        elif roll < 0.65 and self._functions:
+            yield f"{indent}{self._call()};"
+        elif roll < 0.75 and nested:
+            yield f"{indent}if ({self._expression()})"
+            yield from self._block(depth)
+            if self._random.random() < 0.5:
+                yield f"{indent}else"
+                yield from self._block(depth)
+        elif roll < 0.85 and nested:
+            counter = self._name("i")
+            yield (f"{indent}for (int32 {counter} = 0; {counter} < "
+                   f"{self._random.randint(1, 100)}; {counter} = {counter} + 1)")
+            yield from self._block(depth, counter)
+        elif roll < 0.93 and nested:
+            yield f"{indent}while ({self._expression()})"
+            yield from self._block(depth)
+        elif nested:
+            yield f"{indent}do"
+            yield from self._block(depth)
+            yield f"{indent}while ({self._expression()});"
+        else:
+            yield f"{indent}{self._expression()};"
+
+    def _block(self, depth: int, *symbols: str) -> Type_LineGenerator:
+        '''
+        Yields a braced block of statements one level deeper
+        '''
+        indent = '\t' * depth
+        yield f"{indent}{{"
+        self._scopes.append(list(symbols))
+        for _ in range(self._random.randint(1, max(1, self.statements // 2))):
+            yield from self._statement(depth + 1)
+        self._scopes.pop()
+        yield f"{indent}}}"
+
+    def _symbols(self) -> list[str]:
+        return [symbol for scope in self._scopes for symbol in scope]
+
+    def _call(self) -> str:
+        _id, arity = self._random.choice(self._functions)
+        size = max(1, self.expression_size // 4)
+        self._calls += 1
+        call = f"{_id}({', '.join(self._expression(size) for _ in range(arity))})"
+        self._calls -= 1
+        return call
+
+    def _expression(self, size: int | None = None) -> str:
+        '''
+        Returns an expression with up to size binary operators
+        '''
+        operators = self._random.randint(0, self.expression_size if size is None else size)
+        expression = self._operand()
+        for _ in range(operators):
+            operator = self._random.choice(BINARY_OPERATORS)
+            if self._random.random() < 0.2:
+                expression = f"({expression})"
+            expression = f"{expression} {operator} {self._operand()}"
+        return expression
+
+    def _operand(self) -> str:
+        roll = self._random.random()
+        symbols = self._symbols()
+        if roll < 0.45 and symbols:
+            return self._random.choice(symbols)
+        elif roll < 0.5 and self._functions and self._calls < MAX_CALL_NESTING:
+            return self._call()
+        elif roll < 0.55:
+            return f"-{self._random.randint(0, 1000)}"
+        return str(self._random.randint(0, 100_000))
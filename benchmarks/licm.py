@@ -0,0 +1,49 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Benchmarks    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Loop-Invariant Code Motion    ##
+##-------------------------------##
+
+## Imports
+import sys
+import time
+from pathlib import Path
+
+from . import PROGRAMS
+from emberc.backend import Interpreter
+from emberc.frontend import Lexer, Parser
+from emberc.middleware.passes import LoopInvariantCodeMotion
+
+## Constants
+SRC: Path = PROGRAMS / "loops.ember"
+
+
+## Functions
+def measure(src: Path, optimize: bool) -> tuple[object, Interpreter, float]:
+    """
+    Parses and runs a program; Returns its result, interpreter and run time
+    """
+    ast = Parser(Lexer(src).lex()).parse()
+    if optimize:
+        LoopInvariantCodeMotion(ast).run()
+    interpreter = Interpreter(ast)
+    start = time.perf_counter()
+    result = interpreter.run()
+    return (result, interpreter, time.perf_counter() - start)
+
+
+## Body
+if len(sys.argv) > 1:
+    SRC = Path(sys.argv[1])
+baseline = measure(SRC, False)
+optimized = measure(SRC, True)
+assert baseline[0] == optimized[0], "LICM changed the program result"
+print(f"{SRC.name}: result={baseline[0]}")
+print(f"{'':>10} {'steps':>12} {'operations':>12} {'seconds':>10}")
+for name, (_, interpreter, elapsed) in (("baseline", baseline), ("licm", optimized)):
+    print(f"{name:>10} {interpreter.steps:>12} {interpreter.operations:>12} {elapsed:>10.4f}")
+print(f"{'ratio':>10} {optimized[1].steps / baseline[1].steps:>12.3f} "
+      f"{optimized[1].operations / baseline[1].operations:>12.3f} "
+      f"{optimized[2] / baseline[2]:>10.3f}")
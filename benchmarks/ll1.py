@@ -0,0 +1,66 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Benchmarks    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Table-Driven Parser           ##
+##-------------------------------##
+
+## Imports
+import gc
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .generator import ProgramGenerator
+from emberc.frontend import Lexer, Parser, ParserLL1, Token
+from emberc.middleware.passes import NodeCounter
+
+## Constants
+LINES: int = 20_000
+REPEAT: int = 10
+PARSERS: tuple[type[Parser], ...] = (Parser, ParserLL1)
+
+
+## Functions
+def measure(tokens: list[Token]) -> dict[type[Parser], float]:
+    """
+    Parses pre-lexed tokens with every parser in turn REPEAT times
+    Returns the best parse time of each (garbage collection paused as
+    in timeit: its passes over live ASTs would be charged to whichever
+    parser happens to allocate when they trigger)
+    """
+    best = {parser: float('inf') for parser in PARSERS}
+    gc.disable()
+    try:
+        for _ in range(REPEAT):
+            for parser in PARSERS:
+                start = time.perf_counter()
+                parser(iter(tokens)).parse()
+                best[parser] = min(best[parser], time.perf_counter() - start)
+                gc.collect()
+    finally:
+        gc.enable()
+    return best
+
+
+## Body
+with tempfile.TemporaryDirectory() as directory:
+    sources: list[Path] = [Path(arg) for arg in sys.argv[1:]]
+    if not sources:
+        sources = [Path(directory) / "generated.ember", Path(directory) / "statements.ember"]
+        ProgramGenerator().write(sources[0], LINES)
+        # -Single operand expressions: statement rules dominate parsing
+        ProgramGenerator(expression_size=0, comment_density=0.0).write(sources[1], LINES)
+    print(f"{'':>18} {'tokens':>8} {'nodes':>8} {'recursive':>10} {'table':>10} {'ratio':>7}")
+    for src in sources:
+        tokens = list(Lexer(src).lex())
+        recursive = Parser(iter(tokens)).parse()
+        table = ParserLL1(iter(tokens)).parse()
+        assert [str(node) for node in recursive] == [str(node) for node in table], \
+            f"{src.name}: parsers disagree"
+        best = measure(tokens)
+        print(f"{src.name:>18} {len(tokens):>8} {NodeCounter(recursive).total:>8} "
+              f"{best[Parser]:>10.4f} {best[ParserLL1]:>10.4f} "
+              f"{best[ParserLL1] / best[Parser]:>7.3f}")
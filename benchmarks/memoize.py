@@ -0,0 +1,52 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Benchmarks    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Runtime Memoization           ##
+##-------------------------------##
+
+## Imports
+import sys
+import time
+from pathlib import Path
+
+from . import PROGRAMS
+from emberc.backend import Interpreter, MemoCache
+from emberc.frontend import Lexer, Parser
+from emberc.middleware.passes.common import pure_functions
+
+## Constants
+SRC: Path = PROGRAMS / "fibonacci.ember"
+CAPACITY: int = 4096
+
+
+## Functions
+def measure(src: Path, memoize: bool) -> tuple[object, Interpreter, float]:
+    """
+    Parses and runs a program; Returns its result, interpreter and run time
+    """
+    ast = Parser(Lexer(src).lex()).parse()
+    memo = MemoCache(pure_functions(ast), CAPACITY) if memoize else None
+    interpreter = Interpreter(ast, memo=memo)
+    start = time.perf_counter()
+    result = interpreter.run()
+    return (result, interpreter, time.perf_counter() - start)
+
+
+## Body
+if len(sys.argv) > 1:
+    SRC = Path(sys.argv[1])
+baseline = measure(SRC, False)
+memoized = measure(SRC, True)
+assert baseline[0] == memoized[0], "Memoization changed the program result"
+print(f"{SRC.name}: result={baseline[0]}")
+print(f"{'':>10} {'calls':>12} {'steps':>12} {'seconds':>10}")
+for name, (_, interpreter, elapsed) in (("baseline", baseline), ("memoized", memoized)):
+    print(f"{name:>10} {interpreter.calls:>12} {interpreter.steps:>12} {elapsed:>10.4f}")
+print(f"{'speedup':>10} {baseline[1].calls / memoized[1].calls:>12.1f} "
+      f"{baseline[1].steps / memoized[1].steps:>12.1f} {baseline[2] / memoized[2]:>10.1f}")
+assert memoized[1].memo is not None
+print(f"\n{'function':>20} {'hits':>10} {'misses':>10} {'hit rate':>10}")
+for _id, (hits, misses, rate) in memoized[1].memo.report().items():
+    print(f"{_id:>20} {hits:>10} {misses:>10} {rate:>10.1%}")
@@ -0,0 +1,94 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Benchmarks    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Profile-Guided Optimization   ##
+##-------------------------------##
+
+## Imports
+import sys
+import tempfile
+from pathlib import Path
+
+from . import PROGRAMS
+from emberc.backend import Interpreter, ProfilingInterpreter, constant_evaluator
+from emberc.frontend import Lexer, Parser
+from emberc.middleware.nodes import NodeBase, NodeConditional
+from emberc.middleware.passes import NodeCounter, PassManager
+from emberc.middleware.profile import Profile
+
+## Constants
+SRC: Path = PROGRAMS / "skewed.ember"
+PASSES: tuple[str, ...] = ("inline", "unroll", "branches", "dce")
+
+
+## Functions
+def build(src: Path, profile: Profile | None, passes: tuple[str, ...]) -> list[NodeBase]:
+    """
+    Parses a program and runs passes guided by an optional profile
+    """
+    ast = Parser(Lexer(src).lex()).parse()
+    if passes:
+        PassManager(ast, passes, profile, constant_evaluator).run()
+    return ast
+
+
+## Classes
+class ArmCounter(Interpreter):
+    """
+    Interpreter counting the if/else arms it runs: the true arm is the
+    fall-through path of generated code, the false arm a taken jump
+    """
+
+    # -Constructor
+    def __init__(self, ast: list[NodeBase]) -> None:
+        super().__init__(ast)
+        self.fall_through: int = 0
+        self.taken: int = 0
+
+    # -Instance Methods
+    def _evaluate_conditional(self, node: NodeConditional) -> None:
+        if node.false_block is None:
+            super()._evaluate_conditional(node)
+        elif self.evaluate(node.condition):
+            self.fall_through += 1
+            self.evaluate(node.true_block)
+        else:
+            self.taken += 1
+            self.evaluate(node.false_block)
+
+
+## Body
+if len(sys.argv) > 1:
+    SRC = Path(sys.argv[1])
+# -Training run: the unoptimized program profiled and the profile round-tripped
+training = ProfilingInterpreter(build(SRC, None, ()))
+training.run()
+with tempfile.TemporaryDirectory() as directory:
+    training.profile.save(Path(directory) / "program.profile")
+    profile = Profile.load(Path(directory) / "program.profile")
+builds = {
+    "baseline": build(SRC, None, ()),
+    "static": build(SRC, None, PASSES),
+    "pgo": build(SRC, profile, PASSES),
+}
+runs: dict[str, tuple[object, ArmCounter]] = {}
+for name, ast in builds.items():
+    interpreter = ArmCounter(ast)
+    runs[name] = (interpreter.run(), interpreter)
+assert len({result for result, _ in runs.values()}) == 1, "optimization changed the result"
+nodes = {name: NodeCounter(ast).total for name, ast in builds.items()}
+print(f"{SRC.name}: result={runs['baseline'][0]} passes={','.join(PASSES)}")
+print(f"{'':>10} {'nodes':>8} {'steps':>10} {'calls':>8} {'operations':>12} "
+      f"{'fall-through':>13} {'taken':>8}")
+for name, (_, interpreter) in runs.items():
+    print(f"{name:>10} {nodes[name]:>8} {interpreter.steps:>10} {interpreter.calls:>8} "
+          f"{interpreter.operations:>12} {interpreter.fall_through:>13} {interpreter.taken:>8}")
+# -What the profile changes: code size and which if/else arm falls through
+_, static = runs["static"]
+_, pgo = runs["pgo"]
+print(f"{'pgo/static':>10} {nodes['pgo'] / nodes['static']:>8.3f} "
+      f"{pgo.steps / static.steps:>10.3f} {'':>8} {pgo.operations / static.operations:>12.3f} "
+      f"{pgo.fall_through / max(static.fall_through, 1):>13.3f} "
+      f"{pgo.taken / max(static.taken, 1):>8.3f}")
@@ -0,0 +1,53 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Benchmarks    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Grammar Rule Profile          ##
+##-------------------------------##
+
+## Imports
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .generator import ProgramGenerator
+from emberc.frontend import FrontendHook, Lexer, Parser, SamplingProfiler
+
+## Constants
+LINES: int = 5_000
+
+
+## Functions
+def parse(src: Path, hook: FrontendHook | None) -> float:
+    """
+    Parses a file with an optional hook on lexer and parser; Returns the time
+    """
+    lexer = Lexer(src)
+    if hook is not None:
+        lexer.add_hook(hook)
+    parser = Parser(lexer.lex())
+    if hook is not None:
+        parser.add_hook(hook)
+    start = time.perf_counter()
+    parser.parse()
+    return time.perf_counter() - start
+
+
+## Body
+with tempfile.TemporaryDirectory() as directory:
+    if len(sys.argv) > 1:
+        SRC = Path(sys.argv[1])
+    else:
+        SRC = Path(directory) / "generated.ember"
+        ProgramGenerator().write(SRC, LINES)
+    unhooked = parse(SRC, None)
+    hooked = parse(SRC, FrontendHook())
+    with SamplingProfiler() as profiler:
+        profiled = parse(SRC, profiler)
+print(f"{SRC.name}: unhooked={unhooked:.3f}s no-op hook={hooked:.3f}s "
+      f"({hooked / unhooked - 1:+.1%}) profiled={profiled:.3f}s samples={profiler.samples}")
+print(f"\n{'rule':>24} {'self':>8} {'inclusive':>10}")
+for rule, exclusive, inclusive in profiler.report():
+    print(f"{rule:>24} {exclusive:>8.1%} {inclusive:>10.1%}")
@@ -0,0 +1,78 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Benchmarks    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Span Index Queries            ##
+##-------------------------------##
+
+## Imports
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .generator import ProgramGenerator
+from emberc.frontend import Lexer, Parser
+from emberc.middleware.nodes import NodeBase
+from emberc.middleware.passes.common import walk
+from emberc.middleware.spans import SpanIndex
+
+## Constants
+LINES: int = 100_000
+QUERIES: int = 10_000
+WALKS: int = 5
+RANGE: int = 2_000
+
+
+## Functions
+def innermost(ast: list[NodeBase], offset: int) -> NodeBase | None:
+    """
+    Returns the innermost node containing an offset walking the whole AST
+    """
+    found: NodeBase | None = None
+    for root in ast:
+        for node in walk(root):
+            span = node.span
+            if span is not None and span[0] <= offset < span[1] and (
+                    found is None or found.span is None or
+                    (span[0], -span[1]) >= (found.span[0], -found.span[1])):
+                found = node
+    return found
+
+
+## Body
+with tempfile.TemporaryDirectory() as directory:
+    if len(sys.argv) > 1:
+        SRC = Path(sys.argv[1])
+    else:
+        SRC = Path(directory) / "generated.ember"
+        ProgramGenerator().write(SRC, LINES)
+    size = SRC.stat().st_size
+    parser = Parser(Lexer(SRC).lex())
+    ast = parser.parse()
+start = time.perf_counter()
+index = SpanIndex(parser.spanned)
+build = time.perf_counter() - start
+start = time.perf_counter()
+SpanIndex.from_ast(ast)
+walked_build = time.perf_counter() - start
+offsets = [random.Random(0).randint(1, size) for _ in range(QUERIES)]
+start = time.perf_counter()
+for offset in offsets:
+    index.at(offset)
+point = (time.perf_counter() - start) / QUERIES
+start = time.perf_counter()
+for offset in offsets:
+    index.overlapping(offset, offset + RANGE)
+ranged = (time.perf_counter() - start) / QUERIES
+start = time.perf_counter()
+for offset in offsets[:WALKS]:
+    assert innermost(ast, offset) is index.at(offset)
+walked = (time.perf_counter() - start) / WALKS
+print(f"{SRC.name}: bytes={size} nodes={len(index)} "
+      f"index build={build:.3f}s (from a walk {walked_build:.3f}s)")
+print(f"{'point query (index)':>24} {point * 1e6:>12.1f} us")
+print(f"{f'range query ({RANGE} chars)':>24} {ranged * 1e6:>12.1f} us")
+print(f"{'point query (walk)':>24} {walked * 1e6:>12.1f} us")
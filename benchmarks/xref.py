@@ -0,0 +1,59 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Benchmarks    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Cross-Reference Database      ##
+##-------------------------------##
+
+## Imports
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .generator import ProgramGenerator
+from emberc.xref import CrossReference
+
+## Constants
+FILES: int = 1_000
+LINES: int = 200
+QUERIES: int = 1_000
+
+
+## Functions
+def timed(function: Callable[..., Any], *arguments: Any) -> tuple[Any, float]:
+    """
+    Returns a call's result and its wall time
+    """
+    start = time.perf_counter()
+    result = function(*arguments)
+    return result, time.perf_counter() - start
+
+
+## Body
+with tempfile.TemporaryDirectory() as directory:
+    root = Path(directory) / "src"
+    root.mkdir()
+    for index in range(FILES):
+        ProgramGenerator(seed=index).write(root / f"module{index}.ember", LINES)
+    with CrossReference(Path(directory) / "xref.db") as xref:
+        cold, cold_time = timed(xref.update, [root])
+        warm, warm_time = timed(xref.update, [root])
+        edited = root / "module0.ember"
+        edited.write_text(edited.read_text() + "int edited = 1;\n")
+        edit, edit_time = timed(xref.update, [root])
+        statistics = xref.statistics()
+        names = [f"fn_{index}" for index in range(1, QUERIES + 1)]
+        found = 0
+        start = time.perf_counter()
+        for name in names:
+            found += len(xref.callers(name))
+        query_time = (time.perf_counter() - start) / QUERIES
+print(f"{FILES} files x {LINES} lines: "
+      + " ".join(f"{name}={count}" for name, count in statistics.items()))
+print(f"{'cold index':>24} {cold_time:>10.3f} s  (indexed={cold[0]})")
+print(f"{'no changes':>24} {warm_time:>10.3f} s  (unchanged={warm[1]})")
+print(f"{'one file edited':>24} {edit_time:>10.3f} s  (indexed={edit[0]})")
+print(f"{'callers query':>24} {query_time * 1e3:>10.3f} ms  ({found / QUERIES:.1f} results)")
@@ -0,0 +1,173 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Compile API                   ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from .frontend import Lexer, Parser
+from .frontend.lexer import Type_Source
+from .middleware.nodes import NodeBase
+
+## Constants
+SOURCE_NAME: str = "<memory>"
+MAX_WORKERS: int = 4
+MAX_RUNNING: int = 8
+MAX_WAITING: int = 64
+
+
+## Functions
+def compile_source(
+    source: Type_Source, name: str | Path = SOURCE_NAME, passes: Iterable[str] = ()
+) -> list[NodeBase]:
+    """
+    Parses source text (or UTF-8 bytes) and runs the given middleware
+    passes; name is the file recorded in node positions
+    """
+    return _compile(Lexer(name, source), passes)
+
+
+def compile_file(path: str | Path, passes: Iterable[str] = ()) -> list[NodeBase]:
+    """
+    Parses a file and runs the given middleware passes
+    """
+    return _compile(Lexer(path), passes)
+
+
+def _compile(lexer: Lexer, passes: Iterable[str]) -> list[NodeBase]:
+    ast = Parser(lexer.lex()).parse()
+    if passes := list(passes):
+        from .backend import constant_evaluator
+        from .middleware.passes import PassManager
+        PassManager(ast, passes, evaluator=constant_evaluator).run()
+    return ast
+
+
+## Classes
+class CompilerBusyError(Exception):
+    """
+    Ember Compiler Busy Error
+    - Raised when an AsyncCompiler already has max_waiting requests queued
+    """
+    pass
+
+
+class AsyncCompiler:
+    """
+    Ember Async Compiler
+    - Compiles in-memory sources on a thread or process pool so an event
+    loop is never blocked; at most max_running compiles are handed to the
+    pool at once, up to max_waiting more wait for a turn and any further
+    request fails at once with CompilerBusyError instead of growing the
+    queue (and everyone's latency)
+    Cancelling a request that is still waiting or queued in the pool drops
+    it; a compile already running finishes in the pool and is discarded
+    Threads share the process (the parser holds the GIL) and suit small
+    sources; processes compile in parallel but pickle sources and trees
+
+    async with AsyncCompiler("process", workers=4) as compiler:
+        ast = await compiler.compile(source, "main.ember", passes=("inline",))
+    """
+
+    # -Constructor
+    def __init__(
+        self, executor: str | Executor = "thread", workers: int = MAX_WORKERS,
+        max_running: int = MAX_RUNNING, max_waiting: int = MAX_WAITING
+    ) -> None:
+        self._owns_executor: bool = not isinstance(executor, Executor)
+        self.executor: Executor
+        match executor:
+            case Executor():
+                self.executor = executor
+            case "thread":
+                self.executor = ThreadPoolExecutor(workers, thread_name_prefix="emberc")
+            case "process":
+                self.executor = ProcessPoolExecutor(workers)
+            case _:
+                raise ValueError(f"Unknown executor '{executor}' (expected 'thread' or 'process')")
+        self.max_running: int = max_running
+        self.max_waiting: int = max_waiting
+        self.compiled: int = 0
+        self.rejected: int = 0
+        self.cancelled: int = 0
+        self.running: int = 0
+        self.waiting: int = 0
+        self._slots: asyncio.Semaphore | None = None
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"AsyncCompiler(running={self.running}, waiting={self.waiting}, "
+                f"compiled={self.compiled}, rejected={self.rejected})")
+
+    async def __aenter__(self) -> AsyncCompiler:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
+    # -Instance Methods
+    async def compile(
+        self, source: Type_Source, name: str | Path = SOURCE_NAME,
+        passes: Iterable[str] = (), timeout: float | None = None
+    ) -> list[NodeBase]:
+        '''
+        Compiles a source off the event loop; timeout (seconds) covers the
+        wait for a turn as well as the compile and cancels on expiry
+        Raises CompilerBusyError if too many requests are waiting
+        '''
+        if timeout is not None:
+            return await asyncio.wait_for(self.compile(source, name, passes), timeout)
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_running)
+        if self._slots.locked() and self.waiting >= self.max_waiting:
+            self.rejected += 1
+            raise CompilerBusyError(
+                f"{self.waiting} compile requests already waiting (max_waiting={self.max_waiting})"
+            )
+        # -Copy before yielding to the loop: the caller may reuse its buffer
+        if not isinstance(source, str):
+            source = str(source, 'utf-8')
+        self.waiting += 1
+        try:
+            await self._slots.acquire()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.waiting -= 1
+        # -The slot is held until the pool is done with the compile, even
+        #  if the caller stops waiting, so the pool never runs more than
+        #  max_running compiles
+        self.running += 1
+        loop = asyncio.get_running_loop()
+        work = self.executor.submit(compile_source, source, name, tuple(passes))
+        work.add_done_callback(lambda _: loop.is_closed() or loop.call_soon_threadsafe(self._release))
+        try:
+            ast = await asyncio.wrap_future(work)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        self.compiled += 1
+        return ast
+
+    async def close(self) -> None:
+        '''
+        Shuts down an executor this compiler created, dropping queued work
+        '''
+        if self._owns_executor:
+            await asyncio.get_running_loop().run_in_executor(
+                None, lambda: self.executor.shutdown(wait=True, cancel_futures=True)
+            )
+
+    def _release(self) -> None:
+        assert self._slots is not None
+        self.running -= 1
+        self._slots.release()
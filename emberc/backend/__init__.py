@@ -0,0 +1,16 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Backend       ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+
+## Imports
+from .interpreter import Interpreter, InterpreterError, constant_evaluator
+from .memo import MemoCache
+from .profiler import ProfilingInterpreter
+
+## Constants
+__all__: tuple[str, ...] = (
+    "Interpreter", "InterpreterError", "MemoCache", "ProfilingInterpreter",
+    "constant_evaluator",
+)
@@ -0,0 +1,331 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Backend       ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Interpreter                   ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import sys
+from collections.abc import Callable
+from typing import Any
+
+from .memo import MemoCache
+from ..middleware.nodes import (
+    NodeBase, NodeStatementBlock, NodeConditional, NodeLoop,
+    NodeFunctionDeclaration, NodeFunctionCall,
+    NodeVarDeclaration, NodeVarAssignment,
+    NodeExpressionBinary, NodeExpressionUnary, NodeExpressionCast, NodeLiteral,
+    DataType,
+)
+from ..middleware.passes.common import ENTRY_POINT
+
+## Constants
+FRAMES_PER_CALL: int = 16
+Type_Scope = dict[str, Any]
+OPERATOR_BINARY_LUT: dict[NodeExpressionBinary.Type, Callable[[Any, Any], Any]] = {
+    NodeExpressionBinary.Type.Add: lambda lhs, rhs: lhs + rhs,
+    NodeExpressionBinary.Type.Sub: lambda lhs, rhs: lhs - rhs,
+    NodeExpressionBinary.Type.Mul: lambda lhs, rhs: lhs * rhs,
+    NodeExpressionBinary.Type.Div: lambda lhs, rhs: _divide(lhs, rhs),
+    NodeExpressionBinary.Type.Mod: lambda lhs, rhs: _modulo(lhs, rhs),
+    NodeExpressionBinary.Type.Lt: lambda lhs, rhs: lhs < rhs,
+    NodeExpressionBinary.Type.Gt: lambda lhs, rhs: lhs > rhs,
+    NodeExpressionBinary.Type.LtEq: lambda lhs, rhs: lhs <= rhs,
+    NodeExpressionBinary.Type.GtEq: lambda lhs, rhs: lhs >= rhs,
+    NodeExpressionBinary.Type.EqEq: lambda lhs, rhs: lhs == rhs,
+    NodeExpressionBinary.Type.BangEq: lambda lhs, rhs: lhs != rhs,
+}
+
+
+## Functions
+def _divide(lhs: int, rhs: int) -> int:
+    """
+    Integer division truncating towards zero
+    """
+    if rhs == 0:
+        raise InterpreterError("Division by zero")
+    quotient = abs(lhs) // abs(rhs)
+    return quotient if (lhs < 0) == (rhs < 0) else -quotient
+
+
+def _modulo(lhs: int, rhs: int) -> int:
+    """
+    Integer remainder taking the sign of the dividend
+    """
+    return lhs - rhs * _divide(lhs, rhs)
+
+
+def constant_evaluator(ast: list[NodeBase], max_depth: int, max_steps: int) -> Callable[..., Any]:
+    """
+    Returns a function calling the AST's (typed) functions by id for
+    compile-time evaluation: each call gets max_steps steps and runs
+    strictly; calls that fail return None
+    """
+    interpreter = Interpreter(ast, max_depth, max_steps, strict=True)
+
+    def call(_id: str, *arguments: Any) -> Any:
+        interpreter.steps = 0
+        try:
+            return interpreter.call(_id, *arguments)
+        except InterpreterError:
+            return None
+    return call
+
+
+## Classes
+class InterpreterError(RuntimeError):
+    """
+    Ember Language Runtime Error
+    - Raised when an Ember program can not continue executing
+    """
+    pass
+
+
+class _Return(Exception):
+    """
+    Control flow signal carrying a function's return value
+    """
+
+    # -Constructor
+    def __init__(self, value: Any) -> None:
+        self.value: Any = value
+
+
+class Interpreter:
+    """
+    Ember Language Tree-Walking Interpreter
+    - Executes an AST directly; top-level statements run in the global
+    scope and blocks open nested scopes while function calls only see
+    their own frame and the globals
+    Counts evaluated nodes (steps) and arithmetic/logic operations;
+    with max_steps set, calls and loop iterations fail once it is exceeded
+    With a memo cache, calls to its (pure) functions reuse earlier results
+    Strict interpreters fail instead of wrapping a value at a cast (typed
+    lowering casts wherever a value may leave its type) so results match
+    unbounded arithmetic
+    """
+
+    # -Constructor
+    def __init__(
+        self, ast: list[NodeBase], max_depth: int = 256,
+        max_steps: int | None = None, memo: MemoCache | None = None, strict: bool = False
+    ) -> None:
+        self.ast: list[NodeBase] = ast
+        self.max_depth: int = max_depth
+        self.max_steps: int | None = max_steps
+        self.memo: MemoCache | None = memo
+        self.strict: bool = strict
+        self.globals: Type_Scope = {}
+        self.functions: dict[str, NodeFunctionDeclaration] = {}
+        self.steps: int = 0
+        self.operations: int = 0
+        self.calls: int = 0
+        self._scopes: list[Type_Scope] = []
+        self._depth: int = 0
+        self._handlers: dict[type, Callable[[Any], Any]] = {
+            NodeStatementBlock: self._evaluate_block,
+            NodeConditional: self._evaluate_conditional,
+            NodeLoop: self._evaluate_loop,
+            NodeFunctionDeclaration: self._evaluate_function_declaration,
+            NodeFunctionCall: self._evaluate_function_call,
+            NodeVarDeclaration: self._evaluate_var_declaration,
+            NodeVarAssignment: self._evaluate_var_assignment,
+            NodeExpressionBinary: self._evaluate_expression_binary,
+            NodeExpressionUnary: self._evaluate_expression_unary,
+            NodeExpressionCast: self._evaluate_expression_cast,
+            NodeLiteral: self._evaluate_literal,
+        }
+        # -Top-level functions are callable before the program runs
+        for node in ast:
+            if isinstance(node, NodeFunctionDeclaration):
+                self.functions[node.id] = node
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"Interpreter(steps={self.steps}, operations={self.operations}, "
+                f"calls={self.calls})")
+
+    # -Instance Methods
+    def run(self) -> Any:
+        '''
+        Executes the program's top-level statements then calls the
+        entry point if declared; Returns the entry point's result
+        A top-level return ends the program with its value instead
+        '''
+        try:
+            for node in self.ast:
+                self.evaluate(node)
+        except _Return as signal:
+            return signal.value
+        if ENTRY_POINT in self.functions:
+            return self.call(ENTRY_POINT)
+        return None
+
+    def call(self, _id: str, *arguments: Any) -> Any:
+        '''
+        Calls a declared function by id with the given argument values
+        '''
+        function = self.functions.get(_id)
+        if function is None:
+            raise InterpreterError(f"Call to undeclared function '{_id}'")
+        if len(arguments) != function.arity:
+            raise InterpreterError(
+                f"Function '{_id}' expects {function.arity} arguments, got {len(arguments)}"
+            )
+        if self._depth >= self.max_depth:
+            raise InterpreterError(f"Call stack exhausted calling '{_id}'")
+        self._check_budget()
+        memo = self.memo if self.memo is not None and _id in self.memo.functions else None
+        if memo is not None:
+            found, value = memo.lookup(_id, arguments)
+            if found:
+                return value
+        # -Reserve enough host stack for the deepest Ember call chain
+        limit = sys.getrecursionlimit()
+        if self._depth == 0:
+            sys.setrecursionlimit(max(limit, limit + self.max_depth * FRAMES_PER_CALL))
+        self.calls += 1
+        scopes = self._scopes
+        self._scopes = [dict(zip(function.parameters or (), arguments))]
+        self._depth += 1
+        value = None
+        try:
+            self.evaluate(function.body)
+        except _Return as signal:
+            value = signal.value
+        finally:
+            self._scopes = scopes
+            self._depth -= 1
+            if self._depth == 0:
+                sys.setrecursionlimit(limit)
+        if memo is not None:
+            memo.store(_id, arguments, value)
+        return value
+
+    def evaluate(self, node: NodeBase) -> Any:
+        '''
+        Evaluates a node and returns its value
+        '''
+        self.steps += 1
+        return self._handlers[type(node)](node)
+
+    def _check_budget(self) -> None:
+        '''
+        Raises once the step budget is exhausted
+        '''
+        if self.max_steps is not None and self.steps > self.max_steps:
+            raise InterpreterError(f"Step budget of {self.max_steps} exhausted")
+
+    # --Scopes
+    def lookup(self, _id: str) -> Any:
+        '''
+        Gets a symbol's value from the innermost scope declaring it
+        '''
+        for scope in reversed(self._scopes):
+            if _id in scope:
+                return scope[_id]
+        if _id in self.globals:
+            return self.globals[_id]
+        raise InterpreterError(f"Use of undeclared symbol '{_id}'")
+
+    def _assign(self, _id: str, value: Any) -> None:
+        '''
+        Sets a symbol's value in the innermost scope declaring it
+        '''
+        for scope in reversed(self._scopes):
+            if _id in scope:
+                scope[_id] = value
+                return
+        if _id in self.globals:
+            self.globals[_id] = value
+            return
+        raise InterpreterError(f"Assignment to undeclared symbol '{_id}'")
+
+    def _declare(self, _id: str, value: Any) -> None:
+        '''
+        Declares a symbol in the innermost scope
+        '''
+        (self._scopes[-1] if self._scopes else self.globals)[_id] = value
+
+    # --Evaluation
+    def _evaluate_block(self, node: NodeStatementBlock) -> None:
+        self._scopes.append({})
+        try:
+            for statement in node.nodes:
+                self.evaluate(statement)
+        finally:
+            self._scopes.pop()
+
+    def _evaluate_conditional(self, node: NodeConditional) -> None:
+        if self.evaluate(node.condition):
+            self.evaluate(node.true_block)
+        elif node.false_block is not None:
+            self.evaluate(node.false_block)
+
+    def _evaluate_loop(self, node: NodeLoop) -> None:
+        if node.run_before_eval:
+            self.evaluate(node.body)
+        while self.evaluate(node.condition):
+            self._check_budget()
+            self.evaluate(node.body)
+
+    def _evaluate_function_declaration(self, node: NodeFunctionDeclaration) -> None:
+        # -Redeclared functions may no longer be pure
+        if self.memo is not None and self.functions.get(node.id, node) is not node:
+            self.memo.functions.discard(node.id)
+        self.functions[node.id] = node
+
+    def _evaluate_function_call(self, node: NodeFunctionCall) -> Any:
+        if not (isinstance(node.callee, NodeLiteral) and
+                node.callee.type is NodeLiteral.Type.Identifier):
+            raise InterpreterError(f"Callee '{node.callee}' is not a function")
+        arguments = [self.evaluate(argument) for argument in node.arguments or ()]
+        return self.call(str(node.callee.value), *arguments)
+
+    def _evaluate_var_declaration(self, node: NodeVarDeclaration) -> None:
+        value = self.evaluate(node.initializer) if node.initializer else 0
+        self._declare(node.id, value)
+
+    def _evaluate_var_assignment(self, node: NodeVarAssignment) -> Any:
+        if not (isinstance(node.lvalue, NodeLiteral) and
+                node.lvalue.type is NodeLiteral.Type.Identifier):
+            raise InterpreterError(f"Invalid assignment target '{node.lvalue}'")
+        value = self.evaluate(node.rvalue)
+        self._assign(str(node.lvalue.value), value)
+        return value
+
+    def _evaluate_expression_binary(self, node: NodeExpressionBinary) -> Any:
+        lhs = self.evaluate(node.lhs)
+        rhs = self.evaluate(node.rhs)
+        self.operations += 1
+        return OPERATOR_BINARY_LUT[node.type](lhs, rhs)
+
+    def _evaluate_expression_unary(self, node: NodeExpressionUnary) -> Any:
+        value = self.evaluate(node.node)
+        match node.type:
+            case NodeExpressionUnary.Type.Return:
+                raise _Return(value)
+            case NodeExpressionUnary.Type.Not:
+                self.operations += 1
+                return not value
+            case NodeExpressionUnary.Type.Negate:
+                self.operations += 1
+                return -value
+            case _:
+                raise NotImplementedError(f"Unhandled type '{node.type.name}'")
+
+    def _evaluate_expression_cast(self, node: NodeExpressionCast) -> Any:
+        value = self.evaluate(node.node)
+        self.operations += 1
+        wrapped = node.data_type.wrap(value)
+        if self.strict and wrapped != value and node.data_type is not DataType.Bool:
+            raise InterpreterError(f"Value {value} does not fit in {node.data_type}")
+        return wrapped
+
+    def _evaluate_literal(self, node: NodeLiteral) -> Any:
+        if node.type is NodeLiteral.Type.Identifier:
+            return self.lookup(str(node.value))
+        return node.value
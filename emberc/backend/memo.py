@@ -0,0 +1,81 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Backend       ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Memoization Cache             ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from collections import Counter, OrderedDict
+from typing import Any
+
+## Constants
+Type_MemoKey = tuple[str, tuple[Any, ...]]
+
+
+## Classes
+class MemoCache:
+    """
+    Ember Runtime Memoization Cache
+    - Bounded result cache for calls to the given pure functions keyed by
+    function id and argument tuple; evicts the least recently used entry
+    once full. Counts hits and misses per function
+    """
+
+    # -Constructor
+    def __init__(self, functions: set[str], capacity: int = 4096) -> None:
+        self.functions: set[str] = functions
+        self.capacity: int = capacity
+        self.entries: OrderedDict[Type_MemoKey, Any] = OrderedDict()
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self.evictions: int = 0
+
+    # -Dunder Methods
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return (f"MemoCache(capacity={self.capacity}, size={len(self.entries)}, "
+                f"hits={self.hits.total()}, misses={self.misses.total()})")
+
+    # -Instance Methods
+    def lookup(self, _id: str, arguments: tuple[Any, ...]) -> tuple[bool, Any]:
+        '''
+        Looks up a call; Returns whether it was cached and its value
+        '''
+        key = (_id, arguments)
+        if key not in self.entries:
+            self.misses[_id] += 1
+            return (False, None)
+        self.hits[_id] += 1
+        self.entries.move_to_end(key)
+        return (True, self.entries[key])
+
+    def store(self, _id: str, arguments: tuple[Any, ...], value: Any) -> None:
+        '''
+        Caches a call's value evicting the least recently used entry if full
+        '''
+        self.entries[(_id, arguments)] = value
+        self.entries.move_to_end((_id, arguments))
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def hit_rate(self, _id: str) -> float:
+        '''
+        Returns the fraction of a function's calls answered from the cache
+        '''
+        total = self.hits[_id] + self.misses[_id]
+        return self.hits[_id] / total if total else 0.0
+
+    def report(self) -> dict[str, tuple[int, int, float]]:
+        '''
+        Returns each function's hits, misses and hit rate
+        '''
+        return {
+            _id: (self.hits[_id], self.misses[_id], self.hit_rate(_id))
+            for _id in sorted(self.hits.keys() | self.misses.keys())
+        }
@@ -0,0 +1,66 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Backend       ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Profiling Interpreter         ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from typing import Any
+
+from .interpreter import Interpreter
+from ..middleware.nodes import NodeBase, NodeConditional, NodeLoop, NodeFunctionCall
+from ..middleware.profile import Profile
+
+
+## Classes
+class ProfilingInterpreter(Interpreter):
+    """
+    Ember Language Profiling Interpreter
+    - Runs a program like the interpreter while counting loop entries and
+    iterations, conditional arms taken and call site executions into a
+    profile keyed by source position (see middleware.profile)
+
+    interpreter = ProfilingInterpreter(ast); interpreter.run()
+    interpreter.profile.save(Path("program.profile"))
+    """
+
+    # -Constructor
+    def __init__(
+        self, ast: list[NodeBase], profile: Profile | None = None, **options: Any
+    ) -> None:
+        super().__init__(ast, **options)
+        self.profile: Profile = profile if profile is not None else Profile()
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"ProfilingInterpreter(steps={self.steps}, profile={self.profile})"
+
+    # -Instance Methods
+    def _evaluate_conditional(self, node: NodeConditional) -> None:
+        taken = bool(self.evaluate(node.condition))
+        self.profile.record_branch(node, taken)
+        if taken:
+            self.evaluate(node.true_block)
+        elif node.false_block is not None:
+            self.evaluate(node.false_block)
+
+    def _evaluate_loop(self, node: NodeLoop) -> None:
+        iterations = 0
+        try:
+            if node.run_before_eval:
+                iterations += 1
+                self.evaluate(node.body)
+            while self.evaluate(node.condition):
+                self._check_budget()
+                iterations += 1
+                self.evaluate(node.body)
+        finally:
+            # -Returns leave loops by exception; their iterations still count
+            self.profile.record_loop(node, iterations)
+
+    def _evaluate_function_call(self, node: NodeFunctionCall) -> Any:
+        self.profile.record_call(node)
+        return super()._evaluate_function_call(node)
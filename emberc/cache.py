@@ -0,0 +1,188 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Function Cache                ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+
+from .backend import constant_evaluator
+from .client import compiler_version
+from .middleware.binary import BinaryAST, BinaryASTError, dump
+from .middleware.hashing import combine, structural_hash
+from .middleware.nodes import NodeBase, NodeFunctionDeclaration, NodeVarDeclaration
+from .middleware.passes import CallGraph, PassManager
+from .middleware.passes.common import callee, clone, symbols_read, symbols_written, walk
+from .middleware.profile import Profile
+
+## Constants
+MODULE: str = "__module__"
+# -Run on the assembled result: whole-program passes and analyses whose
+#  annotations binary ASTs do not keep
+MODULE_PASSES: tuple[str, ...] = ("strip", "induction", "ranges", "slots")
+
+
+## Functions
+def _callees(graph: CallGraph, statements: list[NodeBase]) -> set[str]:
+    """
+    Returns the declared functions the statements call
+    """
+    return {
+        _callee for statement in statements for child in walk(statement)
+        if (_callee := callee(child)) in graph.functions
+    }
+
+
+## Classes
+class FunctionCache:
+    """
+    Ember Function Cache
+    - Runs a pass pipeline one top-level function at a time and keeps
+    each optimized function in a directory (binary AST files) keyed by
+    the structural hashes of everything its compile saw:
+    the function, every function it reaches through calls (inlining
+    copies their bodies), the declarations of the globals any of them
+    read or write, the top-level statements writing globals they read,
+    the pipeline, the profile and the compiler
+    Editing one function only recompiles it and the functions reaching
+    it; top-level statements are compiled together as one more unit
+    Units are compiled apart so their results only depend on their key:
+    whole-program heuristics (e.g. call site counts) see the unit alone
+    Hashes ignore positions so a function that only moved is reused with
+    the positions of the compile that stored it
+    """
+
+    # -Constructor
+    def __init__(self, directory: Path, salt: str | None = None) -> None:
+        self.directory: Path = directory
+        self.salt: str = salt if salt is not None else compiler_version()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"FunctionCache(directory={self.directory}, hits={self.hits}, misses={self.misses})"
+
+    # -Instance Methods
+    def compile(
+        self, ast: list[NodeBase], passes: Iterable[str], profile: Profile | None = None
+    ) -> list[NodeBase]:
+        '''
+        Runs passes over the AST reusing cached functions; Returns the AST
+        '''
+        passes = list(passes)
+        unit_passes = [name for name in passes if name not in MODULE_PASSES]
+        module_passes = [name for name in passes if name in MODULE_PASSES]
+        graph = CallGraph(ast)
+        statements = [node for node in ast if not isinstance(node, NodeFunctionDeclaration)]
+        pipeline = combine(
+            self.salt.encode(), json.dumps(unit_passes).encode(),
+            json.dumps(profile.to_dict() if profile is not None else None).encode()
+        )
+        compiled: list[NodeBase] = []
+        module_done = False
+        for node in ast:
+            if isinstance(node, NodeFunctionDeclaration):
+                functions, context = self._dependencies(graph, {node.id}, statements)
+                compiled.extend(self._unit(
+                    node.id, functions, context, pipeline, unit_passes, profile
+                ))
+            elif not module_done:
+                module_done = True
+                closure = graph.reachable(_callees(graph, statements))
+                functions = [f for f in graph.functions.values() if f.id in closure]
+                compiled.extend(self._unit(
+                    MODULE, functions, statements, pipeline, unit_passes, profile
+                ))
+        ast[:] = compiled
+        if module_passes:
+            PassManager(ast, module_passes).run()
+        return ast
+
+    def _dependencies(
+        self, graph: CallGraph, roots: set[str], statements: list[NodeBase]
+    ) -> tuple[list[NodeFunctionDeclaration], list[NodeBase]]:
+        '''
+        Returns the functions reachable from roots and the top-level
+        statements they depend on: declarations of globals they read or
+        write (only written ones still need their declaration to type-check)
+        and statements writing globals they read; functions those
+        statements call are added until nothing changes
+        '''
+        closure = graph.reachable(roots)
+        while True:
+            read: set[str] = set()
+            written: set[str] = set()
+            for _id in closure:
+                read |= symbols_read(graph.functions[_id].body)
+                written |= symbols_written(graph.functions[_id].body)
+            context = [
+                statement for statement in statements
+                if ((statement.id in read | written) if isinstance(statement, NodeVarDeclaration)
+                    else bool(symbols_written(statement) & read))
+            ]
+            if (called := _callees(graph, context)) <= closure:
+                break
+            closure = graph.reachable(closure | called)
+        return [f for f in graph.functions.values() if f.id in closure], context
+
+    def _unit(
+        self, _id: str, functions: list[NodeFunctionDeclaration], context: list[NodeBase],
+        pipeline: bytes, passes: list[str], profile: Profile | None
+    ) -> list[NodeBase]:
+        '''
+        Compiles one function (or the top-level statements for MODULE)
+        with the functions and top-level statements it depends on;
+        Returns its optimized statements
+        '''
+        key = combine(
+            pipeline, _id.encode(),
+            *(structural_hash(function) for function in functions),
+            *(structural_hash(statement) for statement in context)
+        ).hex()
+        path = self.directory / f"{key}.emba"
+        if (cached := self._load(path)) is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        unit = [clone(statement) for statement in context]
+        unit.extend(clone(function) for function in functions)
+        PassManager(unit, passes, profile, constant_evaluator).run()
+        if _id == MODULE:
+            result = [node for node in unit if not isinstance(node, NodeFunctionDeclaration)]
+        else:
+            result = [
+                node for node in unit
+                if isinstance(node, NodeFunctionDeclaration) and node.id == _id
+            ]
+        self._store(path, result)
+        return result
+
+    def _load(self, path: Path) -> list[NodeBase] | None:
+        try:
+            with BinaryAST(path) as binary:
+                return binary.load()
+        except (OSError, ValueError, BinaryASTError):
+            return None
+
+    def _store(self, path: Path, result: list[NodeBase]) -> None:
+        '''
+        Writes an entry atomically so concurrent builds never read half a file
+        '''
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(descriptor)
+        try:
+            dump(result, Path(temporary))
+            os.replace(temporary, path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
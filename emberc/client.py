@@ -0,0 +1,129 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Compile Client                ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import hashlib
+import json
+import os
+import socket
+import sys
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+## Constants
+# -The client is started once per compile so it only imports what every
+#  request needs (no pathlib, typing, subprocess or the compiler itself)
+PACKAGE: str = os.path.dirname(os.path.abspath(__file__))
+CONNECT_TIMEOUT: float = 5.0
+START_POLL: float = 0.02
+
+
+## Functions
+def default_socket() -> str:
+    """
+    Returns the compile server socket ($EMBERC_SOCKET or one per user)
+    """
+    if path := os.environ.get("EMBERC_SOCKET"):
+        return path
+    directory = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(directory, f"emberc-{os.getuid()}.sock")
+
+
+def compiler_version() -> str:
+    """
+    Returns a digest of the compiler sources (paths, sizes and mtimes);
+    a server built from other sources than the client's is restarted
+    """
+    digest = hashlib.sha1()
+    for directory, directories, files in os.walk(PACKAGE):
+        directories.sort()
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(directory, name)
+                status = os.stat(path)
+                digest.update(f"{path}:{status.st_size}:{status.st_mtime_ns};".encode())
+    return digest.hexdigest()
+
+
+def request(path: str, message: dict[str, Any], timeout: float | None = None) -> dict[str, Any]:
+    """
+    Sends one request to the server and returns its reply
+    Raises OSError if no server is listening
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(CONNECT_TIMEOUT)
+        connection.connect(path)
+        connection.settimeout(timeout)
+        connection.sendall(json.dumps(message).encode() + b'\n')
+        connection.shutdown(socket.SHUT_WR)
+        with connection.makefile('rb') as reader:
+            line = reader.readline()
+    if not line:
+        raise ConnectionError(f"Compile server at '{path}' closed the connection")
+    return json.loads(line)
+
+
+def start_server(path: str) -> None:
+    """
+    Starts a detached compile server and waits for its socket
+    """
+    import subprocess
+    subprocess.Popen(
+        [sys.executable, "-m", "emberc.server", "--socket", path],
+        cwd=os.path.dirname(PACKAGE), stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL, start_new_session=True,
+    )
+    deadline = time.monotonic() + CONNECT_TIMEOUT
+    while time.monotonic() < deadline:
+        if os.path.exists(path):
+            try:
+                request(path, {"command": "ping"})
+                return
+            except OSError:
+                pass
+        time.sleep(START_POLL)
+
+
+def run(argv: list[str], path: str | None = None) -> int:
+    """
+    Compiles through the server (starting or restarting it if needed) and
+    writes its output; falls back to compiling in this process if the
+    server cannot be reached; Returns the exit code
+    """
+    path = path or default_socket()
+    message = {
+        "command": "compile", "version": compiler_version(),
+        "cwd": os.getcwd(), "argv": argv,
+    }
+    reply = _try_request(path, message)
+    if reply is None or reply["status"] != "ok":
+        # -No server, or one running older sources that is now shutting down
+        start_server(path)
+        reply = _try_request(path, message)
+    if reply is None or reply["status"] != "ok":
+        from .driver import main
+        return main(argv)
+    sys.stdout.write(reply["stdout"])
+    sys.stderr.write(reply["stderr"])
+    return reply["code"]
+
+
+def _try_request(path: str, message: dict[str, Any]) -> dict[str, Any] | None:
+    try:
+        return request(path, message)
+    except (OSError, ValueError):
+        return None
+
+
+## Body
+if __name__ == "__main__":
+    sys.exit(run(sys.argv[1:]))
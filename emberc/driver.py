@@ -0,0 +1,193 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Driver                        ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import argparse
+import sys
+from pathlib import Path
+from typing import IO, Any
+
+from .frontend import Lexer, Parser
+from .middleware.nodes import NodeBase
+
+
+## Classes
+class DriverArgumentParser(argparse.ArgumentParser):
+    """
+    Ember Driver Argument Parser
+    - Writes usage, help and errors to the streams of one compile instead
+    of the process' so a compile server can run many at once
+    """
+
+    # -Constructor
+    def __init__(self, stdout: IO[str], stderr: IO[str], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.stdout: IO[str] = stdout
+        self.stderr: IO[str] = stderr
+
+    # -Instance Methods
+    def _print_message(self, message: str, file: IO[str] | None = None) -> None:
+        if message:
+            (self.stdout if file is sys.stdout else self.stderr).write(message)
+
+
+## Functions
+def build_arguments(stdout: IO[str], stderr: IO[str]) -> DriverArgumentParser:
+    arguments = DriverArgumentParser(
+        stdout, stderr, prog="emberc", description="Ember Compiler"
+    )
+    arguments.add_argument("file", nargs='?', type=Path)
+    arguments.add_argument(
+        "--passes", default="", help="comma separated middleware passes to run (e.g. inline,dce)"
+    )
+    arguments.add_argument(
+        "--time-passes", action="store_true", help="report wall/CPU time of every phase and pass"
+    )
+    arguments.add_argument(
+        "--stats", action="store_true",
+        help="report token/node counts (as parsed), peak memory and throughput; "
+             "memory tracing slows every phase down"
+    )
+    arguments.add_argument("--report-format", choices=("text", "json"), default="text")
+    arguments.add_argument(
+        "--profile-generate", type=Path, metavar="PROFILE",
+        help="run the compiled program counting loops, branches and calls into PROFILE"
+    )
+    arguments.add_argument(
+        "--profile-use", type=Path, metavar="PROFILE",
+        help="guide inline, unroll and branches passes with PROFILE"
+    )
+    arguments.add_argument(
+        "--cache-dir", type=Path, metavar="DIR",
+        help="reuse optimized functions from DIR, recompiling only what changed"
+    )
+    return arguments
+
+
+def main(
+    argv: list[str], stdout: IO[str] = sys.stdout, stderr: IO[str] = sys.stderr,
+    cwd: Path | None = None
+) -> int:
+    """
+    Runs the compiler command line; Returns the exit code
+    Relative files are looked up from cwd (the process' when None)
+    """
+    arguments = build_arguments(stdout, stderr)
+    try:
+        options = arguments.parse_args(argv)
+    except SystemExit as error:
+        return error.code if isinstance(error.code, int) else 1
+    if options.file is None:
+        print(f"No input file found. Usage: {arguments.prog} <file.ember>", file=stderr)
+        return 1
+    SRC: Path = _resolve(options.file, cwd)
+    if not SRC.exists():
+        print(f"'{options.file}' is not a valid file. Usage: {arguments.prog} <file.ember>",
+              file=stderr)
+        return 1
+    passes = [name for name in options.passes.split(',') if name]
+    profile = None
+    if options.profile_use is not None:
+        from .middleware.profile import Profile, ProfileError
+        try:
+            profile = Profile.load(_resolve(options.profile_use, cwd))
+        except (OSError, ProfileError) as error:
+            print(f"Could not read profile: {error}", file=stderr)
+            return 1
+    if passes:
+        from .backend import constant_evaluator
+        from .middleware.passes import PassManager, TypeCheckError
+        if unknown := [name for name in passes if name not in PassManager.PASSES]:
+            try:
+                arguments.error(f"unknown passes: {', '.join(unknown)} "
+                                f"(available: {', '.join(PassManager.PASSES)})")
+            except SystemExit as error:
+                return error.code if isinstance(error.code, int) else 2
+    if not (options.time_passes or options.stats):
+        lexer = Lexer(SRC)
+        parser = Parser(lexer.lex())
+        ast = parser.parse()
+        if passes:
+            try:
+                if options.cache_dir is not None:
+                    from .cache import FunctionCache
+                    FunctionCache(_resolve(options.cache_dir, cwd)).compile(ast, passes, profile)
+                else:
+                    PassManager(ast, passes, profile, constant_evaluator).run()
+            except TypeCheckError as error:
+                print(error, file=stderr)
+                return 1
+        for node in ast:
+            print(node, file=stdout)
+        return _profile_generate(ast, options.profile_generate, stderr, cwd)
+    # -Instrumented compile: lexing is finished before parsing so each is timed alone
+    from .stats import CompileStatistics
+    statistics = CompileStatistics(trace_memory=options.stats)
+    lexer = Lexer(SRC)
+    with statistics.phase("lex"):
+        tokens = list(lexer.lex())
+    statistics.lines = lexer.row
+    with statistics.phase("parse"):
+        ast = Parser(iter(tokens)).parse()
+    if options.stats:
+        statistics.count_tokens(tokens)
+        statistics.count_nodes(ast)
+    if passes:
+        try:
+            if options.cache_dir is not None:
+                from .cache import FunctionCache
+                cache = FunctionCache(_resolve(options.cache_dir, cwd))
+                with statistics.phase("passes"):
+                    cache.compile(ast, passes, profile)
+                statistics.cache = (cache.hits, cache.misses)
+            else:
+                manager = PassManager(ast, passes, profile, constant_evaluator)
+                with statistics.phase("passes"):
+                    manager.run()
+                statistics.passes = manager.records
+        except TypeCheckError as error:
+            print(error, file=stderr)
+            return 1
+    with statistics.phase("print"):
+        for node in ast:
+            print(node, file=stdout)
+    statistics.finish()
+    if options.report_format == "json":
+        report = statistics.to_json(options.time_passes, options.stats)
+    else:
+        report = statistics.to_text(options.time_passes, options.stats)
+    print(report, file=stderr)
+    return _profile_generate(ast, options.profile_generate, stderr, cwd)
+
+
+def _profile_generate(
+    ast: list[NodeBase], path: Path | None, stderr: IO[str], cwd: Path | None
+) -> int:
+    '''
+    Runs the program profiling it into path if requested; Returns the exit code
+    '''
+    if path is None:
+        return 0
+    from .backend import InterpreterError, ProfilingInterpreter
+    interpreter = ProfilingInterpreter(ast)
+    try:
+        interpreter.run()
+    except InterpreterError as error:
+        print(f"Profiling run failed: {error}", file=stderr)
+        return 1
+    try:
+        interpreter.profile.save(_resolve(path, cwd))
+    except OSError as error:
+        print(f"Could not write profile: {error}", file=stderr)
+        return 1
+    return 0
+
+
+def _resolve(path: Path, cwd: Path | None) -> Path:
+    return path if cwd is None else cwd / path
@@ -5,11 +5,13 @@
 ##-------------------------------##
 
 ## Imports
+from .hooks import FrontendHook, SamplingProfiler
 from .lexer import Lexer
+from .ll1 import ParserLL1
 from .parser import Parser
 from .token import Token
 
 ## Constants
 __all__: tuple[str, ...] = (
-    "Token", "Lexer", "Parser",
+    "Token", "Lexer", "Parser", "ParserLL1", "FrontendHook", "SamplingProfiler",
 )
@@ -0,0 +1,514 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Frontend      ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Grammar (LL(1) Generator)     ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import argparse
+import re
+import sys
+from pathlib import Path
+
+from .lexer import SYMBOL_LUT, WORD_LUT
+from .token import Token
+
+## Constants
+Type_Symbol = Token.Type | str
+Type_Table = dict[str, dict[Token.Type | None, int]]
+ROOT: Path = Path(__file__).parent.parent.parent
+GRAMMAR: Path = ROOT / "docs" / "ember.ebnf"
+TABLES: Path = Path(__file__).parent / "tables.py"
+START: str = "program"
+# -Rules parsed by the precedence (shunting yard) parser instead of the table
+EXTERNAL: tuple[str, ...] = ("expression",)
+# -Rules whose optional parts are taken whenever they can start (`else`
+#  binds to the nearest `if`); other conflicts are errors
+GREEDY: tuple[str, ...] = ("conditional",)
+LITERAL_LUT: dict[str, Token.Type] = {**SYMBOL_LUT, **WORD_LUT}
+TOKEN_CLASS_LUT: dict[str, Token.Type] = {
+    "IDENTIFIER": Token.Type.Identifier,
+    "NUMBER": Token.Type.Number,
+}
+# -Production kinds: how the table parser builds a production's value
+#  rule: a named rule's alternative (its _build_<rule> method or its only value)
+#  collect: list of its values; unit: its only value; empty: None
+#  repeat: `X*` continuing, values appended to the list the first expansion started
+KINDS: tuple[str, ...] = ("rule", "collect", "unit", "empty", "repeat")
+EBNF_PATTERN = re.compile(r"\s*(?:(?P<name>[A-Za-z_]\w*)|`(?P<literal>[^`]+)`|(?P<op>[:;|()?*+]))")
+
+
+## Classes
+class GrammarError(Exception):
+    """
+    Ember Grammar Error
+    - Raised when an EBNF file is malformed, names unknown rules or
+    terminals or cannot be parsed with one token of lookahead
+    """
+    pass
+
+
+class Production:
+    """
+    Ember Grammar Production
+    - One BNF alternative of a nonterminal: rules are split on `|` and
+    groups, `?` and `*` become numbered nonterminals (rule.1, rule.2 ..)
+    so every EBNF item yields exactly one value to its rule
+    """
+
+    # -Constructor
+    def __init__(self, index: int, head: str, kind: str, symbols: tuple[Type_Symbol, ...]) -> None:
+        self.index: int = index
+        self.head: str = head
+        self.kind: str = kind
+        self.symbols: tuple[Type_Symbol, ...] = symbols
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"Production(index={self.index}, head={self.head}, kind={self.kind})"
+
+    def __str__(self) -> str:
+        body = ' '.join(_symbol_name(symbol) for symbol in self.symbols)
+        return f"{self.head} -> {body or 'ε'}"
+
+
+class Conflict:
+    """
+    Ember Grammar Conflict
+    - Two productions predicted on the same lookahead token
+    In GREEDY rules a production starting with the token is kept over
+    one deriving nothing (dangling else); any other conflict is unresolved
+    """
+
+    # -Constructor
+    def __init__(
+        self, head: str, terminal: Token.Type | None,
+        kept: Production, dropped: Production, resolved: bool
+    ) -> None:
+        self.head: str = head
+        self.terminal: Token.Type | None = terminal
+        self.kept: Production = kept
+        self.dropped: Production = dropped
+        self.resolved: bool = resolved
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"Conflict(head={self.head}, terminal={_symbol_name(self.terminal)})"
+
+    def __str__(self) -> str:
+        state = "resolved" if self.resolved else "unresolved"
+        return (f"{state} conflict in {self.head} on {_symbol_name(self.terminal)}: "
+                f"'{self.kept}' over '{self.dropped}'")
+
+
+class Grammar:
+    """
+    Ember LL(1) Grammar
+    - Reads an EBNF grammar (rules `name: items;` with `|`, groups, `?`,
+    `*`, `+`, `literal` terminals and IDENTIFIER/NUMBER token classes;
+    upper-case rules of literals such as TYPES are ordinary rules) and
+    computes nullable, FIRST and FOLLOW sets and the LL(1) parse table
+    Errors (unknown names, left recursion) raise GrammarError; conflicts
+    and unreachable rules are collected for the caller to report
+    """
+
+    # -Constructor
+    def __init__(self, text: str, start: str = START) -> None:
+        self.start: str = start
+        self.rules: dict[str, list[list[object]]] = _read_ebnf(text)
+        self.productions: list[Production] = []
+        self.alternatives: dict[str, list[Production]] = {}
+        self._counters: dict[str, int] = {}
+        if start not in self.rules:
+            raise GrammarError(f"start rule '{start}' is not defined")
+        for name, alternatives in self.rules.items():
+            for alternative in alternatives:
+                self._add(name, "rule", tuple(self._lower(name, item) for item in alternative))
+        self.nullable: set[str] = set()
+        self.first: dict[str, set[Token.Type]] = {name: set() for name in self.alternatives}
+        self.follow: dict[str, set[Token.Type | None]] = {name: set() for name in self.alternatives}
+        self._compute_first()
+        self._compute_follow()
+        self._check_left_recursion()
+        self.conflicts: list[Conflict] = []
+        self.table: Type_Table = self._build_table()
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"Grammar(rules={len(self.rules)}, productions={len(self.productions)}, "
+                f"conflicts={len(self.conflicts)})")
+
+    # -Instance Methods
+    def first_of(self, symbols: tuple[Type_Symbol, ...]) -> tuple[set[Token.Type], bool]:
+        '''
+        Returns the FIRST set of a symbol sequence and whether it derives nothing
+        '''
+        first: set[Token.Type] = set()
+        for symbol in symbols:
+            if isinstance(symbol, Token.Type):
+                first.add(symbol)
+                return (first, False)
+            first |= self.first[symbol]
+            if symbol not in self.nullable:
+                return (first, False)
+        return (first, True)
+
+    def reachable(self, through_external: bool = True) -> set[str]:
+        '''
+        Returns the nonterminals derivable from the start rule
+        (stopping at external rules unless through_external)
+        '''
+        found: set[str] = set()
+        stack = [self.start]
+        while stack:
+            name = stack.pop()
+            if name in found:
+                continue
+            found.add(name)
+            if not through_external and name in EXTERNAL:
+                continue
+            for production in self.alternatives[name]:
+                stack.extend(s for s in production.symbols if isinstance(s, str))
+        return found
+
+    def unreachable(self) -> list[str]:
+        reachable = self.reachable()
+        return [name for name in self.rules if name not in reachable]
+
+    def emit(self, source: str) -> str:
+        '''
+        Returns the Python module of the table parser's data: productions
+        and prediction table of the rules reachable from the start rule
+        without entering external (precedence parsed) rules
+        '''
+        names = self.reachable(through_external=False)
+        table_names = [name for name in self.alternatives if name in names and name not in EXTERNAL]
+        lines = [
+            "#!/usr/bin/python",
+            "##-------------------------------##",
+            "## Ember Compiler: Frontend      ##",
+            "## Written By: Ryan Smith        ##",
+            "##-------------------------------##",
+            "## Parse Tables (generated)      ##",
+            "##-------------------------------##",
+            f"# -Generated from {source} by `python -m emberc.frontend.grammar`; do not edit",
+            "",
+            "## Imports",
+            "from .token import Token",
+            "",
+            "## Constants",
+            f"START: str = {self.start!r}",
+            f"EXTERNAL: tuple[str, ...] = {EXTERNAL!r}",
+            "# -(head, kind, symbols)",
+            "PRODUCTIONS: tuple[tuple[str, str, tuple[Token.Type | str, ...]], ...] = (",
+        ]
+        for production in self.productions:
+            symbols = ', '.join(_symbol_code(symbol) for symbol in production.symbols)
+            if len(production.symbols) == 1:
+                symbols += ','
+            lines.append(f"    # -{production.index}: {production}")
+            lines.append(f"    ({production.head!r}, {production.kind!r}, ({symbols})),")
+        lines.append(")")
+        lines.append("# -head => lookahead token (None: end of input) => production")
+        lines.append("TABLE: dict[str, dict[Token.Type | None, int]] = {")
+        for name in table_names:
+            lines.append(f"    {name!r}: {{")
+            for terminal, index in sorted(self.table[name].items(), key=_entry_order):
+                lines.append(f"        {_symbol_code(terminal)}: {index},")
+            lines.append("    },")
+        lines.append("}")
+        return '\n'.join(lines) + '\n'
+
+    def report(self) -> str:
+        '''
+        Returns FIRST/FOLLOW sets, conflicts and unreachable rules as text
+        '''
+        lines = [f"{'rule':<28} {'nullable':<9} FIRST / FOLLOW"]
+        for name in self.alternatives:
+            first = ' '.join(sorted(_symbol_name(s) for s in self.first[name]))
+            follow = ' '.join(sorted(_symbol_name(s) for s in self.follow[name]))
+            lines.append(f"{name:<28} {str(name in self.nullable):<9} {{{first}}}")
+            lines.append(f"{'':<38} {{{follow}}}")
+        for conflict in self.conflicts:
+            lines.append(str(conflict))
+        for name in self.unreachable():
+            lines.append(f"unreachable rule: {name}")
+        return '\n'.join(lines)
+
+    # --Construction
+    def _add(self, head: str, kind: str, symbols: tuple[Type_Symbol, ...]) -> Production:
+        production = Production(len(self.productions), head, kind, symbols)
+        self.productions.append(production)
+        self.alternatives.setdefault(head, []).append(production)
+        return production
+
+    def _synthetic(self, rule: str) -> str:
+        self._counters[rule] = self._counters.get(rule, 0) + 1
+        name = f"{rule}.{self._counters[rule]}"
+        self.alternatives[name] = []
+        return name
+
+    def _lower(self, rule: str, item: object) -> Type_Symbol:
+        '''
+        Returns the BNF symbol standing for an EBNF item of a rule
+        adding the productions of groups and repetitions it needs
+        '''
+        match item:
+            case ("name", name):
+                if name in self.rules:
+                    return name
+                if name in TOKEN_CLASS_LUT:
+                    return TOKEN_CLASS_LUT[name]
+                raise GrammarError(f"rule '{rule}' uses undefined rule '{name}'")
+            case ("literal", text):
+                if text not in LITERAL_LUT:
+                    raise GrammarError(f"rule '{rule}' uses unknown terminal `{text}`")
+                return LITERAL_LUT[text]
+            case ("group", alternatives):
+                if len(alternatives) == 1 and len(alternatives[0]) == 1:
+                    return self._lower(rule, alternatives[0][0])
+                name = self._synthetic(rule)
+                for alternative in alternatives:
+                    symbols = tuple(self._lower(rule, part) for part in alternative)
+                    self._add(name, "unit" if len(symbols) == 1 else "collect", symbols)
+                return name
+            case ("?", inner):
+                symbol = self._lower(rule, inner)
+                name = self._synthetic(rule)
+                self._add(name, "unit", (symbol,))
+                self._add(name, "empty", ())
+                return name
+            case ("*", inner):
+                symbol = self._lower(rule, inner)
+                name = self._synthetic(rule)
+                self._add(name, "repeat", (symbol, name))
+                self._add(name, "collect", ())
+                return name
+            case ("+", inner):
+                return self._lower(rule, ("group", [[inner, ("*", inner)]]))
+        raise GrammarError(f"rule '{rule}' has a malformed item {item!r}")
+
+    # --Sets
+    def _compute_first(self) -> None:
+        changed = True
+        while changed:
+            changed = False
+            for production in self.productions:
+                first, nullable = self.first_of(production.symbols)
+                if not first <= self.first[production.head]:
+                    self.first[production.head] |= first
+                    changed = True
+                if nullable and production.head not in self.nullable:
+                    self.nullable.add(production.head)
+                    changed = True
+
+    def _compute_follow(self) -> None:
+        self.follow[self.start].add(None)
+        changed = True
+        while changed:
+            changed = False
+            for production in self.productions:
+                symbols = production.symbols
+                for position, symbol in enumerate(symbols):
+                    if not isinstance(symbol, str):
+                        continue
+                    first, nullable = self.first_of(symbols[position + 1:])
+                    follow: set[Token.Type | None] = set(first)
+                    if nullable:
+                        follow |= self.follow[production.head]
+                    if not follow <= self.follow[symbol]:
+                        self.follow[symbol] |= follow
+                        changed = True
+
+    def _check_left_recursion(self) -> None:
+        '''
+        Raises GrammarError if a rule can derive itself before any token
+        '''
+        leading: dict[str, set[str]] = {name: set() for name in self.alternatives}
+        for production in self.productions:
+            for symbol in production.symbols:
+                if isinstance(symbol, Token.Type):
+                    break
+                leading[production.head].add(symbol)
+                if symbol not in self.nullable:
+                    break
+        for name in self.alternatives:
+            seen: set[str] = set()
+            stack = list(leading[name])
+            while stack:
+                symbol = stack.pop()
+                if symbol == name:
+                    raise GrammarError(f"rule '{name}' is left recursive")
+                if symbol not in seen:
+                    seen.add(symbol)
+                    stack.extend(leading[symbol])
+
+    def _build_table(self) -> Type_Table:
+        table: Type_Table = {name: {} for name in self.alternatives}
+        for production in self.productions:
+            first, nullable = self.first_of(production.symbols)
+            row = table[production.head]
+            for terminal in first:
+                self._predict(row, production, terminal, True)
+            if nullable:
+                for terminal in self.follow[production.head]:
+                    self._predict(row, production, terminal, False)
+        return table
+
+    def _predict(
+        self, row: dict[Token.Type | None, int], production: Production,
+        terminal: Token.Type | None, starts: bool
+    ) -> None:
+        '''
+        Enters a production for a lookahead (starts: by FIRST, else by FOLLOW)
+        '''
+        if (index := row.get(terminal)) is None:
+            row[terminal] = production.index
+            return
+        existing = self.productions[index]
+        existing_starts = terminal in self.first_of(existing.symbols)[0]
+        greedy = production.head.split('.')[0] in GREEDY and starts != existing_starts
+        if starts and not existing_starts:
+            row[terminal] = production.index
+            self.conflicts.append(Conflict(production.head, terminal, production, existing, greedy))
+        else:
+            self.conflicts.append(Conflict(production.head, terminal, existing, production, greedy))
+
+
+## Functions
+def _read_ebnf(text: str) -> dict[str, list[list[object]]]:
+    '''
+    Parses EBNF text into rule name => alternatives => items where an item
+    is ("name", str), ("literal", str), ("group", alternatives) or
+    (operator, item) for `?`, `*` and `+`
+    '''
+    tokens: list[tuple[str, str]] = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = EBNF_PATTERN.match(text, position)
+        if match is None:
+            raise GrammarError(f"unexpected character {text[position:position + 1]!r} "
+                               f"at offset {position}")
+        kind = match.lastgroup
+        assert kind is not None
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    rules: dict[str, list[list[object]]] = {}
+    index = 0
+
+    def expect(kind: str, value: str | None = None) -> str:
+        nonlocal index
+        if index >= len(tokens) or tokens[index][0] != kind or (
+                value is not None and tokens[index][1] != value):
+            found = tokens[index][1] if index < len(tokens) else "end of grammar"
+            raise GrammarError(f"expected {value or kind} but found {found!r}")
+        index += 1
+        return tokens[index - 1][1]
+
+    def peek(value: str) -> bool:
+        return index < len(tokens) and tokens[index] == ("op", value)
+
+    def alternatives() -> list[list[object]]:
+        nonlocal index
+        result = [sequence()]
+        while peek('|'):
+            index += 1
+            result.append(sequence())
+        return result
+
+    def sequence() -> list[object]:
+        nonlocal index
+        items: list[object] = []
+        while index < len(tokens) and not (peek('|') or peek(')') or peek(';')):
+            kind, value = tokens[index]
+            index += 1
+            item: object
+            if kind == "op" and value == '(':
+                item = ("group", alternatives())
+                expect("op", ')')
+            elif kind in ("name", "literal"):
+                item = (kind, value)
+            else:
+                raise GrammarError(f"unexpected {value!r} in a rule")
+            while index < len(tokens) and tokens[index][0] == "op" and tokens[index][1] in "?*+":
+                item = (tokens[index][1], item)
+                index += 1
+            items.append(item)
+        return items
+
+    while index < len(tokens):
+        name = expect("name")
+        expect("op", ':')
+        if name in rules:
+            raise GrammarError(f"rule '{name}' is defined twice")
+        rules[name] = alternatives()
+        expect("op", ';')
+    return rules
+
+
+def _symbol_name(symbol: Token.Type | str | None) -> str:
+    if symbol is None:
+        return "$"
+    if isinstance(symbol, Token.Type):
+        return symbol.name
+    return symbol
+
+
+def _symbol_code(symbol: Token.Type | str | None) -> str:
+    if isinstance(symbol, Token.Type):
+        return f"Token.Type.{symbol.name}"
+    return repr(symbol)
+
+
+def _entry_order(entry: tuple[Token.Type | None, int]) -> int:
+    return entry[0].value if entry[0] is not None else 0
+
+
+def main(argv: list[str]) -> int:
+    '''
+    Generates (or with --check verifies) the table parser's module from
+    the EBNF grammar, reporting conflicts; Returns the exit code
+    '''
+    arguments = argparse.ArgumentParser(
+        prog="emberc.frontend.grammar", description="Ember LL(1) parse table generator"
+    )
+    arguments.add_argument("grammar", nargs='?', type=Path, default=GRAMMAR)
+    arguments.add_argument("--output", type=Path, default=TABLES)
+    arguments.add_argument("--check", action="store_true",
+                           help="fail if the output is not up to date instead of writing it")
+    arguments.add_argument("--sets", action="store_true", help="print FIRST/FOLLOW sets")
+    options = arguments.parse_args(argv)
+    try:
+        grammar = Grammar(options.grammar.read_text())
+    except (OSError, GrammarError) as error:
+        print(f"{options.grammar}: {error}", file=sys.stderr)
+        return 1
+    if options.sets:
+        print(grammar.report())
+    else:
+        for conflict in grammar.conflicts:
+            print(f"{options.grammar}: {conflict}", file=sys.stderr)
+        for name in grammar.unreachable():
+            print(f"{options.grammar}: unreachable rule: {name}", file=sys.stderr)
+    if any(not conflict.resolved for conflict in grammar.conflicts):
+        return 1
+    source = options.grammar.resolve()
+    if source.is_relative_to(ROOT):
+        source = source.relative_to(ROOT)
+    module = grammar.emit(source.as_posix())
+    if options.check:
+        if not options.output.exists() or options.output.read_text() != module:
+            print(f"{options.output} is out of date with {options.grammar}", file=sys.stderr)
+            return 1
+        return 0
+    options.output.write_text(module)
+    return 0
+
+
+## Body
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
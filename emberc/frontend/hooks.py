@@ -0,0 +1,142 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Frontend      ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Hooks                         ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import sys
+import threading
+import time
+from collections import Counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .token import Token
+    from ..middleware.nodes import NodeBase
+
+## Constants
+SAMPLE_INTERVAL: float = 0.0005
+
+
+## Classes
+class FrontendHook:
+    """
+    Ember Frontend Hook
+    - Receives events from a Lexer or Parser it is added to; every
+    event does nothing by default so subclasses override what they need
+    Rules are named after their parse function (`_parse_expression_binary`
+    => `expression_binary`) and nodes are reported as they are constructed
+    (children before their parent, desugared nodes included)
+    """
+
+    # -Instance Methods
+    def token(self, token: Token) -> None:
+        '''
+        Called for every token the lexer emits
+        '''
+        pass
+
+    def enter(self, rule: str) -> None:
+        '''
+        Called when the parser enters a grammar rule
+        '''
+        pass
+
+    def exit(self, rule: str, node: NodeBase | None) -> None:
+        '''
+        Called when the parser leaves a grammar rule with the node it built
+        (None if the rule built nothing or failed)
+        '''
+        pass
+
+    def node(self, node: NodeBase) -> None:
+        '''
+        Called for every node the parser constructs
+        '''
+        pass
+
+
+class SamplingProfiler(FrontendHook):
+    """
+    Ember Frontend Hook: Sampling Profiler
+    - Keeps the stack of active grammar rules and samples it from a
+    background thread every interval; a rule's self samples show where
+    time is spent and inclusive samples what it costs with its sub-rules
+    Lexing runs on demand inside rules so it is counted in the rule that
+    asked for the token
+
+    with SamplingProfiler() as profiler:
+        parser.add_hook(profiler); parser.parse()
+    """
+
+    # -Constructor
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        self.interval: float = interval
+        self.samples: int = 0
+        self.exclusive: Counter[str] = Counter()
+        self.inclusive: Counter[str] = Counter()
+        self._stack: list[str] = []
+        self._running: bool = False
+        self._thread: threading.Thread | None = None
+        self._switch_interval: float = sys.getswitchinterval()
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"SamplingProfiler(interval={self.interval}, samples={self.samples})"
+
+    def __enter__(self) -> SamplingProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.stop()
+
+    # -Instance Methods
+    def enter(self, rule: str) -> None:
+        self._stack.append(rule)
+
+    def exit(self, rule: str, node: NodeBase | None) -> None:
+        self._stack.pop()
+
+    def start(self) -> None:
+        '''
+        Starts sampling; the interpreter switches threads as often as the
+        sampling interval meanwhile so samples are not starved
+        '''
+        self._running = True
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        sys.setswitchinterval(self._switch_interval)
+
+    def report(self, limit: int | None = None) -> list[tuple[str, float, float]]:
+        '''
+        Returns (rule, self share, inclusive share) heaviest first
+        '''
+        if not self.samples:
+            return []
+        return [
+            (rule, count / self.samples, self.inclusive[rule] / self.samples)
+            for rule, count in self.exclusive.most_common(limit)
+        ]
+
+    def _sample(self) -> None:
+        while self._running:
+            time.sleep(self.interval)
+            stack = tuple(self._stack)
+            if not stack:
+                continue
+            self.samples += 1
+            self.exclusive[stack[-1]] += 1
+            self.inclusive.update(set(stack))
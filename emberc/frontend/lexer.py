@@ -7,14 +7,17 @@
 ##-------------------------------##
 
 ## Imports
+import io
 from collections.abc import Generator
 from pathlib import Path
 from typing import TextIO
 
+from .hooks import FrontendHook
 from .token import SYMBOL_COUNT, WORD_COUNT, Token
 
 ## Constants
 Type_TokenGenerator = Generator[Token, None, None]
+Type_Source = str | bytes | bytearray | memoryview
 SYMBOL_LUT: dict[str, Token.Type] = {
     # -Single-Char
     '(': Token.Type.SymbolLParen,
@@ -69,14 +72,19 @@ class Lexer:
     - Every internal lex function represents a state in the lexer
     Each state function controls its own flow and transitions as well
     as creating and returning a token from the given state
+    Input is read from file unless a source (text or UTF-8 bytes) is
+    given, in which case file only names it in token positions
     """
 
     # -Constructor
-    def __init__(self, file: Path | str) -> None:
+    def __init__(self, file: Path | str, source: Type_Source | None = None) -> None:
         if isinstance(file, str):
             file = Path(file)
+        if source is not None and not isinstance(source, str):
+            source = str(source, 'utf-8')
         # -Input data
         self.file: Path = file
+        self.source: str | None = source
         self.row: int = 1
         self.column: int = 0
         self.offset: int = 0
@@ -85,6 +93,8 @@ class Lexer:
         self._type: Token.Type | None = None
         self._token_position: tuple[int, int, int] | None = None
         self._buffer: str = ""
+        # -Instrumentation
+        self._hooks: list[FrontendHook] = []
 
     # -Dunder Methods
     def __repr__(self) -> str:
@@ -94,14 +104,42 @@ class Lexer:
         return f"Lexer[{self.file}:{self.row}:{self.column}]"
 
     # -Instance Methods
+    def add_hook(self, hook: FrontendHook) -> None:
+        '''
+        Registers a hook receiving every token lexed afterwards
+        '''
+        self._hooks.append(hook)
+
     # --Lexing
     def lex(self) -> Type_TokenGenerator:
         '''
         Returns a generator to get each token from the input file
+        Tokens only pass through hooks when any are registered
+        '''
+        if self._hooks:
+            return self._lex_hooked()
+        return self._lex()
+
+    def _lex_hooked(self) -> Type_TokenGenerator:
+        '''
+        Lexes reporting each token to the registered hooks
+        '''
+        hooks = self._hooks
+        for token in self._lex():
+            for hook in hooks:
+                hook.token(token)
+            yield token
+
+    def _lex(self) -> Type_TokenGenerator:
+        '''
+        Lexes the input file yielding each token
         Calls internal lexing functions to change states
         '''
         token: Token | None = None
-        self._fp = self.file.open('r')
+        if self.source is None:
+            self._fp = self.file.open('r')
+        else:
+            self._fp = io.StringIO(self.source)
         # -State[Default]
         while c := self._advance():
             # -State[Default->Number]
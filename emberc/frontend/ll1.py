@@ -0,0 +1,260 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Frontend      ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Parser (Table-Driven LL(1))   ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from collections.abc import Callable
+from typing import Any
+
+from .parser import LENGTH_LUT, TYPE_LUT, Parser, token_end
+from .tables import EXTERNAL, PRODUCTIONS, START, TABLE
+from .token import Token
+from ..middleware.nodes import (
+    NodeBase, NodeStatementBlock, NodeConditional, NodeLoop,
+    NodeFunctionDeclaration, NodeVarDeclaration,
+    NodeExpressionUnary, NodeLiteral,
+)
+
+## Constants
+Type_Action = Callable[["ParserLL1", list[Any]], Any]
+Type_Prediction = tuple[Type_Action | None, tuple[Any, ...]]
+Type_Rows = dict[str, dict[Token.Type | None, Type_Prediction]]
+
+
+## Functions
+def _collect(parser: ParserLL1, values: list[Any]) -> list[Any]:
+    return values
+
+
+def _empty(parser: ParserLL1, values: list[Any]) -> None:
+    return None
+
+
+def _compile(parser: type[ParserLL1], externals: dict[str, _External]) -> Type_Rows:
+    """
+    Resolves the generated tables into rows of (action, entries to push
+    reversed) with actions taken from the parser class
+    Predictions of rules that only pass another rule's value through
+    are replaced by that rule's prediction for the same token
+    """
+    repeats = {head: _Repeat(head) for head, kind, _ in PRODUCTIONS if kind == "repeat"}
+    predictions: dict[int, Type_Prediction] = {}
+    for index, (head, kind, symbols) in enumerate(PRODUCTIONS):
+        entries: list[Any] = []
+        for symbol in symbols:
+            if symbol in externals:
+                entries.append(externals[symbol])
+            elif kind == "repeat" and symbol == head:
+                entries.append(repeats[head])
+            else:
+                entries.append(symbol)
+        action: Type_Action | None
+        match kind:
+            case "rule":
+                action = getattr(parser, f"_build_{head}", None)
+                if action is None and len(symbols) != 1:
+                    action = _collect
+            case "collect" | "repeat":
+                action = _collect
+            case "empty":
+                action = _empty
+            case _:
+                action = None
+        predictions[index] = (action, tuple(reversed(entries)))
+    rows = {
+        head: {terminal: predictions[index] for terminal, index in row.items()}
+        for head, row in TABLE.items()
+    }
+    for row in rows.values():
+        for terminal, prediction in row.items():
+            while (prediction[0] is None and len(prediction[1]) == 1 and
+                   prediction[1][0].__class__ is str and terminal in rows[prediction[1][0]]):
+                prediction = rows[prediction[1][0]][terminal]
+            row[terminal] = prediction
+    return rows
+
+
+## Classes
+class _Repeat:
+    """
+    Ember Table Parser Repetition
+    - Stack entry continuing an `X*` whose list the first expansion started
+    """
+
+    # -Constructor
+    def __init__(self, head: str) -> None:
+        self.head: str = head
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"_Repeat(head={self.head})"
+
+
+class _External:
+    """
+    Ember Table Parser External Rule
+    - Stack entry calling the parser's _parse_<rule> (hooks included)
+    """
+
+    # -Constructor
+    def __init__(self, rule: str) -> None:
+        self.rule: str = rule
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"_External(rule={self.rule})"
+
+
+class ParserLL1(Parser):
+    """
+    Ember Language Table-Driven Parser
+    [Lookahead(1)]
+    - Statements are parsed by a predictive stack machine over the tables
+    generated from docs/ember.ebnf (frontend.grammar) instead of one
+    method call per rule; expressions go through the inherited shunting
+    yard parser
+    Every symbol of a production leaves one value (tokens, nodes, lists
+    of repeated items, None for absent optional items) which _build_<rule>
+    turns into the same nodes (and spans) Parser builds
+    Hooks see the expression rules only
+    """
+
+    # -Instance Methods
+    # --Parsing
+    def parse(self) -> list[NodeBase]:
+        '''
+        Returns an AST of the given input tokens
+        Runs the table machine from the grammar's start rule
+        '''
+        return self._run(START, ROWS)
+
+    def _run(self, start: str, rows: Type_Rows) -> Any:
+        '''
+        Parses a rule with the table machine; Returns its value
+        Stack entries: rule names (predicted on the next token), _Repeat,
+        (action, value stack base) markers building a finished production,
+        token types (matched) and _External rules (called)
+        '''
+        externals = {
+            entry: getattr(self, f"_parse_{rule}") for rule, entry in EXTERNALS.items()
+        }
+        stack: list[Any] = [start]
+        values: list[Any] = []
+        tokens = self._token_generator
+        while stack:
+            entry = stack.pop()
+            kind = entry.__class__
+            if kind is str or kind is _Repeat:
+                # -Peek (inlined)
+                token = self._buffer
+                if token is None:
+                    token = self._buffer = next(tokens, None)
+                head = entry if kind is str else entry.head
+                prediction = rows[head].get(token.type if token is not None else None)
+                # -TODO: Raise compiler error(Syntactical) if no rule starts with token
+                assert prediction is not None, f"unexpected {token} in {head}"
+                action, push = prediction
+                if kind is str and action is not None:
+                    stack.append((action, len(values)))
+                stack.extend(push)
+            elif kind is tuple:
+                action, base = entry
+                arguments = values[base:]
+                del values[base:]
+                values.append(action(self, arguments))
+            elif kind is Token.Type:
+                # -TODO: Raise compiler error(Syntactical) if type mismatch or end of stream
+                # -Advance (inlined)
+                token = self._buffer
+                if token is None:
+                    token = next(tokens, None)
+                else:
+                    self._buffer = None
+                assert token is not None and token.type is entry
+                self._start = start = token.position[2]
+                value = token.value
+                self._end = start + (len(value) if value is not None else LENGTH_LUT[entry])
+                values.append(token)
+            else:
+                values.append(externals[entry]())
+        assert len(values) == 1
+        return values.pop()
+
+    # --Actions
+    def _build_statement_expression(self, values: list[Any]) -> NodeBase:
+        return_token, node, _ = values
+        if return_token:
+            node = self._factory.unary(
+                return_token.file, return_token.position,
+                NodeExpressionUnary.Type.Return, node
+            )
+            self._span(node, return_token.offset)
+        return node
+
+    def _build_block(self, values: list[Any]) -> NodeBase:
+        return self._span(NodeStatementBlock(tuple(values[1])), values[0].offset)
+
+    def _build_conditional(self, values: list[Any]) -> NodeBase:
+        if_token, _, condition, _, true_block, false_branch = values
+        false_block = false_branch[1] if false_branch else None
+        return self._span(NodeConditional(condition, true_block, false_block), if_token.offset)
+
+    def _build_loop_for(self, values: list[Any]) -> NodeBase:
+        for_token, _, initializer, condition, cond_token, increment, _, body = values
+        start = for_token.offset
+        if condition is None:
+            condition = self._factory.literal(
+                cond_token.file, cond_token.position,
+                NodeLiteral.Type.Boolean, True
+            )
+            self._span(condition, cond_token.offset, token_end(cond_token))
+        # -De-sugared nodes
+        if increment:
+            body = self._span(NodeStatementBlock((body, increment)), start)
+        loop = self._span(NodeLoop(condition, body, False), start)
+        return self._span(NodeStatementBlock(
+            (initializer, loop) if initializer else (loop,)
+        ), start)
+
+    def _build_loop_for_init(self, values: list[Any]) -> NodeBase | None:
+        # -decl_var or expression? `;`: the initializer comes first either way
+        return values[0]
+
+    def _build_loop_while(self, values: list[Any]) -> NodeBase:
+        while_token, _, condition, _, body = values
+        return self._span(NodeLoop(condition, body, False), while_token.offset)
+
+    def _build_loop_do(self, values: list[Any]) -> NodeBase:
+        do_token, body, _, _, condition, _, _ = values
+        return self._span(NodeLoop(condition, body, True), do_token.offset)
+
+    def _build_decl_function(self, values: list[Any]) -> NodeBase:
+        fn_token, id_token, _, params, _, _, return_type, body = values
+        params = params or ()
+        return self._span(NodeFunctionDeclaration(
+            id_token.file, id_token.position, id_token.value,
+            tuple(_id.value for _, _id in params) or None, body,
+            tuple(TYPE_LUT.get(_type.type) for _type, _ in params) or None,
+            TYPE_LUT.get(return_type.type)
+        ), fn_token.offset)
+
+    def _build_decl_function_params(self, values: list[Any]) -> list[Any]:
+        first, rest = values
+        return [first, *(param for _, param in rest)]
+
+    def _build_decl_var(self, values: list[Any]) -> NodeBase:
+        _type, _id, initializer, _ = values
+        return self._span(NodeVarDeclaration(
+            _id.file, _id.position, _id.value,
+            initializer[1] if initializer else None, TYPE_LUT[_type.type]
+        ), _type.offset)
+
+
+## Body
+EXTERNALS: dict[str, _External] = {rule: _External(rule) for rule in EXTERNAL}
+ROWS: Type_Rows = _compile(ParserLL1, EXTERNALS)
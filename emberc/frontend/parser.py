@@ -9,14 +9,18 @@
 ## Imports
 from __future__ import annotations
 from pathlib import Path
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
+from .hooks import FrontendHook
+from .lexer import SYMBOL_LUT, WORD_LUT
 from .token import OPERATOR_COUNT, Token
 from ..middleware.nodes import (
     NodeBase, NodeStatementBlock, NodeConditional, NodeLoop,
     NodeFunctionDeclaration, NodeFunctionCall,
     NodeVarDeclaration, NodeVarAssignment,
-    NodeExpressionBinary, NodeExpressionUnary, NodeLiteral,
+    NodeExpressionBinary, NodeExpressionUnary, NodeLiteral, DataType,
+    NodeFactory,
 )
 
 if TYPE_CHECKING:
@@ -29,6 +33,8 @@ Type_OperatorStack = list[tuple[
     NodeExpressionBinary.Type,
     int
 ]]
+Type_Span = tuple[int, int]
+Type_Spanner = Callable[[NodeBase, int, int | None], NodeBase]
 LITERALS: tuple[Token.Type, ...] = (
     Token.Type.Identifier, Token.Type.Number,
 )
@@ -56,19 +62,47 @@ TYPES: tuple[Token.Type, ...] = (
     Token.Type.TypeUInt8, Token.Type.TypeUInt16,
     Token.Type.TypeUInt32, Token.Type.TypeUInt64,
 )
+# -Source length of tokens without a value (symbols and keywords)
+LENGTH_LUT: dict[Token.Type, int] = {
+    _type: len(text) for text, _type in (*SYMBOL_LUT.items(), *WORD_LUT.items())
+}
+TYPE_LUT: dict[Token.Type, DataType] = {
+    Token.Type.TypeVoid: DataType.Void,
+    Token.Type.TypeInt8: DataType.Int8,
+    Token.Type.TypeInt16: DataType.Int16,
+    Token.Type.TypeInt32: DataType.Int32,
+    Token.Type.TypeInt64: DataType.Int64,
+    Token.Type.TypeUInt8: DataType.UInt8,
+    Token.Type.TypeUInt16: DataType.UInt16,
+    Token.Type.TypeUInt32: DataType.UInt32,
+    Token.Type.TypeUInt64: DataType.UInt64,
+}
 
 
 ## Function
 def _build_node_expression_binary(
-    nodes: list[NodeBase], operators: Type_OperatorStack
+    nodes: list[NodeBase], spans: list[Type_Span],
+    operators: Type_OperatorStack, factory: NodeFactory
 ) -> NodeExpressionBinary:
     """
     Builds and returns a NodeExpressionBinary from a node stack and an operator stack
+    The operands' source spans (kept on a parallel stack) are merged into its span
     """
     rhs = nodes.pop()
     lhs = nodes.pop()
+    end = spans.pop()[1]
+    start = spans.pop()[0]
+    spans.append((start, end))
     operator = operators.pop()
-    return NodeExpressionBinary(operator[0], operator[1], operator[2], lhs, rhs)
+    return factory.binary(operator[0], operator[1], operator[2], lhs, rhs)
+
+
+def token_end(token: Token) -> int:
+    """
+    Returns the offset just past a token's source text
+    """
+    length = len(token.value) if token.value is not None else LENGTH_LUT[token.type]
+    return token.position[2] + length
 
 
 ## Classes
@@ -79,14 +113,75 @@ class Parser:
     - Every internal parse function represents a grammar rule
     in the language and handles returning a node from the given rule
     Hybrid recursive-descent + shunting yard algorithim for parsing expressions
+    Expression nodes are built through a node factory (optionally hash-consed)
+    Every node built gets the source span of the tokens it was parsed from
+    (de-sugared nodes that of their statement); shared nodes keep their first
+    Rules are only wrapped to report to hooks once a hook is added
     """
 
     # -Constructor
-    def __init__(self, token_generator: Type_TokenGenerator) -> None:
+    def __init__(
+        self, token_generator: Type_TokenGenerator, factory: NodeFactory | None = None
+    ) -> None:
         self._token_generator: Type_TokenGenerator = token_generator
         self._buffer: Token | None = None
+        self._factory: NodeFactory = factory if factory is not None else NodeFactory()
+        # -Span of the last consumed token and nodes given a span so far
+        #  (in the order they were finished) for building a SpanIndex
+        self._start: int = 0
+        self._end: int = 0
+        self.spanned: list[NodeBase] = []
+        # -Instrumentation
+        self._hooks: list[FrontendHook] = []
 
     # -Instance Methods
+    def add_hook(self, hook: FrontendHook) -> None:
+        '''
+        Registers a hook receiving rule and node events from now on
+        The first hook swaps every rule and the span helper (which every
+        constructed node passes through) for reporting wrappers
+        '''
+        if not self._hooks:
+            for name in RULES:
+                setattr(self, name, self._hook_rule(name[len("_parse_"):], getattr(self, name)))
+            setattr(self, "_span", self._hook_span(self._span))
+        self._hooks.append(hook)
+
+    def _hook_rule(self, rule: str, function: Callable[[], Any]) -> Callable[[], Any]:
+        '''
+        Wraps a bound rule function to report entering and leaving it
+        '''
+        hooks = self._hooks
+
+        def hooked() -> Any:
+            for hook in hooks:
+                hook.enter(rule)
+            node = None
+            try:
+                node = function()
+                return node
+            finally:
+                for hook in hooks:
+                    hook.exit(rule, node)
+        return hooked
+
+    def _hook_span(self, function: Type_Spanner) -> Type_Spanner:
+        '''
+        Wraps the bound span helper to report every node given its first
+        span: each node once as it is constructed, shared nodes only the
+        first time the factory hands them out
+        '''
+        hooks = self._hooks
+
+        def hooked(node: NodeBase, start: int, end: int | None = None) -> NodeBase:
+            if node.span is not None:
+                return node
+            function(node, start, end)
+            for hook in hooks:
+                hook.node(node)
+            return node
+        return hooked
+
     # --Parsing
     def parse(self) -> list[NodeBase]:
         '''
@@ -130,10 +225,11 @@ class Parser:
         self._expect(Token.Type.SymbolSemicolon)
         # -Rule: return(finialize)
         if return_token:
-            node = NodeExpressionUnary(
+            node = self._factory.unary(
                 return_token.file, return_token.position,
                 NodeExpressionUnary.Type.Return, node
             )
+            self._span(node, return_token.offset)
         return node
 
     def _parse_conditional(self) -> NodeBase:
@@ -141,6 +237,7 @@ class Parser:
         Grammar[Conditional]
         `if` `(` expression `)` statement (`else` statement)?;
         '''
+        start = self._start
         self._expect(Token.Type.SymbolLParen)
         condition = self._parse_expression()
         self._expect(Token.Type.SymbolRParen)
@@ -148,13 +245,14 @@ class Parser:
         false_block: NodeBase | None = None
         if self._consume(Token.Type.KeywordElse, False):
             false_block = self._parse_statement()
-        return NodeConditional(condition, true_block, false_block)
+        return self._span(NodeConditional(condition, true_block, false_block), start)
 
     def _parse_loop_for(self) -> NodeBase:
         '''
         Grammar[Loop::For]
         `for` `(` (declaration | expression)? `;` expression? `;` expression? `)` statement;
         '''
+        start = self._start
         self._expect(Token.Type.SymbolLParen)
         # -Initializer
         initializer: NodeBase | None = None
@@ -170,10 +268,11 @@ class Parser:
             self._expect(Token.Type.SymbolSemicolon)
         else:
             assert cond_token is not None
-            condition = NodeLiteral(
+            condition = self._factory.literal(
                 cond_token.file, cond_token.position,
                 NodeLiteral.Type.Boolean, True
             )
+            self._span(condition, cond_token.offset)
         # -Increment
         increment: NodeBase | None = None
         if not self._consume(Token.Type.SymbolRParen):
@@ -183,35 +282,37 @@ class Parser:
         body: NodeBase = self._parse_statement()
         # -De-sugared nodes
         if increment:
-            body = NodeStatementBlock((body, increment))
-        loop = NodeLoop(condition, body, False)
-        return NodeStatementBlock(
+            body = self._span(NodeStatementBlock((body, increment)), start)
+        loop = self._span(NodeLoop(condition, body, False), start)
+        return self._span(NodeStatementBlock(
             (initializer, loop) if initializer else (loop,)
-        )
+        ), start)
 
     def _parse_loop_while(self) -> NodeBase:
         '''
         Grammar[Loop::While]
         `while` `(` expression `)` statement;
         '''
+        start = self._start
         self._expect(Token.Type.SymbolLParen)
         condition = self._parse_expression()
         self._expect(Token.Type.SymbolRParen)
         body: NodeBase = self._parse_statement()
-        return NodeLoop(condition, body, False)
+        return self._span(NodeLoop(condition, body, False), start)
 
     def _parse_loop_do(self) -> NodeBase:
         '''
         Grammar[Loop::Do..While]
         `do` statement `while` `(` expression `)` `;`;
         '''
+        start = self._start
         body = self._parse_statement()
         self._expect(Token.Type.KeywordWhile)
         self._expect(Token.Type.SymbolLParen)
         condition = self._parse_expression()
         self._expect(Token.Type.SymbolRParen)
         self._expect(Token.Type.SymbolSemicolon)
-        return NodeLoop(condition, body, True)
+        return self._span(NodeLoop(condition, body, True), start)
 
     def _parse_declaration(self) -> NodeBase | None:
         '''
@@ -230,6 +331,7 @@ class Parser:
         param: TYPES IDENTIFIER (`,` param)*;
         TYPES: IDENTIFIER | `void` | `int32`;
         '''
+        start = self._start
         # -Id
         id_token = self._next()
         assert (id_token.type is Token.Type.Identifier and
@@ -237,6 +339,7 @@ class Parser:
         # -Parameters
         self._expect(Token.Type.SymbolLParen)
         params: list[str] = []
+        param_types: list[DataType | None] = []
         while token := self._peek():
             if token.type is Token.Type.SymbolRParen:
                 break
@@ -247,6 +350,7 @@ class Parser:
             assert (param_id_token.type is Token.Type.Identifier and
                     param_id_token.value is not None)
             params.append(param_id_token.value)
+            param_types.append(TYPE_LUT.get(param_type_token.type))
         self._expect(Token.Type.SymbolRParen)
         # -Return
         self._expect(Token.Type.SymbolColon)
@@ -255,10 +359,11 @@ class Parser:
         self._expect(Token.Type.SymbolLBracket)
         body = self._parse_statement_block()
         parameters = tuple(params) if params else None
-        return NodeFunctionDeclaration(
+        return self._span(NodeFunctionDeclaration(
             id_token.file, id_token.position,
-            id_token.value, parameters, body
-        )
+            id_token.value, parameters, body,
+            tuple(param_types) if param_types else None, TYPE_LUT.get(return_type.type)
+        ), start)
 
     def _parse_declaration_variable(self) -> NodeBase | None:
         '''
@@ -275,34 +380,38 @@ class Parser:
         initializer: NodeBase | None = None
         if self._consume(Token.Type.SymbolEq):
             initializer = self._parse_expression()
-        node = NodeVarDeclaration(_id.file, _id.position, _id.value, initializer)
+        node = NodeVarDeclaration(
+            _id.file, _id.position, _id.value, initializer, TYPE_LUT[_type.type]
+        )
         self._expect(Token.Type.SymbolSemicolon)
-        return node
+        return self._span(node, _type.offset)
 
     def _parse_statement_block(self) -> NodeBase:
         '''
         Grammar[Statement::Block]
         `{` statement* `}`
         '''
+        start = self._start
         body: list[NodeBase] = []
         while token := self._peek():
             if token.type is Token.Type.SymbolRBracket:
                 break
             body.append(self._parse_statement())
         self._consume(Token.Type.SymbolRBracket)
-        return NodeStatementBlock(tuple(body))
+        return self._span(NodeStatementBlock(tuple(body)), start)
 
     def _parse_expression(self) -> NodeBase:
         '''
         Grammar[Expression]
         (IDENTIFIER `=`)? expression_binary;
         '''
+        start = self._offset()
         # -Rule: expression_binary
         node = self._parse_expression_binary()
         # -Rule: assignment
         if self._consume(Token.Type.SymbolEq):
             value = self._parse_expression()
-            node = NodeVarAssignment(node, value)
+            node = self._span(NodeVarAssignment(node, value), start)
         return node
 
     def _parse_expression_binary(self) -> NodeBase:
@@ -312,7 +421,9 @@ class Parser:
 
         OPERATOR_BINARY: `+` | `-` | `*` | `/` | `%` | `<` | `>` | `<=` | `>=` | `==` | `!=`;
         '''
+        start = self._offset()
         node_stack: list[NodeBase] = [self._parse_expression_unary()]
+        span_stack: list[Type_Span] = [(start, self._end)]
         operator_stack: Type_OperatorStack = []
         # -Rule: <operator> primary
         while self._matches(*OPERATOR_BINARY_LUT.keys()):
@@ -320,16 +431,22 @@ class Parser:
             operator = OPERATOR_BINARY_LUT[operator_token.type]
             # -Handle precedence
             while operator_stack and operator[1] <= operator_stack[-1][3]:
-                node = _build_node_expression_binary(node_stack, operator_stack)
-                node_stack.append(node)
+                node = _build_node_expression_binary(
+                    node_stack, span_stack, operator_stack, self._factory
+                )
+                node_stack.append(self._span(node, *span_stack[-1]))
+            start = self._offset()
             node_stack.append(self._parse_expression_unary())
+            span_stack.append((start, self._end))
             operator_stack.append((
                 operator_token.file, operator_token.position, *operator
             ))
         # -Flush operator stack
         while operator_stack:
-            node = _build_node_expression_binary(node_stack, operator_stack)
-            node_stack.append(node)
+            node = _build_node_expression_binary(
+                node_stack, span_stack, operator_stack, self._factory
+            )
+            node_stack.append(self._span(node, *span_stack[-1]))
         assert len(node_stack) == 1
         return node_stack.pop()
 
@@ -344,10 +461,11 @@ class Parser:
         if self._matches(*OPERATOR_UNARY_LUT.keys()):
             operator_token = self._next()
             operator = OPERATOR_UNARY_LUT[operator_token.type]
-            node = NodeExpressionUnary(
+            node = self._factory.unary(
                 operator_token.file, operator_token.position,
                 operator, self._parse_expression_unary()
             )
+            self._span(node, operator_token.offset)
         else:
             node = self._parse_expression_postfix()
         return node
@@ -359,6 +477,7 @@ class Parser:
 
         argument: expression (`,` argument)*;
         '''
+        start = self._offset()
         node = self._parse_primary()
         # -Rule: function call
         if self._consume(Token.Type.SymbolLParen):
@@ -372,7 +491,7 @@ class Parser:
                 args.append(self._parse_expression())
             self._expect(Token.Type.SymbolRParen)
             arguments = tuple(args) if args else None
-            node = NodeFunctionCall(node, arguments)
+            node = self._span(NodeFunctionCall(node, arguments), start)
         return node
 
     def _parse_primary(self) -> NodeBase:
@@ -402,7 +521,8 @@ class Parser:
                 case _:
                     # -TODO: Raise compiler error(syntactical) invalid primary parse
                     pass
-            node = NodeLiteral(literal.file, literal.position, _type, value)
+            node = self._factory.literal(literal.file, literal.position, _type, value)
+            self._span(node, self._start)
         return node
 
     # --Control
@@ -412,9 +532,15 @@ class Parser:
         tokens if applicable; Returns found token or None if end of stream
         '''
         if self._buffer is None:
-            return next(self._token_generator, None)
-        token = self._buffer
-        self._buffer = None
+            token = next(self._token_generator, None)
+        else:
+            token = self._buffer
+            self._buffer = None
+        if token is not None:
+            # -token_end (inlined): runs once per token
+            self._start = start = token.position[2]
+            value = token.value
+            self._end = start + (len(value) if value is not None else LENGTH_LUT[token.type])
         return token
 
     def _consume(self, _type: Token.Type, error_on_fail: bool = True) -> bool:
@@ -460,6 +586,16 @@ class Parser:
         assert token is not None
         return token
 
+    def _offset(self) -> int:
+        '''
+        Returns the offset of the next token (the end of input's at end of stream)
+        '''
+        # -Peek (inlined): runs before every operand
+        token = self._buffer
+        if token is None:
+            token = self._buffer = next(self._token_generator, None)
+        return token.position[2] if token is not None else self._end
+
     def _peek(self) -> Token | None:
         '''
         Gets next token in stream and buffers it
@@ -469,6 +605,18 @@ class Parser:
             self._buffer = next(self._token_generator, None)
         return self._buffer
 
+    def _span(self, node: NodeBase, start: int, end: int | None = None) -> NodeBase:
+        '''
+        Gives a node the span from start to end (the end of the last consumed
+        token by default) unless it has one (shared); Returns the node
+        '''
+        if node.span is None:
+            node.span = (start, end if end is not None else self._end)
+            self.spanned.append(node)
+        return node
+
 
 ## Body
+RULES: tuple[str, ...] = tuple(name for name in vars(Parser) if name.startswith("_parse_"))
 assert len(OPERATOR_BINARY_LUT) == OPERATOR_COUNT, "Not all token symbols handled in Parser.Operator LUT"
+assert len(TYPE_LUT) == len(TYPES), "Not all type tokens handled in Parser.Type LUT"
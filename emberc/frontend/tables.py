@@ -0,0 +1,489 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Frontend      ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Parse Tables (generated)      ##
+##-------------------------------##
+# -Generated from docs/ember.ebnf by `python -m emberc.frontend.grammar`; do not edit
+
+## Imports
+from .token import Token
+
+## Constants
+START: str = 'program'
+EXTERNAL: tuple[str, ...] = ('expression',)
+# -(head, kind, symbols)
+PRODUCTIONS: tuple[tuple[str, str, tuple[Token.Type | str, ...]], ...] = (
+    # -0: program.1 -> statement program.1
+    ('program.1', 'repeat', ('statement', 'program.1')),
+    # -1: program.1 -> ε
+    ('program.1', 'collect', ()),
+    # -2: program -> program.1
+    ('program', 'rule', ('program.1',)),
+    # -3: statement -> conditional
+    ('statement', 'rule', ('conditional',)),
+    # -4: statement -> loop
+    ('statement', 'rule', ('loop',)),
+    # -5: statement -> block
+    ('statement', 'rule', ('block',)),
+    # -6: statement -> declaration
+    ('statement', 'rule', ('declaration',)),
+    # -7: statement -> statement_expression
+    ('statement', 'rule', ('statement_expression',)),
+    # -8: statement_expression.1 -> KeywordReturn
+    ('statement_expression.1', 'unit', (Token.Type.KeywordReturn,)),
+    # -9: statement_expression.1 -> ε
+    ('statement_expression.1', 'empty', ()),
+    # -10: statement_expression -> statement_expression.1 expression SymbolSemicolon
+    ('statement_expression', 'rule', ('statement_expression.1', 'expression', Token.Type.SymbolSemicolon)),
+    # -11: block.1 -> statement block.1
+    ('block.1', 'repeat', ('statement', 'block.1')),
+    # -12: block.1 -> ε
+    ('block.1', 'collect', ()),
+    # -13: block -> SymbolLBracket block.1 SymbolRBracket
+    ('block', 'rule', (Token.Type.SymbolLBracket, 'block.1', Token.Type.SymbolRBracket)),
+    # -14: conditional.1 -> KeywordElse statement
+    ('conditional.1', 'collect', (Token.Type.KeywordElse, 'statement')),
+    # -15: conditional.2 -> conditional.1
+    ('conditional.2', 'unit', ('conditional.1',)),
+    # -16: conditional.2 -> ε
+    ('conditional.2', 'empty', ()),
+    # -17: conditional -> KeywordIf SymbolLParen expression SymbolRParen statement conditional.2
+    ('conditional', 'rule', (Token.Type.KeywordIf, Token.Type.SymbolLParen, 'expression', Token.Type.SymbolRParen, 'statement', 'conditional.2')),
+    # -18: loop -> loop_for
+    ('loop', 'rule', ('loop_for',)),
+    # -19: loop -> loop_while
+    ('loop', 'rule', ('loop_while',)),
+    # -20: loop -> loop_do
+    ('loop', 'rule', ('loop_do',)),
+    # -21: loop_for.1 -> expression
+    ('loop_for.1', 'unit', ('expression',)),
+    # -22: loop_for.1 -> ε
+    ('loop_for.1', 'empty', ()),
+    # -23: loop_for.2 -> expression
+    ('loop_for.2', 'unit', ('expression',)),
+    # -24: loop_for.2 -> ε
+    ('loop_for.2', 'empty', ()),
+    # -25: loop_for -> KeywordFor SymbolLParen loop_for_init loop_for.1 SymbolSemicolon loop_for.2 SymbolRParen statement
+    ('loop_for', 'rule', (Token.Type.KeywordFor, Token.Type.SymbolLParen, 'loop_for_init', 'loop_for.1', Token.Type.SymbolSemicolon, 'loop_for.2', Token.Type.SymbolRParen, 'statement')),
+    # -26: loop_for_init -> decl_var
+    ('loop_for_init', 'rule', ('decl_var',)),
+    # -27: loop_for_init.1 -> expression
+    ('loop_for_init.1', 'unit', ('expression',)),
+    # -28: loop_for_init.1 -> ε
+    ('loop_for_init.1', 'empty', ()),
+    # -29: loop_for_init -> loop_for_init.1 SymbolSemicolon
+    ('loop_for_init', 'rule', ('loop_for_init.1', Token.Type.SymbolSemicolon)),
+    # -30: loop_while -> KeywordWhile SymbolLParen expression SymbolRParen statement
+    ('loop_while', 'rule', (Token.Type.KeywordWhile, Token.Type.SymbolLParen, 'expression', Token.Type.SymbolRParen, 'statement')),
+    # -31: loop_do -> KeywordDo statement KeywordWhile SymbolLParen expression SymbolRParen SymbolSemicolon
+    ('loop_do', 'rule', (Token.Type.KeywordDo, 'statement', Token.Type.KeywordWhile, Token.Type.SymbolLParen, 'expression', Token.Type.SymbolRParen, Token.Type.SymbolSemicolon)),
+    # -32: declaration -> decl_function
+    ('declaration', 'rule', ('decl_function',)),
+    # -33: declaration -> decl_var
+    ('declaration', 'rule', ('decl_var',)),
+    # -34: decl_function.1 -> decl_function_params
+    ('decl_function.1', 'unit', ('decl_function_params',)),
+    # -35: decl_function.1 -> ε
+    ('decl_function.1', 'empty', ()),
+    # -36: decl_function -> KeywordFunction Identifier SymbolLParen decl_function.1 SymbolRParen SymbolColon TYPES block
+    ('decl_function', 'rule', (Token.Type.KeywordFunction, Token.Type.Identifier, Token.Type.SymbolLParen, 'decl_function.1', Token.Type.SymbolRParen, Token.Type.SymbolColon, 'TYPES', 'block')),
+    # -37: decl_function_params.1 -> SymbolComma decl_function_param
+    ('decl_function_params.1', 'collect', (Token.Type.SymbolComma, 'decl_function_param')),
+    # -38: decl_function_params.2 -> decl_function_params.1 decl_function_params.2
+    ('decl_function_params.2', 'repeat', ('decl_function_params.1', 'decl_function_params.2')),
+    # -39: decl_function_params.2 -> ε
+    ('decl_function_params.2', 'collect', ()),
+    # -40: decl_function_params -> decl_function_param decl_function_params.2
+    ('decl_function_params', 'rule', ('decl_function_param', 'decl_function_params.2')),
+    # -41: decl_function_param -> TYPES Identifier
+    ('decl_function_param', 'rule', ('TYPES', Token.Type.Identifier)),
+    # -42: decl_var.1 -> SymbolEq expression
+    ('decl_var.1', 'collect', (Token.Type.SymbolEq, 'expression')),
+    # -43: decl_var.2 -> decl_var.1
+    ('decl_var.2', 'unit', ('decl_var.1',)),
+    # -44: decl_var.2 -> ε
+    ('decl_var.2', 'empty', ()),
+    # -45: decl_var -> TYPES Identifier decl_var.2 SymbolSemicolon
+    ('decl_var', 'rule', ('TYPES', Token.Type.Identifier, 'decl_var.2', Token.Type.SymbolSemicolon)),
+    # -46: expression.1 -> SymbolEq expression
+    ('expression.1', 'collect', (Token.Type.SymbolEq, 'expression')),
+    # -47: expression.2 -> expression.1
+    ('expression.2', 'unit', ('expression.1',)),
+    # -48: expression.2 -> ε
+    ('expression.2', 'empty', ()),
+    # -49: expression -> expression_binary expression.2
+    ('expression', 'rule', ('expression_binary', 'expression.2')),
+    # -50: expression_binary.1 -> OPERATOR_BINARY expression_unary
+    ('expression_binary.1', 'collect', ('OPERATOR_BINARY', 'expression_unary')),
+    # -51: expression_binary.2 -> expression_binary.1 expression_binary.2
+    ('expression_binary.2', 'repeat', ('expression_binary.1', 'expression_binary.2')),
+    # -52: expression_binary.2 -> ε
+    ('expression_binary.2', 'collect', ()),
+    # -53: expression_binary -> expression_unary expression_binary.2
+    ('expression_binary', 'rule', ('expression_unary', 'expression_binary.2')),
+    # -54: expression_unary -> OPERATOR_UNARY expression_unary
+    ('expression_unary', 'rule', ('OPERATOR_UNARY', 'expression_unary')),
+    # -55: expression_unary -> expression_postfix
+    ('expression_unary', 'rule', ('expression_postfix',)),
+    # -56: expression_postfix.2 -> expr_postfix_arguments
+    ('expression_postfix.2', 'unit', ('expr_postfix_arguments',)),
+    # -57: expression_postfix.2 -> ε
+    ('expression_postfix.2', 'empty', ()),
+    # -58: expression_postfix.1 -> SymbolLParen expression_postfix.2 SymbolRParen
+    ('expression_postfix.1', 'collect', (Token.Type.SymbolLParen, 'expression_postfix.2', Token.Type.SymbolRParen)),
+    # -59: expression_postfix.3 -> expression_postfix.1
+    ('expression_postfix.3', 'unit', ('expression_postfix.1',)),
+    # -60: expression_postfix.3 -> ε
+    ('expression_postfix.3', 'empty', ()),
+    # -61: expression_postfix -> primary expression_postfix.3
+    ('expression_postfix', 'rule', ('primary', 'expression_postfix.3')),
+    # -62: expr_postfix_arguments.1 -> SymbolComma expression
+    ('expr_postfix_arguments.1', 'collect', (Token.Type.SymbolComma, 'expression')),
+    # -63: expr_postfix_arguments.2 -> expr_postfix_arguments.1 expr_postfix_arguments.2
+    ('expr_postfix_arguments.2', 'repeat', ('expr_postfix_arguments.1', 'expr_postfix_arguments.2')),
+    # -64: expr_postfix_arguments.2 -> ε
+    ('expr_postfix_arguments.2', 'collect', ()),
+    # -65: expr_postfix_arguments -> expression expr_postfix_arguments.2
+    ('expr_postfix_arguments', 'rule', ('expression', 'expr_postfix_arguments.2')),
+    # -66: primary -> Identifier
+    ('primary', 'rule', (Token.Type.Identifier,)),
+    # -67: primary -> Number
+    ('primary', 'rule', (Token.Type.Number,)),
+    # -68: primary -> SymbolLParen expression SymbolRParen
+    ('primary', 'rule', (Token.Type.SymbolLParen, 'expression', Token.Type.SymbolRParen)),
+    # -69: OPERATOR_BINARY -> SymbolPlus
+    ('OPERATOR_BINARY', 'rule', (Token.Type.SymbolPlus,)),
+    # -70: OPERATOR_BINARY -> SymbolMinus
+    ('OPERATOR_BINARY', 'rule', (Token.Type.SymbolMinus,)),
+    # -71: OPERATOR_BINARY -> SymbolAsterisk
+    ('OPERATOR_BINARY', 'rule', (Token.Type.SymbolAsterisk,)),
+    # -72: OPERATOR_BINARY -> SymbolFSlash
+    ('OPERATOR_BINARY', 'rule', (Token.Type.SymbolFSlash,)),
+    # -73: OPERATOR_BINARY -> SymbolPercent
+    ('OPERATOR_BINARY', 'rule', (Token.Type.SymbolPercent,)),
+    # -74: OPERATOR_BINARY -> SymbolLt
+    ('OPERATOR_BINARY', 'rule', (Token.Type.SymbolLt,)),
+    # -75: OPERATOR_BINARY -> SymbolGt
+    ('OPERATOR_BINARY', 'rule', (Token.Type.SymbolGt,)),
+    # -76: OPERATOR_BINARY -> SymbolLtEq
+    ('OPERATOR_BINARY', 'rule', (Token.Type.SymbolLtEq,)),
+    # -77: OPERATOR_BINARY -> SymbolGtEq
+    ('OPERATOR_BINARY', 'rule', (Token.Type.SymbolGtEq,)),
+    # -78: OPERATOR_BINARY -> SymbolEqEq
+    ('OPERATOR_BINARY', 'rule', (Token.Type.SymbolEqEq,)),
+    # -79: OPERATOR_BINARY -> SymbolBangEq
+    ('OPERATOR_BINARY', 'rule', (Token.Type.SymbolBangEq,)),
+    # -80: OPERATOR_UNARY -> SymbolBang
+    ('OPERATOR_UNARY', 'rule', (Token.Type.SymbolBang,)),
+    # -81: OPERATOR_UNARY -> SymbolMinus
+    ('OPERATOR_UNARY', 'rule', (Token.Type.SymbolMinus,)),
+    # -82: TYPES -> TypeVoid
+    ('TYPES', 'rule', (Token.Type.TypeVoid,)),
+    # -83: TYPES -> TypeInt8
+    ('TYPES', 'rule', (Token.Type.TypeInt8,)),
+    # -84: TYPES -> TypeInt16
+    ('TYPES', 'rule', (Token.Type.TypeInt16,)),
+    # -85: TYPES -> TypeInt32
+    ('TYPES', 'rule', (Token.Type.TypeInt32,)),
+    # -86: TYPES -> TypeInt64
+    ('TYPES', 'rule', (Token.Type.TypeInt64,)),
+    # -87: TYPES -> TypeUInt8
+    ('TYPES', 'rule', (Token.Type.TypeUInt8,)),
+    # -88: TYPES -> TypeUInt16
+    ('TYPES', 'rule', (Token.Type.TypeUInt16,)),
+    # -89: TYPES -> TypeUInt32
+    ('TYPES', 'rule', (Token.Type.TypeUInt32,)),
+    # -90: TYPES -> TypeUInt64
+    ('TYPES', 'rule', (Token.Type.TypeUInt64,)),
+)
+# -head => lookahead token (None: end of input) => production
+TABLE: dict[str, dict[Token.Type | None, int]] = {
+    'program.1': {
+        None: 1,
+        Token.Type.KeywordIf: 0,
+        Token.Type.KeywordFor: 0,
+        Token.Type.KeywordWhile: 0,
+        Token.Type.KeywordDo: 0,
+        Token.Type.KeywordFunction: 0,
+        Token.Type.KeywordReturn: 0,
+        Token.Type.TypeVoid: 0,
+        Token.Type.TypeInt8: 0,
+        Token.Type.TypeInt16: 0,
+        Token.Type.TypeInt32: 0,
+        Token.Type.TypeInt64: 0,
+        Token.Type.TypeUInt8: 0,
+        Token.Type.TypeUInt16: 0,
+        Token.Type.TypeUInt32: 0,
+        Token.Type.TypeUInt64: 0,
+        Token.Type.SymbolLParen: 0,
+        Token.Type.SymbolLBracket: 0,
+        Token.Type.SymbolBang: 0,
+        Token.Type.SymbolMinus: 0,
+        Token.Type.Identifier: 0,
+        Token.Type.Number: 0,
+    },
+    'program': {
+        None: 2,
+        Token.Type.KeywordIf: 2,
+        Token.Type.KeywordFor: 2,
+        Token.Type.KeywordWhile: 2,
+        Token.Type.KeywordDo: 2,
+        Token.Type.KeywordFunction: 2,
+        Token.Type.KeywordReturn: 2,
+        Token.Type.TypeVoid: 2,
+        Token.Type.TypeInt8: 2,
+        Token.Type.TypeInt16: 2,
+        Token.Type.TypeInt32: 2,
+        Token.Type.TypeInt64: 2,
+        Token.Type.TypeUInt8: 2,
+        Token.Type.TypeUInt16: 2,
+        Token.Type.TypeUInt32: 2,
+        Token.Type.TypeUInt64: 2,
+        Token.Type.SymbolLParen: 2,
+        Token.Type.SymbolLBracket: 2,
+        Token.Type.SymbolBang: 2,
+        Token.Type.SymbolMinus: 2,
+        Token.Type.Identifier: 2,
+        Token.Type.Number: 2,
+    },
+    'statement': {
+        Token.Type.KeywordIf: 3,
+        Token.Type.KeywordFor: 4,
+        Token.Type.KeywordWhile: 4,
+        Token.Type.KeywordDo: 4,
+        Token.Type.KeywordFunction: 6,
+        Token.Type.KeywordReturn: 7,
+        Token.Type.TypeVoid: 6,
+        Token.Type.TypeInt8: 6,
+        Token.Type.TypeInt16: 6,
+        Token.Type.TypeInt32: 6,
+        Token.Type.TypeInt64: 6,
+        Token.Type.TypeUInt8: 6,
+        Token.Type.TypeUInt16: 6,
+        Token.Type.TypeUInt32: 6,
+        Token.Type.TypeUInt64: 6,
+        Token.Type.SymbolLParen: 7,
+        Token.Type.SymbolLBracket: 5,
+        Token.Type.SymbolBang: 7,
+        Token.Type.SymbolMinus: 7,
+        Token.Type.Identifier: 7,
+        Token.Type.Number: 7,
+    },
+    'statement_expression.1': {
+        Token.Type.KeywordReturn: 8,
+        Token.Type.SymbolLParen: 9,
+        Token.Type.SymbolBang: 9,
+        Token.Type.SymbolMinus: 9,
+        Token.Type.Identifier: 9,
+        Token.Type.Number: 9,
+    },
+    'statement_expression': {
+        Token.Type.KeywordReturn: 10,
+        Token.Type.SymbolLParen: 10,
+        Token.Type.SymbolBang: 10,
+        Token.Type.SymbolMinus: 10,
+        Token.Type.Identifier: 10,
+        Token.Type.Number: 10,
+    },
+    'block.1': {
+        Token.Type.KeywordIf: 11,
+        Token.Type.KeywordFor: 11,
+        Token.Type.KeywordWhile: 11,
+        Token.Type.KeywordDo: 11,
+        Token.Type.KeywordFunction: 11,
+        Token.Type.KeywordReturn: 11,
+        Token.Type.TypeVoid: 11,
+        Token.Type.TypeInt8: 11,
+        Token.Type.TypeInt16: 11,
+        Token.Type.TypeInt32: 11,
+        Token.Type.TypeInt64: 11,
+        Token.Type.TypeUInt8: 11,
+        Token.Type.TypeUInt16: 11,
+        Token.Type.TypeUInt32: 11,
+        Token.Type.TypeUInt64: 11,
+        Token.Type.SymbolLParen: 11,
+        Token.Type.SymbolLBracket: 11,
+        Token.Type.SymbolRBracket: 12,
+        Token.Type.SymbolBang: 11,
+        Token.Type.SymbolMinus: 11,
+        Token.Type.Identifier: 11,
+        Token.Type.Number: 11,
+    },
+    'block': {
+        Token.Type.SymbolLBracket: 13,
+    },
+    'conditional.1': {
+        Token.Type.KeywordElse: 14,
+    },
+    'conditional.2': {
+        None: 16,
+        Token.Type.KeywordIf: 16,
+        Token.Type.KeywordElse: 15,
+        Token.Type.KeywordFor: 16,
+        Token.Type.KeywordWhile: 16,
+        Token.Type.KeywordDo: 16,
+        Token.Type.KeywordFunction: 16,
+        Token.Type.KeywordReturn: 16,
+        Token.Type.TypeVoid: 16,
+        Token.Type.TypeInt8: 16,
+        Token.Type.TypeInt16: 16,
+        Token.Type.TypeInt32: 16,
+        Token.Type.TypeInt64: 16,
+        Token.Type.TypeUInt8: 16,
+        Token.Type.TypeUInt16: 16,
+        Token.Type.TypeUInt32: 16,
+        Token.Type.TypeUInt64: 16,
+        Token.Type.SymbolLParen: 16,
+        Token.Type.SymbolLBracket: 16,
+        Token.Type.SymbolRBracket: 16,
+        Token.Type.SymbolBang: 16,
+        Token.Type.SymbolMinus: 16,
+        Token.Type.Identifier: 16,
+        Token.Type.Number: 16,
+    },
+    'conditional': {
+        Token.Type.KeywordIf: 17,
+    },
+    'loop': {
+        Token.Type.KeywordFor: 18,
+        Token.Type.KeywordWhile: 19,
+        Token.Type.KeywordDo: 20,
+    },
+    'loop_for.1': {
+        Token.Type.SymbolLParen: 21,
+        Token.Type.SymbolSemicolon: 22,
+        Token.Type.SymbolBang: 21,
+        Token.Type.SymbolMinus: 21,
+        Token.Type.Identifier: 21,
+        Token.Type.Number: 21,
+    },
+    'loop_for.2': {
+        Token.Type.SymbolLParen: 23,
+        Token.Type.SymbolRParen: 24,
+        Token.Type.SymbolBang: 23,
+        Token.Type.SymbolMinus: 23,
+        Token.Type.Identifier: 23,
+        Token.Type.Number: 23,
+    },
+    'loop_for': {
+        Token.Type.KeywordFor: 25,
+    },
+    'loop_for_init': {
+        Token.Type.TypeVoid: 26,
+        Token.Type.TypeInt8: 26,
+        Token.Type.TypeInt16: 26,
+        Token.Type.TypeInt32: 26,
+        Token.Type.TypeInt64: 26,
+        Token.Type.TypeUInt8: 26,
+        Token.Type.TypeUInt16: 26,
+        Token.Type.TypeUInt32: 26,
+        Token.Type.TypeUInt64: 26,
+        Token.Type.SymbolLParen: 29,
+        Token.Type.SymbolSemicolon: 29,
+        Token.Type.SymbolBang: 29,
+        Token.Type.SymbolMinus: 29,
+        Token.Type.Identifier: 29,
+        Token.Type.Number: 29,
+    },
+    'loop_for_init.1': {
+        Token.Type.SymbolLParen: 27,
+        Token.Type.SymbolSemicolon: 28,
+        Token.Type.SymbolBang: 27,
+        Token.Type.SymbolMinus: 27,
+        Token.Type.Identifier: 27,
+        Token.Type.Number: 27,
+    },
+    'loop_while': {
+        Token.Type.KeywordWhile: 30,
+    },
+    'loop_do': {
+        Token.Type.KeywordDo: 31,
+    },
+    'declaration': {
+        Token.Type.KeywordFunction: 32,
+        Token.Type.TypeVoid: 33,
+        Token.Type.TypeInt8: 33,
+        Token.Type.TypeInt16: 33,
+        Token.Type.TypeInt32: 33,
+        Token.Type.TypeInt64: 33,
+        Token.Type.TypeUInt8: 33,
+        Token.Type.TypeUInt16: 33,
+        Token.Type.TypeUInt32: 33,
+        Token.Type.TypeUInt64: 33,
+    },
+    'decl_function.1': {
+        Token.Type.TypeVoid: 34,
+        Token.Type.TypeInt8: 34,
+        Token.Type.TypeInt16: 34,
+        Token.Type.TypeInt32: 34,
+        Token.Type.TypeInt64: 34,
+        Token.Type.TypeUInt8: 34,
+        Token.Type.TypeUInt16: 34,
+        Token.Type.TypeUInt32: 34,
+        Token.Type.TypeUInt64: 34,
+        Token.Type.SymbolRParen: 35,
+    },
+    'decl_function': {
+        Token.Type.KeywordFunction: 36,
+    },
+    'decl_function_params.1': {
+        Token.Type.SymbolComma: 37,
+    },
+    'decl_function_params.2': {
+        Token.Type.SymbolRParen: 39,
+        Token.Type.SymbolComma: 38,
+    },
+    'decl_function_params': {
+        Token.Type.TypeVoid: 40,
+        Token.Type.TypeInt8: 40,
+        Token.Type.TypeInt16: 40,
+        Token.Type.TypeInt32: 40,
+        Token.Type.TypeInt64: 40,
+        Token.Type.TypeUInt8: 40,
+        Token.Type.TypeUInt16: 40,
+        Token.Type.TypeUInt32: 40,
+        Token.Type.TypeUInt64: 40,
+    },
+    'decl_function_param': {
+        Token.Type.TypeVoid: 41,
+        Token.Type.TypeInt8: 41,
+        Token.Type.TypeInt16: 41,
+        Token.Type.TypeInt32: 41,
+        Token.Type.TypeInt64: 41,
+        Token.Type.TypeUInt8: 41,
+        Token.Type.TypeUInt16: 41,
+        Token.Type.TypeUInt32: 41,
+        Token.Type.TypeUInt64: 41,
+    },
+    'decl_var.1': {
+        Token.Type.SymbolEq: 42,
+    },
+    'decl_var.2': {
+        Token.Type.SymbolSemicolon: 44,
+        Token.Type.SymbolEq: 43,
+    },
+    'decl_var': {
+        Token.Type.TypeVoid: 45,
+        Token.Type.TypeInt8: 45,
+        Token.Type.TypeInt16: 45,
+        Token.Type.TypeInt32: 45,
+        Token.Type.TypeInt64: 45,
+        Token.Type.TypeUInt8: 45,
+        Token.Type.TypeUInt16: 45,
+        Token.Type.TypeUInt32: 45,
+        Token.Type.TypeUInt64: 45,
+    },
+    'TYPES': {
+        Token.Type.TypeVoid: 82,
+        Token.Type.TypeInt8: 83,
+        Token.Type.TypeInt16: 84,
+        Token.Type.TypeInt32: 85,
+        Token.Type.TypeInt64: 86,
+        Token.Type.TypeUInt8: 87,
+        Token.Type.TypeUInt16: 88,
+        Token.Type.TypeUInt32: 89,
+        Token.Type.TypeUInt64: 90,
+    },
+}
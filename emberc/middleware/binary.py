@@ -0,0 +1,411 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Binary AST Format             ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import mmap
+import struct
+from enum import IntEnum, auto
+from pathlib import Path
+from typing import Any
+
+from .nodes import (
+    NodeBase, NodeStatementBlock, NodeConditional, NodeLoop,
+    NodeFunctionDeclaration, NodeFunctionCall,
+    NodeVarDeclaration, NodeVarAssignment,
+    NodeExpressionBinary, NodeExpressionUnary, NodeExpressionCast, NodeLiteral,
+    DataType,
+)
+from .nodes.base import NodeContextBase
+
+## Constants
+MAGIC: bytes = b"EMBA"
+VERSION: int = 3
+NONE: int = 0xFFFFFFFF
+NO_FILE: int = 0xFFFF
+# -magic, version, node/string/file/root/list counts,
+#  string/file/node/root/list section offsets
+HEADER: struct.Struct = struct.Struct("<4sHxx5I5I")
+# -kind, sub-type, flags, data type, file, row, column, offset, operands a-d,
+#  span start and end (NONE without a span)
+RECORD: struct.Struct = struct.Struct("<BBBBHxx3I4I2I")
+WORD: struct.Struct = struct.Struct("<I")
+FLAG_RUN_BEFORE_EVAL: int = 1 << 0
+FLAG_PARAMETER_TYPES: int = 1 << 1
+FLAG_TRUE: int = 1 << 2
+FLAG_INVERTED: int = 1 << 3
+
+
+## Classes
+class BinaryASTError(Exception):
+    """
+    Ember Binary AST Error
+    - Raised when a file is not a binary AST of a supported version
+    """
+    pass
+
+
+class Kind(IntEnum):
+    """
+    Ember Binary AST Record Kind
+    - Node class stored in a record
+    """
+    Block = auto()
+    Conditional = auto()
+    Loop = auto()
+    FunctionDeclaration = auto()
+    FunctionCall = auto()
+    VarDeclaration = auto()
+    VarAssignment = auto()
+    ExpressionBinary = auto()
+    ExpressionUnary = auto()
+    ExpressionCast = auto()
+    Literal = auto()
+
+
+class BinaryASTWriter:
+    """
+    Ember Binary AST Writer
+    - Serializes an AST into fixed-size node records (children first,
+    so a node's operands are record indices), a pool of interned strings
+    (identifiers, number literals, file paths), a file table and a list
+    section for variable-length operands (block statements, arguments,
+    parameters); shared subtrees (hash-consed DAGs) are written once
+    Only the syntax, data types and spans are kept: pass annotations are dropped
+    """
+
+    # -Constructor
+    def __init__(self, ast: list[NodeBase]) -> None:
+        self.ast: list[NodeBase] = ast
+        self._records: list[bytes] = []
+        self._indices: dict[int, int] = {}
+        self._strings: dict[str, int] = {}
+        self._files: dict[Path, int] = {}
+        self._file_strings: list[int] = []
+        self._lists: list[int] = []
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"BinaryASTWriter(nodes={len(self._records)}, strings={len(self._strings)})"
+
+    # -Instance Methods
+    def write(self, path: Path) -> int:
+        '''
+        Writes the AST to a file; Returns the number of bytes written
+        '''
+        roots = [self._node(node) for node in self.ast]
+        pool = [string.encode() for string in self._strings]
+        offsets: list[int] = [0]
+        for data in pool:
+            offsets.append(offsets[-1] + len(data))
+        strings = b''.join(WORD.pack(offset) for offset in offsets) + b''.join(pool)
+        sections = (
+            strings,
+            b''.join(WORD.pack(index) for index in self._file_strings),
+            b''.join(self._records),
+            b''.join(WORD.pack(index) for index in roots),
+            b''.join(WORD.pack(value) for value in self._lists),
+        )
+        position = HEADER.size
+        starts: list[int] = []
+        for section in sections:
+            starts.append(position)
+            position += len(section)
+        header = HEADER.pack(
+            MAGIC, VERSION, len(self._records), len(pool), len(self._files),
+            len(roots), len(self._lists), *starts
+        )
+        with path.open('wb') as fp:
+            fp.write(header)
+            for section in sections:
+                fp.write(section)
+        return position
+
+    def _string(self, string: str) -> int:
+        if (index := self._strings.get(string)) is None:
+            index = self._strings[string] = len(self._strings)
+        return index
+
+    def _list(self, values: list[int]) -> int:
+        start = len(self._lists)
+        self._lists.extend(values)
+        return start
+
+    def _node(self, node: NodeBase) -> int:
+        '''
+        Writes a node after its children; Returns its record index
+        '''
+        if (index := self._indices.get(id(node))) is not None:
+            return index
+        kind, subtype, flags = 0, 0, 0
+        a = b = c = d = NONE
+        if isinstance(node, NodeStatementBlock):
+            kind = Kind.Block
+            children = [self._node(child) for child in node.nodes]
+            a, b = self._list(children), len(children)
+        elif isinstance(node, NodeConditional):
+            kind = Kind.Conditional
+            a, b = self._node(node.condition), self._node(node.true_block)
+            if node.false_block is not None:
+                c = self._node(node.false_block)
+            flags = FLAG_INVERTED if node.inverted else 0
+        elif isinstance(node, NodeLoop):
+            kind = Kind.Loop
+            a, b = self._node(node.condition), self._node(node.body)
+            flags = FLAG_RUN_BEFORE_EVAL if node.run_before_eval else 0
+        elif isinstance(node, NodeFunctionDeclaration):
+            kind = Kind.FunctionDeclaration
+            a, b = self._string(node.id), self._node(node.body)
+            if node.parameters is not None:
+                values = [self._string(parameter) for parameter in node.parameters]
+                if node.parameter_types is not None:
+                    flags = FLAG_PARAMETER_TYPES
+                    values.extend(_type or 0 for _type in node.parameter_types)
+                c, d = self._list(values), len(node.parameters)
+        elif isinstance(node, NodeFunctionCall):
+            kind = Kind.FunctionCall
+            a = self._node(node.callee)
+            if node.arguments is not None:
+                arguments = [self._node(argument) for argument in node.arguments]
+                b, c = self._list(arguments), len(arguments)
+        elif isinstance(node, NodeVarDeclaration):
+            kind = Kind.VarDeclaration
+            a = self._string(node.id)
+            if node.initializer is not None:
+                b = self._node(node.initializer)
+        elif isinstance(node, NodeVarAssignment):
+            kind = Kind.VarAssignment
+            a, b = self._node(node.lvalue), self._node(node.rvalue)
+        elif isinstance(node, NodeExpressionBinary):
+            kind, subtype = Kind.ExpressionBinary, node.type
+            a, b = self._node(node.lhs), self._node(node.rhs)
+        elif isinstance(node, NodeExpressionUnary):
+            kind, subtype = Kind.ExpressionUnary, node.type
+            a = self._node(node.node)
+        elif isinstance(node, NodeExpressionCast):
+            kind = Kind.ExpressionCast
+            a = self._node(node.node)
+        elif isinstance(node, NodeLiteral):
+            kind, subtype = Kind.Literal, node.type
+            if node.type is NodeLiteral.Type.Boolean:
+                flags = FLAG_TRUE if node.value else 0
+            else:
+                a = self._string(str(node.value))
+        else:
+            raise NotImplementedError(f"Unhandled node '{type(node).__name__}'")
+        _file, position = NO_FILE, (0, 0, 0)
+        if isinstance(node, NodeContextBase):
+            if (_file := self._files.get(node.file)) is None:
+                _file = self._files[node.file] = len(self._files)
+                self._file_strings.append(self._string(str(node.file)))
+            position = node.position
+        data_type = (
+            node.return_type if isinstance(node, NodeFunctionDeclaration) else node.data_type
+        )
+        span = node.span if node.span is not None else (NONE, NONE)
+        self._records.append(RECORD.pack(
+            kind, subtype, flags, data_type or 0, _file, *position, a, b, c, d, *span
+        ))
+        index = self._indices[id(node)] = len(self._records) - 1
+        return index
+
+
+class BinaryAST:
+    """
+    Ember Binary AST Reader
+    - Maps a binary AST file into memory and only builds nodes when asked
+    for: a top-level statement or function materializes its subtree alone
+    and every built node is cached so shared subtrees stay shared
+    Top-level functions are indexed by name reading only their records
+    """
+
+    # -Constructor
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+        self._fp = path.open('rb')
+        self._map: mmap.mmap = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size or self._map[:4] != MAGIC:
+            self.close()
+            raise BinaryASTError(f"'{path}' is not an Ember binary AST")
+        header = HEADER.unpack_from(self._map, 0)
+        if header[1] != VERSION:
+            self.close()
+            raise BinaryASTError(
+                f"'{path}' is binary AST version {header[1]}, expected {VERSION}"
+            )
+        (self.node_count, self.string_count, self.file_count,
+         self.root_count, self.list_count) = header[2:7]
+        (self._string_offset, self._file_offset, self._node_offset,
+         self._root_offset, self._list_offset) = header[7:12]
+        self._string_data: int = self._string_offset + WORD.size * (self.string_count + 1)
+        self._nodes: dict[int, NodeBase] = {}
+        self._strings: dict[int, str] = {}
+        self._paths: dict[int, Path] = {}
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"BinaryAST(path={self.path}, nodes={self.node_count}, "
+                f"loaded={len(self._nodes)})")
+
+    def __enter__(self) -> BinaryAST:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.root_count
+
+    def __getitem__(self, index: int) -> NodeBase:
+        '''
+        Materializes the top-level statement at index
+        '''
+        if not 0 <= index < self.root_count:
+            raise IndexError(index)
+        return self.node(self._word(self._root_offset, index))
+
+    # -Instance Methods
+    def close(self) -> None:
+        self._map.close()
+        self._fp.close()
+
+    def load(self) -> list[NodeBase]:
+        '''
+        Materializes the whole AST
+        '''
+        return [self[index] for index in range(self.root_count)]
+
+    def functions(self) -> dict[str, int]:
+        '''
+        Returns the top-level function names and their statement index
+        '''
+        functions: dict[str, int] = {}
+        for index in range(self.root_count):
+            record = self._record(self._word(self._root_offset, index))
+            if record[0] == Kind.FunctionDeclaration:
+                functions[self.string(record[8])] = index
+        return functions
+
+    def function(self, _id: str) -> NodeFunctionDeclaration:
+        '''
+        Materializes only the named top-level function
+        '''
+        node = self[self.functions()[_id]]
+        assert isinstance(node, NodeFunctionDeclaration)
+        return node
+
+    def string(self, index: int) -> str:
+        if (string := self._strings.get(index)) is None:
+            start = self._word(self._string_offset, index)
+            end = self._word(self._string_offset, index + 1)
+            string = self._strings[index] = (
+                self._map[self._string_data + start:self._string_data + end].decode()
+            )
+        return string
+
+    def node(self, index: int) -> NodeBase:
+        '''
+        Materializes the node at a record index and its subtree
+        '''
+        if (node := self._nodes.get(index)) is not None:
+            return node
+        kind, subtype, flags, data_type, _file, row, column, offset, a, b, c, d, start, end = (
+            self._record(index)
+        )
+        position = (row, column, offset)
+        path = self._path(_file) if _file != NO_FILE else Path()
+        built: NodeBase
+        match kind:
+            case Kind.Block:
+                built = NodeStatementBlock(tuple(self.node(child) for child in self._list(a, b)))
+            case Kind.Conditional:
+                built = NodeConditional(
+                    self.node(a), self.node(b), self.node(c) if c != NONE else None
+                )
+                if flags & FLAG_INVERTED:
+                    built.inverted = True
+            case Kind.Loop:
+                built = NodeLoop(self.node(a), self.node(b), bool(flags & FLAG_RUN_BEFORE_EVAL))
+            case Kind.FunctionDeclaration:
+                parameters: tuple[str, ...] | None = None
+                types: tuple[DataType | None, ...] | None = None
+                if c != NONE:
+                    values = self._list(c, d * 2 if flags & FLAG_PARAMETER_TYPES else d)
+                    parameters = tuple(self.string(value) for value in values[:d])
+                    if flags & FLAG_PARAMETER_TYPES:
+                        types = tuple(DataType(value) if value else None for value in values[d:])
+                built = NodeFunctionDeclaration(
+                    path, position, self.string(a), parameters, self.node(b),
+                    types, DataType(data_type) if data_type else None
+                )
+            case Kind.FunctionCall:
+                arguments = (
+                    tuple(self.node(argument) for argument in self._list(b, c))
+                    if b != NONE else None
+                )
+                built = NodeFunctionCall(self.node(a), arguments)
+            case Kind.VarDeclaration:
+                built = NodeVarDeclaration(
+                    path, position, self.string(a), self.node(b) if b != NONE else None,
+                    DataType(data_type) if data_type else None
+                )
+            case Kind.VarAssignment:
+                built = NodeVarAssignment(self.node(a), self.node(b))
+            case Kind.ExpressionBinary:
+                built = NodeExpressionBinary(
+                    path, position, NodeExpressionBinary.Type(subtype), self.node(a), self.node(b)
+                )
+            case Kind.ExpressionUnary:
+                built = NodeExpressionUnary(
+                    path, position, NodeExpressionUnary.Type(subtype), self.node(a)
+                )
+            case Kind.ExpressionCast:
+                built = NodeExpressionCast(path, position, DataType(data_type), self.node(a))
+            case Kind.Literal:
+                _type = NodeLiteral.Type(subtype)
+                value: Any
+                if _type is NodeLiteral.Type.Boolean:
+                    value = bool(flags & FLAG_TRUE)
+                elif _type is NodeLiteral.Type.Number:
+                    value = int(self.string(a))
+                else:
+                    value = self.string(a)
+                built = NodeLiteral(path, position, _type, value)
+            case _:
+                raise BinaryASTError(f"Unknown record kind {kind} at node {index}")
+        if data_type and not isinstance(built, (NodeFunctionDeclaration, NodeVarDeclaration,
+                                                NodeExpressionCast)):
+            built.data_type = DataType(data_type)
+        if start != NONE:
+            built.span = (start, end)
+        self._nodes[index] = built
+        return built
+
+    def _word(self, section: int, index: int) -> int:
+        return WORD.unpack_from(self._map, section + index * WORD.size)[0]
+
+    def _list(self, start: int, count: int) -> list[int]:
+        return [self._word(self._list_offset, start + index) for index in range(count)]
+
+    def _record(self, index: int) -> tuple[int, ...]:
+        if not 0 <= index < self.node_count:
+            raise BinaryASTError(f"Node index {index} out of range")
+        return RECORD.unpack_from(self._map, self._node_offset + index * RECORD.size)
+
+    def _path(self, index: int) -> Path:
+        if (path := self._paths.get(index)) is None:
+            path = self._paths[index] = Path(self.string(self._word(self._file_offset, index)))
+        return path
+
+
+## Functions
+def dump(ast: list[NodeBase], path: Path) -> int:
+    """
+    Writes an AST as a binary AST file; Returns its size in bytes
+    """
+    return BinaryASTWriter(ast).write(path)
@@ -0,0 +1,126 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Structural Hashing            ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import hashlib
+import struct
+
+from .nodes import (
+    NodeBase, NodeStatementBlock, NodeConditional, NodeLoop,
+    NodeFunctionDeclaration, NodeFunctionCall,
+    NodeVarDeclaration, NodeVarAssignment,
+    NodeExpressionBinary, NodeExpressionUnary, NodeExpressionCast, NodeLiteral,
+)
+
+## Constants
+DIGEST_SIZE: int = 16
+TAG_LUT: dict[type, int] = {
+    NodeStatementBlock: 1,
+    NodeConditional: 2,
+    NodeLoop: 3,
+    NodeFunctionDeclaration: 4,
+    NodeFunctionCall: 5,
+    NodeVarDeclaration: 6,
+    NodeVarAssignment: 7,
+    NodeExpressionBinary: 8,
+    NodeExpressionUnary: 9,
+    NodeExpressionCast: 10,
+    NodeLiteral: 11,
+}
+
+
+## Functions
+def structural_hash(node: NodeBase, refresh: bool = False) -> bytes:
+    """
+    Returns a Merkle hash of a subtree: a node's digest covers its kind,
+    operator, names, values and declared types plus its children's digests
+    but not file or position, so moving code around keeps its hash
+    Digests are cached on nodes (NodeBase.merkle) and shared subtrees are
+    hashed once; refresh recomputes a subtree a pass has rewritten
+    """
+    if not refresh and node.merkle is not None:
+        return node.merkle
+    digest = hashlib.blake2b(_label(node), digest_size=DIGEST_SIZE)
+    for child in _children(node):
+        if child is None:
+            digest.update(b'\x00' * DIGEST_SIZE)
+        else:
+            digest.update(structural_hash(child, refresh))
+    node.merkle = digest.digest()
+    return node.merkle
+
+
+def clear_hashes(ast: list[NodeBase]) -> None:
+    """
+    Drops cached digests after passes rewrote an AST
+    """
+    stack: list[NodeBase | None] = list(ast)
+    while stack:
+        node = stack.pop()
+        if node is not None:
+            node.merkle = None
+            stack.extend(_children(node))
+
+
+def combine(*digests: bytes) -> bytes:
+    """
+    Returns one digest for an ordered sequence of digests
+    """
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    for part in digests:
+        digest.update(part)
+    return digest.digest()
+
+
+def _label(node: NodeBase) -> bytes:
+    '''
+    Encodes what identifies a node apart from its children
+    '''
+    fields: list[object] = [TAG_LUT[type(node)], node.data_type or 0]
+    match node:
+        case NodeLoop():
+            fields.append(node.run_before_eval)
+        case NodeFunctionDeclaration():
+            fields.extend((node.id, node.parameters, node.parameter_types, node.return_type))
+        case NodeFunctionCall():
+            fields.append(len(node.arguments or ()))
+        case NodeVarDeclaration():
+            fields.append(node.id)
+        case NodeExpressionBinary() | NodeExpressionUnary():
+            fields.append(node.type)
+        case NodeLiteral():
+            fields.extend((node.type, type(node.value).__name__, node.value))
+    data = repr(fields).encode()
+    return struct.pack("<I", len(data)) + data
+
+
+def _children(node: NodeBase) -> tuple[NodeBase | None, ...]:
+    '''
+    Returns a node's children in fixed slots (absent optional ones as None)
+    '''
+    match node:
+        case NodeStatementBlock():
+            return node.nodes
+        case NodeConditional():
+            return (node.condition, node.true_block, node.false_block)
+        case NodeLoop():
+            return (node.condition, node.body)
+        case NodeFunctionDeclaration():
+            return (node.body,)
+        case NodeFunctionCall():
+            return (node.callee, *(node.arguments or ()))
+        case NodeVarDeclaration():
+            return (node.initializer,)
+        case NodeVarAssignment():
+            return (node.lvalue, node.rvalue)
+        case NodeExpressionBinary():
+            return (node.lhs, node.rhs)
+        case NodeExpressionUnary() | NodeExpressionCast():
+            return (node.node,)
+    return ()
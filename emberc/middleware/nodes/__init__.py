@@ -9,7 +9,9 @@
 ## Imports
 from .base import NodeBase
 from .conditional import NodeConditional
-from .expression import NodeExpressionBinary, NodeExpressionUnary
+from .datatype import DataType
+from .expression import NodeExpressionBinary, NodeExpressionCast, NodeExpressionUnary
+from .factory import NodeFactory, NodeFactoryHashConsed
 from .function import NodeFunctionCall, NodeFunctionDeclaration
 from .literal import NodeLiteral
 from .loop import NodeLoop
@@ -21,5 +23,6 @@ __all__: tuple[str, ...] = (
     "NodeBase", "NodeStatementBlock", "NodeConditional", "NodeLoop",
     "NodeFunctionCall", "NodeFunctionDeclaration",
     "NodeVarAssignment", "NodeVarDeclaration",
-    "NodeExpressionBinary", "NodeExpressionUnary", "NodeLiteral",
+    "NodeExpressionBinary", "NodeExpressionUnary", "NodeExpressionCast", "NodeLiteral",
+    "DataType", "NodeFactory", "NodeFactoryHashConsed",
 )
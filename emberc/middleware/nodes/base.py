@@ -10,6 +10,10 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .datatype import DataType
 
 
 ## Classes
@@ -17,8 +21,16 @@ class NodeBase(ABC):
     """
     Ember Language AST Node: Base
     - Abstract node that all other AST nodes derive
+    Expression nodes are annotated with their data type by typed lowering
+    and the interval of values they can produce by value range analysis
+    and any node with its structural hash once one is asked for
+    Parsed nodes carry the span of source they came from: offsets counted
+    like positions' from the first to just past the last character
     """
-    pass
+    data_type: DataType | None = None
+    value_range: tuple[int, int] | None = None
+    merkle: bytes | None = None
+    span: tuple[int, int] | None = None
 
 
 class NodeContextBase(NodeBase):
@@ -17,7 +17,10 @@ class NodeConditional(NodeBase):
     """
     Ember Language AST Node: Conditional
     - Node that represents a conditional statement and its true/false blocks
+    Inverted is set when a pass swapped the arms and inverted the condition:
+    profiles are recorded in source orientation, so its counts read swapped
     """
+    inverted: bool = False
 
     # -Constructor
     def __init__(
@@ -0,0 +1,170 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Node: Data Types              ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import ctypes
+from enum import IntEnum, auto
+
+
+## Classes
+class DataType(IntEnum):
+    """
+    Ember Language Data Type
+    - Represents a declared or inferred value type; integer types are
+    fixed-width two's complement and map onto machine representations
+    (array typecode, ctypes type, NumPy dtype name) for unboxed engines
+    """
+    Void = auto()
+    Bool = auto()
+    Int8 = auto()
+    Int16 = auto()
+    Int32 = auto()
+    Int64 = auto()
+    UInt8 = auto()
+    UInt16 = auto()
+    UInt32 = auto()
+    UInt64 = auto()
+
+    # -Dunder Methods
+    def __str__(self) -> str:
+        return self.dtype
+
+    # -Instance Methods
+    def contains(self, low: int, high: int) -> bool:
+        '''
+        Checks if every value in [low, high] is representable
+        '''
+        return self.minimum <= low and high <= self.maximum
+
+    def wrap(self, value: int) -> int:
+        '''
+        Wraps a value into range as two's complement truncation would
+        '''
+        if self is DataType.Bool:
+            return int(bool(value))
+        value &= (1 << self.bits) - 1
+        if self.signed and value > self.maximum:
+            value -= 1 << self.bits
+        return value
+
+    # -Static Methods
+    @staticmethod
+    def fitting(value: int) -> DataType | None:
+        '''
+        Returns the type of an integer literal: int32 if it fits,
+        otherwise int64 then uint64; None if nothing holds it
+        '''
+        for _type in (DataType.Int32, DataType.Int64, DataType.UInt64):
+            if _type.contains(value, value):
+                return _type
+        return None
+
+    @staticmethod
+    def promote(lhs: DataType, rhs: DataType) -> DataType:
+        '''
+        Returns the common type of two integer operands; types narrower than
+        int32 (and booleans) are promoted to int32 first, then the wider type
+        wins or the unsigned one for equal widths
+        '''
+        if lhs.bits < 32:
+            lhs = DataType.Int32
+        if rhs.bits < 32:
+            rhs = DataType.Int32
+        if lhs.bits != rhs.bits:
+            return lhs if lhs.bits > rhs.bits else rhs
+        return lhs if not lhs.signed else rhs
+
+    # -Properties
+    @property
+    def bits(self) -> int:
+        match self:
+            case DataType.Void:
+                return 0
+            case DataType.Bool:
+                return 1
+            case DataType.Int8 | DataType.UInt8:
+                return 8
+            case DataType.Int16 | DataType.UInt16:
+                return 16
+            case DataType.Int32 | DataType.UInt32:
+                return 32
+            case DataType.Int64 | DataType.UInt64:
+                return 64
+        raise NotImplementedError(f"Unhandled type '{self.name}'")
+
+    @property
+    def signed(self) -> bool:
+        return self in (DataType.Int8, DataType.Int16, DataType.Int32, DataType.Int64)
+
+    @property
+    def minimum(self) -> int:
+        return -(1 << (self.bits - 1)) if self.signed else 0
+
+    @property
+    def maximum(self) -> int:
+        if self is DataType.Void:
+            return 0
+        return (1 << (self.bits - 1)) - 1 if self.signed else (1 << self.bits) - 1
+
+    @property
+    def array_code(self) -> str:
+        '''
+        Typecode for the array module
+        '''
+        match self:
+            case DataType.Bool | DataType.UInt8:
+                return 'B'
+            case DataType.Int8:
+                return 'b'
+            case DataType.Int16:
+                return 'h'
+            case DataType.UInt16:
+                return 'H'
+            case DataType.Int32:
+                return 'i'
+            case DataType.UInt32:
+                return 'I'
+            case DataType.Int64:
+                return 'q'
+            case DataType.UInt64:
+                return 'Q'
+        raise NotImplementedError(f"Type '{self.name}' has no array typecode")
+
+    @property
+    def ctype(self) -> type:
+        '''
+        Matching ctypes type
+        '''
+        match self:
+            case DataType.Bool:
+                return ctypes.c_bool
+            case DataType.Int8:
+                return ctypes.c_int8
+            case DataType.Int16:
+                return ctypes.c_int16
+            case DataType.Int32:
+                return ctypes.c_int32
+            case DataType.Int64:
+                return ctypes.c_int64
+            case DataType.UInt8:
+                return ctypes.c_uint8
+            case DataType.UInt16:
+                return ctypes.c_uint16
+            case DataType.UInt32:
+                return ctypes.c_uint32
+            case DataType.UInt64:
+                return ctypes.c_uint64
+        raise NotImplementedError(f"Type '{self.name}' has no ctypes type")
+
+    @property
+    def dtype(self) -> str:
+        '''
+        NumPy dtype name (also the Ember keyword for integer types)
+        '''
+        return self.name.lower()
@@ -12,6 +12,7 @@ from enum import IntEnum, auto
 from pathlib import Path
 
 from .base import NodeBase, NodeContextBase
+from .datatype import DataType
 
 
 ## Classes
@@ -127,3 +128,28 @@ class NodeExpressionUnary(NodeContextBase):
         Not = auto()
         Negate = auto()
         Return = auto()
+
+
+class NodeExpressionCast(NodeContextBase):
+    """
+    Ember Language AST Node: Expression Cast
+    - Node that represents an explicit wrap/truncate of it's node's value
+    into the range of a fixed-width data type
+    """
+
+    # -Constructor
+    def __init__(
+        self, file: Path, position: tuple[int, int, int],
+        data_type: DataType, node: NodeBase
+    ) -> None:
+        super().__init__(file, position)
+        self.data_type: DataType = data_type
+        self.node: NodeBase = node
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"NodeExpressionCast({super().__repr__()}, type="
+                f"{self.data_type.name}, node={{{self.node!r}}})")
+
+    def __str__(self) -> str:
+        return f"{self.data_type}({self.node})"
@@ -0,0 +1,119 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Node: Factory                 ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from pathlib import Path
+from typing import Any
+
+from .base import NodeBase
+from .expression import NodeExpressionBinary, NodeExpressionUnary
+from .literal import NodeLiteral
+
+
+## Classes
+class NodeFactory:
+    """
+    Ember Language AST Node Factory
+    - Builds expression nodes; the base factory always builds a new node
+    """
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return "NodeFactory()"
+
+    # -Instance Methods
+    def literal(
+        self, file: Path, position: tuple[int, int, int],
+        _type: NodeLiteral.Type, value: bool | int | str
+    ) -> NodeLiteral:
+        return NodeLiteral(file, position, _type, value)
+
+    def unary(
+        self, file: Path, position: tuple[int, int, int],
+        _type: NodeExpressionUnary.Type, node: NodeBase
+    ) -> NodeExpressionUnary:
+        return NodeExpressionUnary(file, position, _type, node)
+
+    def binary(
+        self, file: Path, position: tuple[int, int, int],
+        _type: NodeExpressionBinary.Type, lhs: NodeBase, rhs: NodeBase
+    ) -> NodeExpressionBinary:
+        return NodeExpressionBinary(file, position, _type, lhs, rhs)
+
+
+class NodeFactoryHashConsed(NodeFactory):
+    """
+    Ember Language AST Node Factory: Hash-Consed
+    - Shares structurally identical expression subtrees (literals, unary and
+    binary operations over shared operands) so the AST becomes a DAG
+    A shared node keeps the position of its first construction and returns
+    are never shared; passes that annotate or rewrite nodes in place must
+    run on an unshared tree (see passes.common.unshare)
+
+    (a + b) * (a + b) => one `a + b` node used as both operands
+    """
+
+    # -Constructor
+    def __init__(self) -> None:
+        self.created: int = 0
+        self.shared: int = 0
+        self._table: dict[tuple[Any, ...], NodeBase] = {}
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"NodeFactoryHashConsed(created={self.created}, shared={self.shared})"
+
+    # -Instance Methods
+    def literal(
+        self, file: Path, position: tuple[int, int, int],
+        _type: NodeLiteral.Type, value: bool | int | str
+    ) -> NodeLiteral:
+        key = (NodeLiteral, _type, value)
+        if (node := self._table.get(key)) is None:
+            node = self._table[key] = super().literal(file, position, _type, value)
+            self.created += 1
+        else:
+            self.shared += 1
+        assert isinstance(node, NodeLiteral)
+        return node
+
+    def unary(
+        self, file: Path, position: tuple[int, int, int],
+        _type: NodeExpressionUnary.Type, node: NodeBase
+    ) -> NodeExpressionUnary:
+        if _type is NodeExpressionUnary.Type.Return:
+            return super().unary(file, position, _type, node)
+        key = (NodeExpressionUnary, _type, id(node))
+        if (shared := self._table.get(key)) is None:
+            shared = self._table[key] = super().unary(file, position, _type, node)
+            self.created += 1
+        else:
+            self.shared += 1
+        assert isinstance(shared, NodeExpressionUnary)
+        return shared
+
+    def binary(
+        self, file: Path, position: tuple[int, int, int],
+        _type: NodeExpressionBinary.Type, lhs: NodeBase, rhs: NodeBase
+    ) -> NodeExpressionBinary:
+        # -Operands are keyed by identity: they are either shared already or unique
+        key = (NodeExpressionBinary, _type, id(lhs), id(rhs))
+        if (node := self._table.get(key)) is None:
+            node = self._table[key] = super().binary(file, position, _type, lhs, rhs)
+            self.created += 1
+        else:
+            self.shared += 1
+        assert isinstance(node, NodeExpressionBinary)
+        return node
+
+    def clear(self) -> None:
+        '''
+        Forgets every shared node; later nodes never share with earlier ones
+        '''
+        self._table.clear()
@@ -7,9 +7,11 @@
 ##-------------------------------##
 
 ## Imports
+from __future__ import annotations
 from pathlib import Path
 
 from .base import NodeBase, NodeContextBase
+from .datatype import DataType
 
 
 ## Classes
@@ -17,17 +19,24 @@ class NodeFunctionDeclaration(NodeContextBase):
     """
     Ember Language AST Node: Function Declaration
     - Node that represents a function declaration and it's id, parameters, and body
+    along with the parameter and return types if declared
     """
 
     # -Constructor
     def __init__(
         self, file: Path, position: tuple[int, int, int],
-        _id: str, parameters: tuple[str, ...] | None, body: NodeBase
+        _id: str, parameters: tuple[str, ...] | None, body: NodeBase,
+        parameter_types: tuple[DataType | None, ...] | None = None,
+        return_type: DataType | None = None
     ) -> None:
         super().__init__(file, position)
         self.id: str = _id
         self.parameters: tuple[str, ...] | None = parameters
         self.body: NodeBase = body
+        self.parameter_types: tuple[DataType | None, ...] | None = parameter_types
+        self.return_type: DataType | None = return_type
+        self.parameter_slots: tuple[int, ...] | None = None  # -set by stack slot allocation
+        self.frame_size: int | None = None  # -set by stack slot allocation
 
     # -Dunder Methods
     def __repr__(self) -> str:
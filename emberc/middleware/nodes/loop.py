@@ -10,6 +10,7 @@
 from __future__ import annotations
 
 from .base import NodeBase
+from .expression import NodeExpressionBinary
 
 
 ## Classes
@@ -28,6 +29,7 @@ class NodeLoop(NodeBase):
         self.condition: NodeBase = condition
         self.body: NodeBase = body
         self.run_before_eval: bool = run_before_eval  # -true for do..while, false for while
+        self.induction: NodeLoop.Induction | None = None  # -set by induction variable analysis
 
     # -Dunder Methods
     def __repr__(self) -> str:
@@ -39,3 +41,31 @@ class NodeLoop(NodeBase):
             return f"do {{ {self.body} }} while({self.condition})"
         else:
             return f"while({self.condition}) {{ {self.body} }}"
+
+    # -Sub-Classes
+    class Induction:
+        '''
+        Ember Loop Induction
+        - Represents the basic induction variable of a counted loop
+        `id = start; while(id <comparison> bound) { ..; id = id + step; }`
+        Start and trip count are only known when compile-time constant
+        '''
+
+        # -Constructor
+        def __init__(
+            self, _id: str, start: int | None, step: int,
+            comparison: NodeExpressionBinary.Type, bound: NodeBase,
+            trip_count: int | None
+        ) -> None:
+            self.id: str = _id
+            self.start: int | None = start
+            self.step: int = step
+            self.comparison: NodeExpressionBinary.Type = comparison
+            self.bound: NodeBase = bound
+            self.trip_count: int | None = trip_count
+
+        # -Dunder Methods
+        def __repr__(self) -> str:
+            return (f"NodeLoop.Induction(id={self.id}, start={self.start}, step={self.step}, "
+                    f"comparison={self.comparison.name}, bound={self.bound!r}, "
+                    f"trip_count={self.trip_count})")
@@ -7,32 +7,37 @@
 ##-------------------------------##
 
 ## Imports
+from __future__ import annotations
 from pathlib import Path
 
 from .base import NodeBase, NodeContextBase
+from .datatype import DataType
 
 
 ## Classes
 class NodeVarDeclaration(NodeContextBase):
     """
     Ember Language AST Node: Var Declaration
-    - Node that represents a variable declaration and
-    it's expression initializer if applicable
+    - Node that represents a variable declaration, it's
+    declared type and expression initializer if applicable
+    Declarations without a type take their initializer's type
     """
 
     # -Constructor
     def __init__(
         self, file: Path, position: tuple[int, int, int],
-        _id: str, initializer: NodeBase | None
+        _id: str, initializer: NodeBase | None, data_type: DataType | None = None
     ) -> None:
         super().__init__(file, position)
         self.id: str = _id
         self.initializer: NodeBase | None = initializer
+        self.data_type: DataType | None = data_type
+        self.slot: int | None = None  # -set by stack slot allocation
 
     # -Dunder Methods
     def __repr__(self) -> str:
-        return (f"NodeVarDeclaration({super().__repr__()}, "
-                f"id={self.id}, initializer={self.initializer!r})")
+        return (f"NodeVarDeclaration({super().__repr__()}, id={self.id}, "
+                f"type={self.data_type}, initializer={self.initializer!r})")
 
     def __str__(self) -> str:
         return (f"Symbol({self.id}) = " +
@@ -0,0 +1,35 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes                        ##
+##-------------------------------##
+
+## Imports
+from .branches import BranchOrderer
+from .callgraph import CallGraph, UnreachableFunctionEliminator
+from .cse import CommonSubexpressionEliminator
+from .ctfe import CompileTimeEvaluator
+from .inline import FunctionInliner
+from .dce import DeadCodeEliminator
+from .induction import InductionVariableAnalysis
+from .liveness import StackSlotAllocator
+from .licm import LoopInvariantCodeMotion
+from .manager import PassManager, PassInfo, PassError
+from .lowering import TypedLowering, TypeCheckError
+from .ranges import ValueRangeAnalysis
+from .tail_call import TailCallEliminator
+from .unroll import LoopUnroller
+from .visitor import NodeVisitor, NodeTransformer, ScopedTransformer, NodeCounter
+
+## Constants
+__all__: tuple[str, ...] = (
+    "TailCallEliminator", "LoopInvariantCodeMotion", "InductionVariableAnalysis",
+    "LoopUnroller", "FunctionInliner", "DeadCodeEliminator", "CompileTimeEvaluator",
+    "TypedLowering", "TypeCheckError", "ValueRangeAnalysis",
+    "CallGraph", "UnreachableFunctionEliminator", "StackSlotAllocator",
+    "CommonSubexpressionEliminator", "BranchOrderer",
+    "PassManager", "PassInfo", "PassError",
+    "NodeVisitor", "NodeTransformer", "ScopedTransformer", "NodeCounter",
+)
@@ -0,0 +1,95 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Branch Ordering       ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from copy import copy
+
+from .common import unshare_all
+from .visitor import NodeVisitor
+from ..profile import Profile
+from ..nodes import NodeBase, NodeConditional, NodeExpressionBinary, NodeExpressionUnary
+from ..nodes.base import NodeContextBase
+
+## Constants
+INVERSE_LUT: dict[NodeExpressionBinary.Type, NodeExpressionBinary.Type] = {
+    NodeExpressionBinary.Type.Lt: NodeExpressionBinary.Type.GtEq,
+    NodeExpressionBinary.Type.GtEq: NodeExpressionBinary.Type.Lt,
+    NodeExpressionBinary.Type.Gt: NodeExpressionBinary.Type.LtEq,
+    NodeExpressionBinary.Type.LtEq: NodeExpressionBinary.Type.Gt,
+    NodeExpressionBinary.Type.EqEq: NodeExpressionBinary.Type.BangEq,
+    NodeExpressionBinary.Type.BangEq: NodeExpressionBinary.Type.EqEq,
+}
+
+
+## Classes
+class BranchOrderer(NodeVisitor):
+    """
+    Ember Middleware Pass: Profile-Guided Branch Ordering
+    - Makes the arm a profile saw taken most often the true arm of an
+    if/else so it is the fall-through path of generated code
+    Arms are only swapped when the condition inverts for free (a
+    comparison flips its operator, a not is dropped) and the false arm
+    was taken at least bias times as often as the true arm; swapped
+    conditionals keep their position and are marked inverted, so the
+    profile still reads their counts the right way round
+
+    if(a < b) { cold } else { hot } => if(a >= b) { hot } else { cold }
+    """
+
+    # -Constructor
+    def __init__(self, ast: list[NodeBase], profile: Profile | None = None, bias: float = 2.0) -> None:
+        self.ast: list[NodeBase] = ast
+        self.profile: Profile | None = profile
+        self.bias: float = bias
+        self.swapped: int = 0
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"BranchOrderer(bias={self.bias}, swapped={self.swapped})"
+
+    # -Instance Methods
+    def run(self) -> list[NodeBase]:
+        '''
+        Reorders every biased if/else; without a profile nothing changes
+        '''
+        if self.profile is None:
+            return self.ast
+        self.visit_all(unshare_all(self.ast))
+        return self.ast
+
+    def _visit_conditional(self, node: NodeConditional) -> None:
+        self._visit_children(node)
+        if node.false_block is not None:
+            self._order(node)
+
+    def _order(self, node: NodeConditional) -> None:
+        assert self.profile is not None and node.false_block is not None
+        true, false = self.profile.branch(node)
+        if false <= true * self.bias or false == 0:
+            return
+        condition = node.condition
+        if isinstance(condition, NodeExpressionBinary) and condition.type in INVERSE_LUT:
+            inverse = NodeExpressionBinary(
+                condition.file, condition.position, INVERSE_LUT[condition.type],
+                condition.lhs, condition.rhs
+            )
+            inverse.data_type = condition.data_type
+            node.condition = inverse
+        elif (isinstance(condition, NodeExpressionUnary) and
+              condition.type is NodeExpressionUnary.Type.Not and
+              isinstance(condition.node, NodeContextBase)):
+            # -The operand takes the not's position so the site is unchanged
+            operand = copy(condition.node)
+            operand.file, operand.position = condition.file, condition.position
+            node.condition = operand
+        else:
+            return
+        node.true_block, node.false_block = node.false_block, node.true_block
+        node.inverted = not node.inverted
+        self.swapped += 1
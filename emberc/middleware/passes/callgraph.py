@@ -0,0 +1,189 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Call Graph            ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from .common import ENTRY_POINT, walk, callee
+from ..nodes import NodeBase, NodeFunctionDeclaration
+
+
+## Classes
+class CallGraph:
+    """
+    Ember Middleware Analysis: Call Graph
+    - Whole-program graph of top-level functions with an edge for every
+    call naming another top-level function (calls made by nested functions
+    belong to their enclosing top-level function)
+    Roots are the entry point and functions called by top-level statements
+    Recursion is found as strongly connected components, kept callees first
+    """
+
+    # -Constructor
+    def __init__(self, ast: list[NodeBase]) -> None:
+        self.functions: dict[str, NodeFunctionDeclaration] = {
+            node.id: node for node in ast if isinstance(node, NodeFunctionDeclaration)
+        }
+        self.edges: dict[str, set[str]] = {
+            _id: {
+                _callee for node in walk(function.body)
+                if (_callee := callee(node)) in self.functions
+            } for _id, function in self.functions.items()
+        }
+        self.roots: set[str] = {
+            _callee for statement in ast if not isinstance(statement, NodeFunctionDeclaration)
+            for node in walk(statement) if (_callee := callee(node)) in self.functions
+        }
+        if ENTRY_POINT in self.functions:
+            self.roots.add(ENTRY_POINT)
+        self.components: list[tuple[str, ...]] = self._strongly_connected()
+        self.component_of: dict[str, int] = {
+            _id: index for index, component in enumerate(self.components) for _id in component
+        }
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"CallGraph(functions={len(self.functions)}, "
+                f"edges={sum(len(edges) for edges in self.edges.values())}, "
+                f"components={len(self.components)})")
+
+    # -Instance Methods
+    def callees(self, _id: str) -> set[str]:
+        '''
+        Returns the functions a function calls directly
+        '''
+        return self.edges[_id]
+
+    def callers(self, _id: str) -> set[str]:
+        '''
+        Returns the functions calling a function directly
+        '''
+        return {caller for caller, callees in self.edges.items() if _id in callees}
+
+    def is_recursive(self, _id: str) -> bool:
+        '''
+        Checks if a function can call itself through one or more calls
+        '''
+        return len(self.components[self.component_of[_id]]) > 1 or _id in self.edges[_id]
+
+    def reachable(self, roots: set[str] | None = None) -> set[str]:
+        '''
+        Returns every function reachable from the roots (default: the graph's roots)
+        '''
+        stack = list(self.roots if roots is None else roots)
+        seen: set[str] = set()
+        while stack:
+            _id = stack.pop()
+            if _id not in seen:
+                seen.add(_id)
+                stack.extend(self.edges[_id])
+        return seen
+
+    def order(self) -> list[str]:
+        '''
+        Returns every function with callees before their callers
+        (members of a recursive component are adjacent)
+        '''
+        return [_id for component in self.components for _id in component]
+
+    def levels(self) -> list[list[tuple[str, ...]]]:
+        '''
+        Groups components into waves that only call earlier waves so each
+        wave's components can be processed in parallel
+        '''
+        depth: list[int] = []
+        for index, component in enumerate(self.components):
+            callees = {
+                self.component_of[_callee] for _id in component for _callee in self.edges[_id]
+            } - {index}
+            depth.append(1 + max((depth[other] for other in callees), default=-1))
+        waves: list[list[tuple[str, ...]]] = [[] for _ in range(max(depth, default=-1) + 1)]
+        for index, component in enumerate(self.components):
+            waves[depth[index]].append(component)
+        return waves
+
+    def _strongly_connected(self) -> list[tuple[str, ...]]:
+        '''
+        Tarjan's algorithm (iterative); Components are emitted callees first
+        '''
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        components: list[tuple[str, ...]] = []
+        for root in self.functions:
+            if root in index:
+                continue
+            work: list[tuple[str, list[str]]] = [(root, sorted(self.edges[root]))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                _id, pending = work[-1]
+                if pending:
+                    _callee = pending.pop(0)
+                    if _callee not in index:
+                        index[_callee] = lowlink[_callee] = len(index)
+                        stack.append(_callee)
+                        on_stack.add(_callee)
+                        work.append((_callee, sorted(self.edges[_callee])))
+                    elif _callee in on_stack:
+                        lowlink[_id] = min(lowlink[_id], index[_callee])
+                    continue
+                work.pop()
+                if work:
+                    caller = work[-1][0]
+                    lowlink[caller] = min(lowlink[caller], lowlink[_id])
+                if lowlink[_id] == index[_id]:
+                    component: list[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == _id:
+                            break
+                    components.append(tuple(reversed(component)))
+        return components
+
+
+class UnreachableFunctionEliminator:
+    """
+    Ember Middleware Pass: Unreachable Function Elimination
+    - Removes top-level functions not reachable from the call graph's
+    roots; programs without an entry point are left untouched since any
+    of their functions may be called from outside
+    """
+
+    # -Constructor
+    def __init__(self, ast: list[NodeBase], graph: CallGraph | None = None) -> None:
+        self.ast: list[NodeBase] = ast
+        self.removed: list[str] = []
+        self.graph: CallGraph | None = graph
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"UnreachableFunctionEliminator(removed={len(self.removed)})"
+
+    # -Instance Methods
+    def run(self) -> list[NodeBase]:
+        '''
+        Strips unreachable functions; Keeps the graph of what remains
+        A given graph must be current for the AST
+        '''
+        graph = self.graph if self.graph is not None else CallGraph(self.ast)
+        if ENTRY_POINT not in graph.functions:
+            self.graph = graph
+            return self.ast
+        reachable = graph.reachable()
+        self.removed = [_id for _id in graph.functions if _id not in reachable]
+        self.ast[:] = [
+            node for node in self.ast
+            if not (isinstance(node, NodeFunctionDeclaration) and node.id not in reachable)
+        ]
+        self.graph = CallGraph(self.ast)
+        return self.ast
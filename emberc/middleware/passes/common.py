@@ -0,0 +1,456 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Common                ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from collections.abc import Callable, Generator
+from copy import copy, deepcopy
+from pathlib import Path
+from typing import Any
+
+from ..nodes.base import NodeContextBase
+from ..nodes import (
+    NodeBase, NodeStatementBlock, NodeConditional, NodeLoop,
+    NodeFunctionDeclaration, NodeFunctionCall,
+    NodeVarDeclaration, NodeVarAssignment,
+    NodeExpressionBinary, NodeExpressionUnary, NodeExpressionCast, NodeLiteral,
+)
+
+## Constants
+ENTRY_POINT: str = "__start__"
+Type_NodeGenerator = Generator[NodeBase, None, None]
+Type_Context = tuple[Path, tuple[int, int, int]]
+Type_NodeMap = Callable[[NodeBase], NodeBase]
+Type_Children = Callable[[Any], tuple[NodeBase, ...]]
+Type_MapChildren = Callable[[Any, Type_NodeMap], None]
+
+
+## Functions
+def children(node: NodeBase) -> tuple[NodeBase, ...]:
+    """
+    Returns the direct child nodes of a node in evaluation order
+    """
+    return CHILDREN_LUT[type(node)](node)
+
+
+def map_children(node: NodeBase, function: Type_NodeMap) -> NodeBase:
+    """
+    Replaces every direct child of a node in place with the result of
+    the given function; Returns the node
+    """
+    MAP_CHILDREN_LUT[type(node)](node, function)
+    return node
+
+
+# -Per node class accessors (children in evaluation order)
+def _children_block(node: NodeStatementBlock) -> tuple[NodeBase, ...]:
+    return node.nodes
+
+
+def _children_conditional(node: NodeConditional) -> tuple[NodeBase, ...]:
+    if node.false_block is None:
+        return (node.condition, node.true_block)
+    return (node.condition, node.true_block, node.false_block)
+
+
+def _children_loop(node: NodeLoop) -> tuple[NodeBase, ...]:
+    if node.run_before_eval:
+        return (node.body, node.condition)
+    return (node.condition, node.body)
+
+
+def _children_function_declaration(node: NodeFunctionDeclaration) -> tuple[NodeBase, ...]:
+    return (node.body,)
+
+
+def _children_function_call(node: NodeFunctionCall) -> tuple[NodeBase, ...]:
+    return (node.callee, *node.arguments) if node.arguments else (node.callee,)
+
+
+def _children_var_declaration(node: NodeVarDeclaration) -> tuple[NodeBase, ...]:
+    return (node.initializer,) if node.initializer else ()
+
+
+def _children_var_assignment(node: NodeVarAssignment) -> tuple[NodeBase, ...]:
+    return (node.lvalue, node.rvalue)
+
+
+def _children_expression_binary(node: NodeExpressionBinary) -> tuple[NodeBase, ...]:
+    return (node.lhs, node.rhs)
+
+
+def _children_expression_unary(
+    node: NodeExpressionUnary | NodeExpressionCast
+) -> tuple[NodeBase, ...]:
+    return (node.node,)
+
+
+def _children_literal(node: NodeLiteral) -> tuple[NodeBase, ...]:
+    return ()
+
+
+def _map_block(node: NodeStatementBlock, function: Type_NodeMap) -> None:
+    node.nodes = tuple(function(child) for child in node.nodes)
+
+
+def _map_conditional(node: NodeConditional, function: Type_NodeMap) -> None:
+    node.condition = function(node.condition)
+    node.true_block = function(node.true_block)
+    if node.false_block is not None:
+        node.false_block = function(node.false_block)
+
+
+def _map_loop(node: NodeLoop, function: Type_NodeMap) -> None:
+    if node.run_before_eval:
+        node.body = function(node.body)
+        node.condition = function(node.condition)
+    else:
+        node.condition = function(node.condition)
+        node.body = function(node.body)
+
+
+def _map_function_declaration(node: NodeFunctionDeclaration, function: Type_NodeMap) -> None:
+    node.body = function(node.body)
+
+
+def _map_function_call(node: NodeFunctionCall, function: Type_NodeMap) -> None:
+    node.callee = function(node.callee)
+    if node.arguments:
+        node.arguments = tuple(function(argument) for argument in node.arguments)
+
+
+def _map_var_declaration(node: NodeVarDeclaration, function: Type_NodeMap) -> None:
+    if node.initializer is not None:
+        node.initializer = function(node.initializer)
+
+
+def _map_var_assignment(node: NodeVarAssignment, function: Type_NodeMap) -> None:
+    node.lvalue = function(node.lvalue)
+    node.rvalue = function(node.rvalue)
+
+
+def _map_expression_binary(node: NodeExpressionBinary, function: Type_NodeMap) -> None:
+    node.lhs = function(node.lhs)
+    node.rhs = function(node.rhs)
+
+
+def _map_expression_unary(
+    node: NodeExpressionUnary | NodeExpressionCast, function: Type_NodeMap
+) -> None:
+    node.node = function(node.node)
+
+
+def _map_literal(node: NodeLiteral, function: Type_NodeMap) -> None:
+    pass
+
+
+def clone(node: NodeBase) -> NodeBase:
+    """
+    Returns a deep copy of a node
+    """
+    return deepcopy(node)
+
+
+def unshare(node: NodeBase, seen: set[int] | None = None) -> NodeBase:
+    """
+    Turns a DAG built by a hash-consed node factory back into a tree by
+    shallow copying every node reached more than once; Returns the node
+    Pass the same seen set for every statement of an AST
+    """
+    if seen is None:
+        seen = set()
+    if id(node) in seen:
+        node = copy(node)
+    seen.add(id(node))
+    return map_children(node, lambda child: unshare(child, seen))
+
+
+def unshare_all(ast: list[NodeBase]) -> list[NodeBase]:
+    """
+    Unshares every statement of an AST in place; Returns the AST
+    Passes annotating or rewriting nodes in place call it first: on a DAG
+    a change made for one occurrence would reach all of them
+    """
+    seen: set[int] = set()
+    ast[:] = [unshare(node, seen) for node in ast]
+    return ast
+
+
+def walk(node: NodeBase, enter_functions: bool = True) -> Type_NodeGenerator:
+    """
+    Pre-order generator over a node and all of its descendants
+    Optionally stops at nested function declarations
+    """
+    stack: list[NodeBase] = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        if (not enter_functions and current is not node and
+                isinstance(current, NodeFunctionDeclaration)):
+            continue
+        stack.extend(reversed(children(current)))
+
+
+def evaluation_order(node: NodeBase) -> Type_NodeGenerator:
+    """
+    Post-order generator yielding nodes in the order they are evaluated
+    """
+    for child in children(node):
+        yield from evaluation_order(child)
+    yield node
+
+
+def functions(ast: list[NodeBase]) -> Type_NodeGenerator:
+    """
+    Generator over every function declaration in the AST including nested ones
+    """
+    for statement in ast:
+        for node in walk(statement):
+            if isinstance(node, NodeFunctionDeclaration):
+                yield node
+
+
+def identifier(node: NodeBase) -> str | None:
+    """
+    Returns the symbol name of an identifier literal or None
+    """
+    if isinstance(node, NodeLiteral) and node.type is NodeLiteral.Type.Identifier:
+        assert isinstance(node.value, str)
+        return node.value
+    return None
+
+
+def context(node: NodeBase) -> Type_Context | None:
+    """
+    Returns the file/position context of the first node carrying one
+    """
+    for child in walk(node, False):
+        if isinstance(child, NodeContextBase):
+            return (child.file, child.position)
+    return None
+
+
+def callee(node: NodeBase) -> str | None:
+    """
+    Returns the symbol name a function call targets or None
+    """
+    if isinstance(node, NodeFunctionCall):
+        return identifier(node.callee)
+    return None
+
+
+def calls(node: NodeBase, _id: str | None = None) -> bool:
+    """
+    Checks if a node contains any function call or a call to the given id
+    Nested function declarations are not searched
+    """
+    for child in walk(node, False):
+        if isinstance(child, NodeFunctionCall) and (_id is None or callee(child) == _id):
+            return True
+    return False
+
+
+def is_return(node: NodeBase) -> bool:
+    """
+    Checks if a node is a return statement
+    """
+    return (isinstance(node, NodeExpressionUnary) and
+            node.type is NodeExpressionUnary.Type.Return)
+
+
+def is_pure_node(node: NodeBase) -> bool:
+    """
+    Checks if a single node, ignoring its children, has no side effects and can
+    not trap; Division and modulo are only pure with a non-zero literal divisor
+    """
+    if isinstance(node, NodeExpressionBinary):
+        if node.type in (NodeExpressionBinary.Type.Div, NodeExpressionBinary.Type.Mod):
+            return (isinstance(node.rhs, NodeLiteral) and
+                    node.rhs.type is NodeLiteral.Type.Number and node.rhs.value != 0)
+        return True
+    elif isinstance(node, NodeExpressionUnary):
+        return node.type is not NodeExpressionUnary.Type.Return
+    return isinstance(node, (NodeLiteral, NodeExpressionCast))
+
+
+def is_pure(node: NodeBase) -> bool:
+    """
+    Checks if an expression has no side effects and can not trap
+    """
+    return all(is_pure_node(child) for child in walk(node))
+
+
+def is_invariant(node: NodeBase, written: set[str], protected: set[str] | None) -> bool:
+    """
+    Checks if a pure expression reads none of the written symbols; when a
+    loop calls functions (protected is not None) it may only read symbols
+    from the protected function-local set
+    """
+    if not is_pure(node):
+        return False
+    symbols = symbols_read(node)
+    return not symbols & written and (protected is None or symbols <= protected)
+
+
+def definitely_returns(node: NodeBase) -> bool:
+    """
+    Checks if every path through a statement ends in a return
+    """
+    if is_return(node):
+        return True
+    elif isinstance(node, NodeStatementBlock):
+        return any(definitely_returns(child) for child in node.nodes)
+    elif isinstance(node, NodeConditional):
+        return (node.false_block is not None and
+                definitely_returns(node.true_block) and
+                definitely_returns(node.false_block))
+    return False
+
+
+def symbols_read(node: NodeBase) -> set[str]:
+    """
+    Returns every symbol read by a node; assignment targets and callees excluded
+    """
+    excluded: set[int] = set()
+    symbols: set[str] = set()
+    for child in walk(node, False):
+        if isinstance(child, NodeVarAssignment):
+            excluded.add(id(child.lvalue))
+        elif isinstance(child, NodeFunctionCall):
+            excluded.add(id(child.callee))
+        elif id(child) not in excluded and (_id := identifier(child)) is not None:
+            symbols.add(_id)
+    return symbols
+
+
+def symbols_written(node: NodeBase) -> set[str]:
+    """
+    Returns every symbol assigned or declared by a node
+    """
+    symbols: set[str] = set()
+    for child in walk(node, False):
+        if isinstance(child, NodeVarAssignment):
+            if (_id := identifier(child.lvalue)) is not None:
+                symbols.add(_id)
+        elif isinstance(child, NodeVarDeclaration):
+            symbols.add(child.id)
+    return symbols
+
+
+def local_symbols(function: NodeFunctionDeclaration) -> set[str]:
+    """
+    Returns the parameters and every variable declared in a function body
+    """
+    symbols = set(function.parameters) if function.parameters else set()
+    for node in walk(function.body, False):
+        if isinstance(node, NodeVarDeclaration):
+            symbols.add(node.id)
+    return symbols
+
+
+def pure_functions(ast: list[NodeBase]) -> set[str]:
+    """
+    Returns the ids of top-level functions whose result only depends on their
+    arguments; they read and write nothing but parameters and locals (none
+    shadowing a global), declare no nested functions and only call pure functions
+    """
+    _globals = {node.id for node in ast if isinstance(node, NodeVarDeclaration)}
+    declarations: dict[str, NodeFunctionDeclaration] = {}
+    duplicates: set[str] = set()
+    for node in ast:
+        if isinstance(node, NodeFunctionDeclaration):
+            if node.id in declarations:
+                duplicates.add(node.id)
+            declarations[node.id] = node
+    candidates: dict[str, set[str]] = {}
+    for _id, function in declarations.items():
+        if _id in duplicates:
+            continue
+        symbols = local_symbols(function)
+        if symbols & _globals or symbols & declarations.keys():
+            continue
+        if any(isinstance(node, NodeFunctionDeclaration) for node in walk(function.body)):
+            continue
+        if not (symbols_read(function.body) | symbols_written(function.body)) <= symbols:
+            continue
+        callees: set[str] = set()
+        for node in walk(function.body, False):
+            if isinstance(node, NodeFunctionCall):
+                if (name := callee(node)) is None:
+                    break
+                callees.add(name)
+        else:
+            candidates[_id] = callees
+    # -Drop functions calling impure ones until nothing changes
+    changed = True
+    while changed:
+        changed = False
+        for _id, callees in list(candidates.items()):
+            if not callees <= candidates.keys():
+                del candidates[_id]
+                changed = True
+    return set(candidates)
+
+
+# -Node Builders
+def build_identifier(context: Type_Context, _id: str) -> NodeLiteral:
+    """
+    Builds an identifier literal at the given file/position context
+    """
+    return NodeLiteral(context[0], context[1], NodeLiteral.Type.Identifier, _id)
+
+
+def build_number(context: Type_Context, value: int) -> NodeLiteral:
+    """
+    Builds a number literal at the given file/position context
+    """
+    return NodeLiteral(context[0], context[1], NodeLiteral.Type.Number, value)
+
+
+def build_boolean(context: Type_Context, value: bool) -> NodeLiteral:
+    """
+    Builds a boolean literal at the given file/position context
+    """
+    return NodeLiteral(context[0], context[1], NodeLiteral.Type.Boolean, value)
+
+
+def build_assignment(context: Type_Context, _id: str, value: NodeBase) -> NodeVarAssignment:
+    """
+    Builds an assignment of value to the symbol id
+    """
+    return NodeVarAssignment(build_identifier(context, _id), value)
+
+
+## Body
+# -Node class => accessor tables: one lookup instead of an isinstance chain
+CHILDREN_LUT: dict[type[NodeBase], Type_Children] = {
+    NodeStatementBlock: _children_block,
+    NodeConditional: _children_conditional,
+    NodeLoop: _children_loop,
+    NodeFunctionDeclaration: _children_function_declaration,
+    NodeFunctionCall: _children_function_call,
+    NodeVarDeclaration: _children_var_declaration,
+    NodeVarAssignment: _children_var_assignment,
+    NodeExpressionBinary: _children_expression_binary,
+    NodeExpressionUnary: _children_expression_unary,
+    NodeExpressionCast: _children_expression_unary,
+    NodeLiteral: _children_literal,
+}
+MAP_CHILDREN_LUT: dict[type[NodeBase], Type_MapChildren] = {
+    NodeStatementBlock: _map_block,
+    NodeConditional: _map_conditional,
+    NodeLoop: _map_loop,
+    NodeFunctionDeclaration: _map_function_declaration,
+    NodeFunctionCall: _map_function_call,
+    NodeVarDeclaration: _map_var_declaration,
+    NodeVarAssignment: _map_var_assignment,
+    NodeExpressionBinary: _map_expression_binary,
+    NodeExpressionUnary: _map_expression_unary,
+    NodeExpressionCast: _map_expression_unary,
+    NodeLiteral: _map_literal,
+}
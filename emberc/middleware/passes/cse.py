@@ -0,0 +1,199 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Common Subexpressions ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from .common import (
+    walk, map_children, clone, unshare_all, calls, context, identifier, is_pure, is_return,
+    symbols_read, symbols_written, build_identifier,
+)
+from .visitor import ScopedTransformer
+from ..nodes import (
+    NodeBase, NodeStatementBlock, NodeConditional, NodeLoop,
+    NodeFunctionDeclaration, NodeVarDeclaration, NodeVarAssignment,
+    NodeExpressionBinary, NodeExpressionUnary, NodeExpressionCast,
+)
+
+## Constants
+TEMPORARY_PREFIX: str = "__cse_"
+Type_Window = tuple[str, list[int]]
+
+
+## Functions
+def _is_candidate(node: NodeBase) -> bool:
+    """
+    Checks if a node is a pure operation worth computing once
+    """
+    return (isinstance(node, (NodeExpressionBinary, NodeExpressionUnary, NodeExpressionCast))
+            and is_pure(node))
+
+
+def _expression(statement: NodeBase) -> tuple[NodeBase | None, str | None]:
+    """
+    Splits a simple statement into the expression it evaluates
+    and the symbol it stores last (declaration or top-level assignment)
+    """
+    if isinstance(statement, NodeVarDeclaration):
+        return (statement.initializer, statement.id)
+    elif isinstance(statement, NodeVarAssignment):
+        return (statement.rvalue, identifier(statement.lvalue))
+    elif is_return(statement):
+        assert isinstance(statement, NodeExpressionUnary)
+        return (statement.node, None)
+    return (statement, None)
+
+
+## Classes
+class CommonSubexpressionEliminator(ScopedTransformer):
+    """
+    Ember Middleware Pass: Common Subexpression Elimination
+    - Computes a pure expression repeated within a basic region (a run of
+    simple statements in one block with no control flow between them) once
+    into a temporary declared before its first use
+    A region's window for an expression closes when one of its operands is
+    written; calls also close it unless every operand is function-local
+    Occurrences inside a statement that writes an operand or calls before
+    it are left alone; the largest repeated expression is taken first
+    Hash-consed trees are unshared first
+
+    x = (a + b) * c; y = (a + b) * c; => __cse_0 = (a + b) * c; x = __cse_0; y = __cse_0;
+    """
+
+    # -Constructor
+    def __init__(self, ast: list[NodeBase]) -> None:
+        super().__init__()
+        self.ast: list[NodeBase] = ast
+        self.eliminated: int = 0
+        self.temporaries: int = 0
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"CommonSubexpressionEliminator(eliminated={self.eliminated}, "
+                f"temporaries={self.temporaries})")
+
+    # -Instance Methods
+    def run(self) -> list[NodeBase]:
+        '''
+        Eliminates common subexpressions in every region of the AST
+        '''
+        self.ast[:] = self._region(unshare_all(self.ast))
+        return self.ast
+
+    def _visit_block(self, node: NodeStatementBlock) -> NodeBase:
+        self._scopes.append({})
+        node.nodes = tuple(self._region(list(node.nodes)))
+        self._scopes.pop()
+        return node
+
+    def _visit_body(self, node: NodeBase) -> NodeBase:
+        '''
+        Visits a nested statement; a lone simple statement that
+        gains temporaries is wrapped in a block
+        '''
+        if isinstance(node, (NodeStatementBlock, NodeConditional, NodeLoop)):
+            return self.visit(node)
+        self._scopes.append({})
+        nodes = self._region([node])
+        self._scopes.pop()
+        return nodes[0] if len(nodes) == 1 else NodeStatementBlock(tuple(nodes))
+
+    def _region(self, nodes: list[NodeBase]) -> list[NodeBase]:
+        '''
+        Eliminates repeated expressions in a list of statements
+        '''
+        nodes = [self.visit(node) for node in nodes]
+        while (window := self._choose(nodes)) is not None:
+            self._eliminate(nodes, window)
+        return nodes
+
+    def _choose(self, nodes: list[NodeBase]) -> Type_Window | None:
+        '''
+        Finds the largest expression occurring at least twice in one window
+        Returns its key and the index of the statement of each occurrence
+        '''
+        # -Locals declared by the region only count once their declaration is reached
+        protected = set().union(*self._scopes[:-1])
+        function_level = bool(self._scopes)
+        closed: list[Type_Window] = []
+        open_windows: dict[str, list[int]] = {}
+        operands: dict[str, set[str]] = {}
+        sizes: dict[str, int] = {}
+
+        def close(keys: list[str]) -> None:
+            for key in keys:
+                closed.append((key, open_windows.pop(key)))
+
+        for index, statement in enumerate(nodes):
+            expression, target = _expression(statement)
+            if (expression is None or
+                    isinstance(statement, (NodeStatementBlock, NodeConditional, NodeLoop,
+                                           NodeFunctionDeclaration))):
+                close(list(open_windows))
+                if isinstance(statement, NodeVarDeclaration) and function_level:
+                    protected.add(statement.id)
+                continue
+            written = symbols_written(expression)
+            calling = calls(expression)
+            for node in walk(expression, False):
+                if not _is_candidate(node):
+                    continue
+                key = str(node)
+                if key not in operands:
+                    operands[key] = symbols_read(node)
+                    sizes[key] = sum(1 for _ in walk(node))
+                symbols = operands[key]
+                if symbols & written or (calling and not symbols <= protected):
+                    if key in open_windows:
+                        close([key])
+                    continue
+                open_windows.setdefault(key, []).append(index)
+            # -Stores and calls end the windows of expressions they change
+            if target is not None:
+                written.add(target)
+                if isinstance(statement, NodeVarDeclaration) and function_level:
+                    protected.add(target)
+            close([
+                key for key in open_windows
+                if operands[key] & written or (calling and not operands[key] <= protected)
+            ])
+        close(list(open_windows))
+        repeated = [window for window in closed if len(window[1]) > 1]
+        if not repeated:
+            return None
+        return max(repeated, key=lambda window: (sizes[window[0]], -window[1][0]))
+
+    def _eliminate(self, nodes: list[NodeBase], window: Type_Window) -> None:
+        '''
+        Declares a temporary before the window's first statement
+        and replaces every occurrence in the window with it
+        '''
+        key, indices = window
+        _id = f"{TEMPORARY_PREFIX}{self.temporaries}"
+        value: NodeBase | None = None
+
+        def replace(node: NodeBase) -> NodeBase:
+            nonlocal value
+            if _is_candidate(node) and str(node) == key:
+                if value is None:
+                    value = clone(node)
+                location = context(node)
+                assert location is not None
+                temporary = build_identifier(location, _id)
+                temporary.data_type, temporary.value_range = node.data_type, node.value_range
+                self.eliminated += 1
+                return temporary
+            return map_children(node, replace)
+
+        for index in sorted(set(indices)):
+            nodes[index] = replace(nodes[index])
+        assert value is not None
+        location = context(value)
+        assert location is not None
+        self.temporaries += 1
+        nodes.insert(indices[0], NodeVarDeclaration(*location, _id, value, value.data_type))
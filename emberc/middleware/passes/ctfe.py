@@ -0,0 +1,164 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Compile-Time Eval     ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from collections.abc import Callable
+
+from .common import (
+    map_children, clone, context, callee, pure_functions, build_number, build_boolean,
+)
+from .lowering import TypedLowering, TypeCheckError
+from ..nodes import (
+    NodeBase, NodeFunctionDeclaration, NodeFunctionCall,
+    NodeExpressionUnary, NodeExpressionCast, NodeLiteral,
+)
+
+## Constants
+Type_Value = int | bool
+Type_MemoKey = tuple[str, tuple[Type_Value, ...]]
+# -Builds a call(_id, *arguments) over typed functions given a call depth and
+#  step budget; calls return None if they fail, run out of steps or would
+#  wrap a value (backend.constant_evaluator)
+Type_Call = Callable[..., Type_Value | None]
+Type_Evaluator = Callable[[list[NodeBase], int, int], Type_Call]
+
+
+## Functions
+def _value(node: NodeBase) -> Type_Value | None:
+    """
+    Returns the value of a number/boolean literal, a negated number or a
+    folded call (a cast constant) or None
+    """
+    if isinstance(node, NodeExpressionCast):
+        return _value(node.node)
+    if isinstance(node, NodeLiteral) and node.type is not NodeLiteral.Type.Identifier:
+        assert not isinstance(node.value, str)
+        return node.value
+    if (isinstance(node, NodeExpressionUnary) and
+            node.type is NodeExpressionUnary.Type.Negate and
+            isinstance(node.node, NodeLiteral) and node.node.type is NodeLiteral.Type.Number):
+        assert isinstance(node.node.value, int)
+        return -node.node.value
+    return None
+
+
+## Classes
+class CompileTimeEvaluator:
+    """
+    Ember Middleware Pass: Compile-Time Function Evaluation
+    - Replaces calls to pure top-level functions whose arguments are all
+    constant with the value they return, computed by an evaluator (the
+    backend's interpreter, given by whoever runs the pass; without one
+    nothing is folded)
+    Functions are evaluated typed (a lowered copy) and strictly: a call
+    whose arguments, intermediate values or result leave their declared
+    fixed-width type is not folded, so folding never changes what either
+    unbounded or wrapping arithmetic computes
+    Each evaluation gets a budget of steps (and a call depth) and gives up
+    without error once exhausted; results and failures are kept in a memo
+    table keyed by callee and arguments so repeated calls are evaluated once
+    Numbers are cast to the function's return type, typed as the call was:
+    stored into a narrower variable they convert like the call would
+    rather than as a source literal that must fit
+
+    factorial(4) => int32(24)
+    """
+
+    # -Constructor
+    def __init__(
+        self, ast: list[NodeBase], budget: int = 100_000, max_depth: int = 256,
+        evaluator: Type_Evaluator | None = None
+    ) -> None:
+        self.ast: list[NodeBase] = ast
+        self.evaluator: Type_Evaluator | None = evaluator
+        self.budget: int = budget
+        self.max_depth: int = max_depth
+        self.evaluated: int = 0
+        self.memo: dict[Type_MemoKey, Type_Value | None] = {}
+        self.pure: set[str] = set()
+        self._functions: dict[str, NodeFunctionDeclaration] = {}
+        self._call: Type_Call | None = None
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"CompileTimeEvaluator(budget={self.budget}, evaluated={self.evaluated}, "
+                f"memo={len(self.memo)})")
+
+    # -Instance Methods
+    def run(self) -> list[NodeBase]:
+        '''
+        Folds every constant call to a pure function in the AST
+        '''
+        self.pure = pure_functions(self.ast)
+        if not self.pure or self.evaluator is None:
+            return self.ast
+        functions: list[NodeBase] = [
+            clone(node) for node in self.ast
+            if isinstance(node, NodeFunctionDeclaration) and node.id in self.pure
+        ]
+        try:
+            TypedLowering(functions).run()
+        except TypeCheckError:
+            # -Ill-typed: what the program computes is not known
+            return self.ast
+        self._functions = {
+            node.id: node for node in functions if isinstance(node, NodeFunctionDeclaration)
+        }
+        self._call = self.evaluator(functions, self.max_depth, self.budget)
+        self.ast[:] = [self._fold(node) for node in self.ast]
+        return self.ast
+
+    def _fold(self, node: NodeBase) -> NodeBase:
+        '''
+        Folds calls bottom-up so calls in arguments are folded first
+        Returns the node or the literal replacing it
+        '''
+        map_children(node, self._fold)
+        if not isinstance(node, NodeFunctionCall):
+            return node
+        _id = callee(node)
+        if _id is None or _id not in self.pure:
+            return node
+        arguments = tuple(_value(argument) for argument in node.arguments or ())
+        if any(argument is None for argument in arguments):
+            return node
+        result = self.evaluate(_id, arguments)  # type: ignore[arg-type]
+        if result is None or (location := context(node)) is None:
+            return node
+        self.evaluated += 1
+        if isinstance(result, bool):
+            return build_boolean(location, result)
+        literal = build_number(location, result)
+        if (_type := self._functions[_id].return_type) is None:
+            return literal
+        return NodeExpressionCast(*location, _type, literal)
+
+    def evaluate(self, _id: str, arguments: tuple[Type_Value, ...]) -> Type_Value | None:
+        '''
+        Evaluates a pure function call within the step budget
+        Returns its value or None if it did not finish, return a value or
+        stay within its types
+        '''
+        key = (_id, arguments)
+        if key in self.memo:
+            return self.memo[key]
+        assert self._call is not None
+        function = self._functions[_id]
+        types = function.parameter_types or (None,) * function.arity
+        result: Type_Value | None = None
+        if len(arguments) == function.arity and all(
+                _type is not None and _type.contains(value, value)
+                for value, _type in zip(arguments, types)):
+            result = self._call(_id, *arguments)
+        if not isinstance(result, (int, bool)):
+            result = None
+        elif function.return_type is None or not function.return_type.contains(result, result):
+            result = None
+        self.memo[key] = result
+        return result
@@ -0,0 +1,321 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Dead Code Elimination ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from .common import (
+    walk, map_children, unshare_all, context, identifier, is_return, is_pure,
+    definitely_returns, symbols_read, symbols_written, build_assignment, build_number,
+)
+from .induction import InductionVariableAnalysis
+from .unroll import INCREASING, DECREASING
+from ..nodes import (
+    NodeBase, NodeStatementBlock, NodeConditional, NodeLoop,
+    NodeFunctionDeclaration, NodeVarDeclaration, NodeVarAssignment,
+    NodeExpressionUnary, NodeLiteral,
+)
+
+## Constants
+MAX_ITERATIONS: int = 16
+
+
+## Functions
+def _constant(node: NodeBase) -> bool | int | None:
+    """
+    Returns the value of a number/boolean literal or None
+    """
+    if isinstance(node, NodeLiteral) and node.type is not NodeLiteral.Type.Identifier:
+        assert not isinstance(node.value, str)
+        return node.value
+    return None
+
+
+def _empty(node: NodeBase | None) -> bool:
+    """
+    Checks if a statement is missing or an empty block
+    """
+    return node is None or (isinstance(node, NodeStatementBlock) and not node.nodes)
+
+
+def _reads(statements: list[NodeBase], _id: str) -> bool:
+    """
+    Checks if any statement reads a symbol
+    """
+    return any(_id in symbols_read(statement) for statement in statements)
+
+
+def _overwritten(statements: list[NodeBase], _id: str) -> bool:
+    """
+    Checks if a symbol is stored to by one of the statements (a plain
+    assignment statement) before any of them reads or otherwise writes it
+    """
+    for statement in statements:
+        if _id in symbols_read(statement):
+            return False
+        if isinstance(statement, NodeVarAssignment) and identifier(statement.lvalue) == _id:
+            return True
+        if _id in symbols_written(statement):
+            return False
+    return False
+
+
+## Classes
+class DeadCodeEliminator:
+    """
+    Ember Middleware Pass: Dead Code Elimination
+    - Removes pure expression statements, statements after a return,
+    empty blocks/conditionals, block wrappers without declarations,
+    variables that are never read (and every store to them), stores to
+    locals that a later statement of the same list overwrites before any
+    read and terminating counted loops with no work besides their increment
+    Runs until nothing changes; global declarations are always kept
+    Hash-consed trees are unshared first
+    """
+
+    # -Constructor
+    def __init__(self, ast: list[NodeBase]) -> None:
+        self.ast: list[NodeBase] = ast
+        self.removed: int = 0
+        self._changed: bool = False
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"DeadCodeEliminator(removed={self.removed})"
+
+    # -Instance Methods
+    def run(self) -> list[NodeBase]:
+        '''
+        Eliminates dead code throughout the AST until a fixed point
+        '''
+        unshare_all(self.ast)
+        InductionVariableAnalysis(self.ast, False).run()
+        for _ in range(MAX_ITERATIONS):
+            self._changed = False
+            self.ast[:] = self._statements(self.ast, True)
+            if not self._changed:
+                break
+        return self.ast
+
+    def _remove(self, count: int = 1) -> None:
+        self.removed += count
+        self._changed = True
+
+    # --Statements
+    def _statements(
+        self, statements: tuple[NodeBase, ...] | list[NodeBase], _global: bool = False
+    ) -> list[NodeBase]:
+        '''
+        Cleans a statement list; Declarations are only removed if not global
+        '''
+        cleaned: list[NodeBase] = []
+        for index, statement in enumerate(statements):
+            replacement = self._statement(statement)
+            if replacement is None:
+                self._remove()
+            elif (isinstance(replacement, NodeStatementBlock) and not any(
+                isinstance(node, (NodeVarDeclaration, NodeFunctionDeclaration))
+                for node in replacement.nodes
+            )):
+                # -Flatten wrappers without declarations
+                self._changed = True
+                cleaned.extend(replacement.nodes)
+            else:
+                cleaned.append(replacement)
+            if replacement is not None and definitely_returns(replacement):
+                if index < len(statements) - 1:
+                    self._remove(len(statements) - index - 1)
+                break
+        # -Counted loops with nothing but the increment
+        for index, statement in enumerate(cleaned):
+            if isinstance(statement, NodeLoop):
+                cleaned[index] = self._loop_result(statement, cleaned, index, _global)
+        cleaned = [statement for statement in cleaned if not _empty(statement)]
+        # -Unused locals
+        if not _global:
+            index = 0
+            while index < len(cleaned):
+                statement = cleaned[index]
+                if (isinstance(statement, NodeVarDeclaration) and
+                        not _reads(cleaned[index + 1:], statement.id)):
+                    self._remove()
+                    rest = [self._strip_stores(node, statement.id) for node in cleaned[index + 1:]]
+                    initializer = statement.initializer
+                    kept = [initializer] if initializer and not is_pure(initializer) else []
+                    cleaned[index:] = kept + [node for node in rest if node is not None]
+                    index += len(kept)
+                    continue
+                index += 1
+            cleaned = self._dead_stores(cleaned)
+        return cleaned
+
+    def _dead_stores(self, statements: list[NodeBase]) -> list[NodeBase]:
+        '''
+        Removes stores to locals declared in a statement list which a later
+        statement of the list overwrites first (typed declarations lose their
+        initializer); Impure values are kept as statements
+        '''
+        # -Nested functions could read the locals
+        if any(isinstance(node, NodeFunctionDeclaration)
+               for statement in statements for node in walk(statement)):
+            return statements
+        declared: set[str] = set()
+        cleaned: list[NodeBase] = []
+        for index, statement in enumerate(statements):
+            _id: str | None = None
+            value: NodeBase | None = None
+            if isinstance(statement, NodeVarDeclaration):
+                declared.add(statement.id)
+                # -Untyped declarations need their initializer's type
+                if statement.data_type is not None:
+                    _id, value = statement.id, statement.initializer
+            elif isinstance(statement, NodeVarAssignment):
+                if (_id := identifier(statement.lvalue)) in declared:
+                    value = statement.rvalue
+            if _id is None or value is None or not _overwritten(statements[index + 1:], _id):
+                cleaned.append(statement)
+                continue
+            self._remove()
+            if not is_pure(value):
+                cleaned.append(value)
+            if isinstance(statement, NodeVarDeclaration):
+                statement.initializer = None
+                cleaned.append(statement)
+        return cleaned
+
+    def _statement(self, statement: NodeBase) -> NodeBase | None:
+        '''
+        Cleans a single statement; Returns its replacement or None to remove it
+        '''
+        if isinstance(statement, NodeStatementBlock):
+            nodes = self._statements(statement.nodes)
+            return NodeStatementBlock(tuple(nodes)) if nodes else None
+        elif isinstance(statement, NodeConditional):
+            return self._conditional(statement)
+        elif isinstance(statement, NodeLoop):
+            statement.body = self._branch(statement.body)
+            return statement
+        elif isinstance(statement, NodeFunctionDeclaration):
+            statement.body = self._branch(statement.body)
+            for parameter in statement.parameters or ():
+                if parameter not in symbols_read(statement.body):
+                    body = self._strip_stores(statement.body, parameter)
+                    statement.body = body if body is not None else NodeStatementBlock(())
+            return statement
+        elif isinstance(statement, NodeVarDeclaration) or is_return(statement):
+            return statement
+        # -Expression statement
+        return None if is_pure(statement) else statement
+
+    def _branch(self, node: NodeBase) -> NodeBase:
+        '''
+        Cleans a nested statement keeping it in place as an (empty) block
+        '''
+        cleaned = self._statement(node)
+        if cleaned is None:
+            self._remove()
+            return NodeStatementBlock(())
+        return cleaned
+
+    def _conditional(self, node: NodeConditional) -> NodeBase | None:
+        '''
+        Cleans a conditional folding constant conditions and empty branches
+        '''
+        node.true_block = self._branch(node.true_block)
+        if node.false_block is not None:
+            node.false_block = self._branch(node.false_block)
+            if _empty(node.false_block):
+                node.false_block = None
+                self._changed = True
+        # -Constant condition
+        if (value := _constant(node.condition)) is not None:
+            chosen = node.true_block if value else node.false_block
+            if chosen is None or _empty(chosen):
+                return None
+            self._remove()
+            return chosen if isinstance(chosen, NodeStatementBlock) else NodeStatementBlock((chosen,))
+        if _empty(node.true_block):
+            if node.false_block is None:
+                return None if is_pure(node.condition) else node.condition
+            if (location := context(node.condition)) is not None:
+                self._changed = True
+                node.condition = NodeExpressionUnary(
+                    *location, NodeExpressionUnary.Type.Not, node.condition
+                )
+                node.true_block, node.false_block = node.false_block, None
+        return node
+
+    def _loop_result(
+        self, loop: NodeLoop, statements: list[NodeBase], index: int, _global: bool
+    ) -> NodeBase:
+        '''
+        Removes a terminating counted loop whose body is only its increment
+        Its induction variable gets its final value unless it is a dead local
+        '''
+        induction = loop.induction
+        if induction is None:
+            return loop
+        body = loop.body.nodes if isinstance(loop.body, NodeStatementBlock) else (loop.body,)
+        if not (len(body) == 1 and isinstance(body[0], NodeVarAssignment) and
+                identifier(body[0].lvalue) == induction.id):
+            return loop
+        if not ((induction.comparison in INCREASING and induction.step > 0) or
+                (induction.comparison in DECREASING and induction.step < 0)):
+            return loop
+        local = not _global and any(
+            isinstance(node, NodeVarDeclaration) and node.id == induction.id
+            for node in statements[:index]
+        )
+        if local and not _reads(statements[index + 1:], induction.id):
+            self._remove()
+            return NodeStatementBlock(())
+        if induction.start is None or induction.trip_count is None:
+            return loop
+        self._remove()
+        context = (induction.bound.file, induction.bound.position)  # type: ignore[attr-defined]
+        if induction.trip_count == 0:
+            return NodeStatementBlock(())
+        return build_assignment(context, induction.id, build_number(
+            context, induction.start + induction.trip_count * induction.step
+        ))
+
+    # --Stores
+    def _strip_stores(self, node: NodeBase, _id: str) -> NodeBase | None:
+        '''
+        Removes every store to a symbol that is never read keeping impure
+        values; Returns the node or None if nothing is left
+        '''
+        if isinstance(node, NodeVarAssignment) and identifier(node.lvalue) == _id:
+            self._remove()
+            value = self._strip_stores(node.rvalue, _id)
+            return None if value is None or is_pure(value) else value
+        if isinstance(node, NodeFunctionDeclaration):
+            return node
+        if isinstance(node, NodeStatementBlock):
+            nodes = (self._strip_stores(child, _id) for child in node.nodes)
+            return NodeStatementBlock(tuple(child for child in nodes if child is not None))
+        if isinstance(node, NodeConditional):
+            node.condition = self._strip_stores_value(node.condition, _id)
+            node.true_block = self._strip_stores(node.true_block, _id) or NodeStatementBlock(())
+            if node.false_block is not None:
+                node.false_block = self._strip_stores(node.false_block, _id)
+            return node
+        if isinstance(node, NodeLoop):
+            node.condition = self._strip_stores_value(node.condition, _id)
+            node.body = self._strip_stores(node.body, _id) or NodeStatementBlock(())
+            return node
+        return map_children(node, lambda child: self._strip_stores_value(child, _id))
+
+    def _strip_stores_value(self, node: NodeBase, _id: str) -> NodeBase:
+        '''
+        Replaces nested stores to a symbol with their value
+        '''
+        if isinstance(node, NodeVarAssignment) and identifier(node.lvalue) == _id:
+            self._remove()
+            return self._strip_stores_value(node.rvalue, _id)
+        return map_children(node, lambda child: self._strip_stores_value(child, _id))
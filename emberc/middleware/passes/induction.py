@@ -0,0 +1,270 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Induction Variables   ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from .common import (
+    walk, map_children, clone, calls, identifier, is_return, is_invariant,
+    symbols_written, build_identifier, build_number, build_assignment,
+)
+from .visitor import ScopedTransformer
+from ..nodes import (
+    NodeBase, NodeStatementBlock, NodeLoop, NodeFunctionDeclaration,
+    NodeVarDeclaration, NodeVarAssignment,
+    NodeExpressionBinary, NodeLiteral,
+)
+
+## Constants
+TEMPORARY_PREFIX: str = "__iv_"
+COMPARISON_SWAP_LUT: dict[NodeExpressionBinary.Type, NodeExpressionBinary.Type] = {
+    NodeExpressionBinary.Type.Lt: NodeExpressionBinary.Type.Gt,
+    NodeExpressionBinary.Type.Gt: NodeExpressionBinary.Type.Lt,
+    NodeExpressionBinary.Type.LtEq: NodeExpressionBinary.Type.GtEq,
+    NodeExpressionBinary.Type.GtEq: NodeExpressionBinary.Type.LtEq,
+    NodeExpressionBinary.Type.BangEq: NodeExpressionBinary.Type.BangEq,
+}
+
+
+## Functions
+def _number(node: NodeBase | None) -> int | None:
+    """
+    Returns the value of a number literal or None
+    """
+    if isinstance(node, NodeLiteral) and node.type is NodeLiteral.Type.Number:
+        assert isinstance(node.value, int)
+        return node.value
+    return None
+
+
+def trip_count(
+    start: int, step: int, comparison: NodeExpressionBinary.Type,
+    bound: int, run_before_eval: bool = False
+) -> int | None:
+    """
+    Returns how many times a counted loop's body runs or None if it never terminates
+    """
+    if run_before_eval:
+        rest = trip_count(start + step, step, comparison, bound)
+        return None if rest is None else rest + 1
+    match comparison:
+        case NodeExpressionBinary.Type.Lt:
+            if start >= bound:
+                return 0
+            return -((start - bound) // step) if step > 0 else None
+        case NodeExpressionBinary.Type.LtEq:
+            if start > bound:
+                return 0
+            return (bound - start) // step + 1 if step > 0 else None
+        case NodeExpressionBinary.Type.Gt:
+            if start <= bound:
+                return 0
+            return -((bound - start) // -step) if step < 0 else None
+        case NodeExpressionBinary.Type.GtEq:
+            if start < bound:
+                return 0
+            return (start - bound) // -step + 1 if step < 0 else None
+        case NodeExpressionBinary.Type.BangEq:
+            distance = bound - start
+            if distance % step != 0 or distance // step < 0:
+                return None
+            return distance // step
+    return None
+
+
+## Classes
+class InductionVariableAnalysis(ScopedTransformer):
+    """
+    Ember Middleware Pass: Induction Variable Analysis
+    - Recognizes counted loops `i cmp bound` where `i = i +/- c` is an
+    unconditional statement of the loop body and the only write to `i`
+    (and `i` is function-local when the loop calls functions)
+    Records a NodeLoop.Induction on each (with its trip count when the
+    start and bound are constant) and optionally strength-reduces
+    `i * k` for invariant `k` into a running sum updated after the increment
+    """
+
+    # -Constructor
+    def __init__(self, ast: list[NodeBase], strength_reduce: bool = True) -> None:
+        super().__init__()
+        self.ast: list[NodeBase] = ast
+        self.strength_reduce: bool = strength_reduce
+        self.loops: int = 0
+        self.reduced: int = 0
+        self._temporaries: int = 0
+        # -Statement being visited and the one preceding it in its list
+        self._predecessor: tuple[NodeBase | None, NodeBase | None] = (None, None)
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"InductionVariableAnalysis(loops={self.loops}, reduced={self.reduced})"
+
+    # -Instance Methods
+    def run(self) -> list[NodeBase]:
+        '''
+        Analyzes every loop in the AST, inner loops first
+        '''
+        self.ast[:] = self._visit_statements(self.ast)
+        return self.ast
+
+    def _visit_statements(self, statements: tuple[NodeBase, ...] | list[NodeBase]) -> list[NodeBase]:
+        '''
+        Visits a statement list passing each statement its predecessor
+        '''
+        visited: list[NodeBase] = []
+        for statement in statements:
+            self._predecessor = (statement, visited[-1] if visited else None)
+            visited.append(self.visit(statement))
+        return visited
+
+    def _visit_block(self, node: NodeStatementBlock) -> NodeBase:
+        self._scopes.append({})
+        node.nodes = tuple(self._visit_statements(node.nodes))
+        self._scopes.pop()
+        return node
+
+    def _visit_loop(self, node: NodeLoop) -> NodeBase:
+        statement, previous = self._predecessor
+        node.body = self.visit(node.body)
+        return self._analyze(node, previous if statement is node else None)
+
+    def _analyze(self, loop: NodeLoop, previous: NodeBase | None) -> NodeBase:
+        '''
+        Records the loop's induction variable if it is a counted loop
+        Returns the loop or the block holding its strength-reduced temporaries
+        '''
+        condition = loop.condition
+        if not (isinstance(condition, NodeExpressionBinary) and
+                condition.type in COMPARISON_SWAP_LUT):
+            return loop
+        written = symbols_written(loop)
+        protected = self.locals if calls(loop) else None
+        # -Condition: id cmp bound
+        _id, bound, comparison = identifier(condition.lhs), condition.rhs, condition.type
+        if _id is None or _id not in written:
+            _id, bound = identifier(condition.rhs), condition.lhs
+            comparison = COMPARISON_SWAP_LUT[condition.type]
+        if _id is None or not is_invariant(bound, written, protected):
+            return loop
+        # -A callee may write a global counter behind the loop's back
+        if protected is not None and _id not in protected:
+            return loop
+        # -Increment: the single unconditional write of id
+        statements = loop.body.nodes if isinstance(loop.body, NodeStatementBlock) else (loop.body,)
+        writes = [
+            node for node in walk(loop, False)
+            if (isinstance(node, NodeVarAssignment) and identifier(node.lvalue) == _id) or
+            (isinstance(node, NodeVarDeclaration) and node.id == _id)
+        ]
+        if len(writes) != 1 or not any(writes[0] is statement for statement in statements):
+            return loop
+        increment = writes[0]
+        if not isinstance(increment, NodeVarAssignment):
+            return loop
+        if (step := self._step(increment, _id)) is None:
+            return loop
+        # -Start: constant initializer directly preceding the loop
+        start: int | None = None
+        if isinstance(previous, NodeVarDeclaration) and previous.id == _id:
+            start = _number(previous.initializer)
+        elif isinstance(previous, NodeVarAssignment) and identifier(previous.lvalue) == _id:
+            start = _number(previous.rvalue)
+        count: int | None = None
+        if (start is not None and (limit := _number(bound)) is not None and
+                not any(is_return(node) for node in walk(loop.body, False))):
+            count = trip_count(start, step, comparison, limit, loop.run_before_eval)
+        loop.induction = NodeLoop.Induction(_id, start, step, comparison, bound, count)
+        self.loops += 1
+        if not self.strength_reduce:
+            return loop
+        return self._reduce(loop, increment, written, protected)
+
+    def _step(self, increment: NodeVarAssignment, _id: str) -> int | None:
+        '''
+        Returns c for `id = id + c`, `id = c + id` and `id = id - c` or None
+        '''
+        value = increment.rvalue
+        if not isinstance(value, NodeExpressionBinary):
+            return None
+        step: int | None = None
+        if value.type is NodeExpressionBinary.Type.Add:
+            if identifier(value.lhs) == _id:
+                step = _number(value.rhs)
+            elif identifier(value.rhs) == _id:
+                step = _number(value.lhs)
+        elif value.type is NodeExpressionBinary.Type.Sub and identifier(value.lhs) == _id:
+            step = _number(value.rhs)
+            step = -step if step is not None else None
+        return step if step else None
+
+    def _reduce(
+        self, loop: NodeLoop, increment: NodeVarAssignment,
+        written: set[str], protected: set[str] | None
+    ) -> NodeBase:
+        '''
+        Replaces `i * k` with a running temporary advanced by `step * k`
+        right after the increment; Returns the loop or the block holding it
+        '''
+        assert loop.induction is not None
+        induction = loop.induction
+        reductions: dict[str, tuple[str, NodeBase]] = {}
+
+        def replace(node: NodeBase) -> NodeBase:
+            if node is increment or isinstance(node, NodeFunctionDeclaration):
+                return node
+            if (isinstance(node, NodeExpressionBinary) and
+                    node.type is NodeExpressionBinary.Type.Mul):
+                factor: NodeBase | None = None
+                if identifier(node.lhs) == induction.id:
+                    factor = node.rhs
+                elif identifier(node.rhs) == induction.id:
+                    factor = node.lhs
+                if factor is not None and is_invariant(factor, written, protected):
+                    key = str(factor)
+                    if key not in reductions:
+                        reductions[key] = (f"{TEMPORARY_PREFIX}{self._temporaries}", factor)
+                        self._temporaries += 1
+                    self.reduced += 1
+                    return build_identifier((node.file, node.position), reductions[key][0])
+            return map_children(node, replace)
+
+        map_children(loop, replace)
+        if not reductions:
+            return loop
+        context = (increment.lvalue.file, increment.lvalue.position)  # type: ignore[attr-defined]
+        declarations: list[NodeBase] = []
+        updates: list[NodeBase] = []
+        for _id, factor in reductions.values():
+            declarations.append(NodeVarDeclaration(*context, _id, NodeExpressionBinary(
+                *context, NodeExpressionBinary.Type.Mul,
+                build_identifier(context, induction.id), clone(factor)
+            )))
+            delta: NodeBase
+            if (constant := _number(factor)) is not None:
+                delta = build_number(context, induction.step * constant)
+            else:
+                step: NodeBase = clone(factor)
+                if induction.step != 1:
+                    step = NodeExpressionBinary(
+                        *context, NodeExpressionBinary.Type.Mul,
+                        step, build_number(context, induction.step)
+                    )
+                declarations.append(NodeVarDeclaration(*context, _id + "_step", step))
+                delta = build_identifier(context, _id + "_step")
+            updates.append(build_assignment(context, _id, NodeExpressionBinary(
+                *context, NodeExpressionBinary.Type.Add, build_identifier(context, _id), delta
+            )))
+        # -Advance temporaries right after the increment
+        statements: list[NodeBase] = []
+        body = loop.body.nodes if isinstance(loop.body, NodeStatementBlock) else (loop.body,)
+        for statement in body:
+            statements.append(statement)
+            if statement is increment:
+                statements.extend(updates)
+        loop.body = NodeStatementBlock(tuple(statements))
+        return NodeStatementBlock((*declarations, loop))
@@ -0,0 +1,433 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Function Inlining     ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from collections import Counter
+
+from .callgraph import CallGraph
+from .common import (
+    Type_Context, children, walk, evaluation_order, map_children, clone,
+    callee, identifier, is_return, is_pure, is_pure_node, definitely_returns,
+    build_identifier, build_number, build_boolean, build_assignment,
+)
+from ..profile import Profile
+from ..nodes import (
+    NodeBase, NodeStatementBlock, NodeConditional, NodeLoop,
+    NodeFunctionDeclaration, NodeFunctionCall,
+    NodeVarDeclaration, NodeVarAssignment,
+    NodeExpressionUnary, NodeLiteral,
+)
+
+## Constants
+TEMPORARY_PREFIX: str = "__inl"
+
+
+## Functions
+def _substitute(node: NodeBase, target: NodeBase, replacement: NodeBase) -> NodeBase:
+    """
+    Replaces a node found by identity within a subtree; Returns the subtree
+    """
+    if node is target:
+        return replacement
+    if isinstance(node, NodeFunctionDeclaration):
+        return node
+    return map_children(node, lambda child: _substitute(child, target, replacement))
+
+
+## Classes
+class FunctionInliner:
+    """
+    Ember Middleware Pass: Function Inlining
+    - Replaces calls to small non-recursive top-level functions with
+    their bodies using fresh names for parameters and locals
+    Callees are processed before their callers so inlined bodies are
+    already optimized; early returns assign the result and set a done
+    flag guarding the rest of the body (callees returning inside loops
+    are not inlined since Ember has no way to exit a loop early)
+    Calls nested in expressions are hoisted in front of their statement
+    only when nothing else in it has side effects and the callee writes
+    no symbols of its own
+
+    Cost model: a callee is inlined when its body node count is within
+    threshold, or single_site_threshold when it has only one call site
+    With a profile, call sites never executed are left alone and sites
+    taking at least hot_share of all profiled calls may inline callees
+    up to hot_threshold nodes
+    """
+
+    # -Constructor
+    def __init__(
+        self, ast: list[NodeBase], threshold: int = 32, single_site_threshold: int = 128,
+        graph: CallGraph | None = None, profile: Profile | None = None,
+        hot_threshold: int = 128, hot_share: float = 0.05
+    ) -> None:
+        self.ast: list[NodeBase] = ast
+        self.graph: CallGraph | None = graph
+        self.profile: Profile | None = profile
+        self.threshold: int = threshold
+        self.single_site_threshold: int = single_site_threshold
+        self.hot_threshold: int = hot_threshold
+        self.hot_share: float = hot_share
+        self.inlined: int = 0
+        self.sites: dict[str, int] = {}
+        self._functions: dict[str, NodeFunctionDeclaration] = {}
+        self._candidates: dict[str, tuple[set[str], bool]] = {}
+        self._sizes: dict[str, int] = {}
+        self._recursive: set[str] = set()
+        self._call_sites: Counter[str] = Counter()
+        self._scopes: list[set[str]] = []
+        self._expansions: int = 0
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"FunctionInliner(threshold={self.threshold}, inlined={self.inlined})"
+
+    # -Instance Methods
+    def run(self) -> list[NodeBase]:
+        '''
+        Inlines eligible calls throughout the AST
+        Returns the AST and records inlined call counts per callee
+        '''
+        graph = self.graph if self.graph is not None else CallGraph(self.ast)
+        self._functions = graph.functions
+        self._recursive = {_id for _id in graph.functions if graph.is_recursive(_id)}
+        self._call_sites = Counter(
+            _callee for statement in self.ast for node in walk(statement)
+            if (_callee := callee(node)) is not None
+        )
+        # -Callees before callers
+        order = graph.order()
+        for _id in order:
+            function = self._functions[_id]
+            self._scopes = [set(function.parameters or ())]
+            function.body = self._inline_block(function.body)
+            self._analyze(function)
+        # -Top-level statements
+        self._scopes = []
+        self.ast[:] = self._inline_statements(self.ast)
+        return self.ast
+
+    def _analyze(self, function: NodeFunctionDeclaration) -> None:
+        '''
+        Records a processed function as an inlining candidate if eligible
+        Candidates keep their free symbols and whether they only touch locals
+        '''
+        if function.id in self._recursive:
+            return
+        size = sum(1 for _ in walk(function.body))
+        limit = self._limit(function.id)
+        if self.profile is not None:
+            limit = max(limit, self.hot_threshold)
+        if size > limit:
+            return
+        for node in walk(function.body, False):
+            if isinstance(node, NodeFunctionDeclaration):
+                return
+            if isinstance(node, NodeLoop) and any(is_return(child) for child in walk(node, False)):
+                return
+        free: set[str] = set()
+        written: set[str] = set()
+        self._rename(clone(function.body), [{p: p for p in function.parameters or ()}], free, written)
+        local = not written and not any(isinstance(node, NodeFunctionCall)
+                                         for node in walk(function.body, False))
+        self._candidates[function.id] = (free, local)
+        self._sizes[function.id] = size
+
+    def _limit(self, _id: str) -> int:
+        return self.single_site_threshold if self._call_sites[_id] == 1 else self.threshold
+
+    def _profitable(self, call: NodeFunctionCall, _id: str) -> bool:
+        '''
+        Checks a call site against the profile: cold sites are not worth
+        the code growth and callees over the static limit need a hot site
+        '''
+        if self.profile is None:
+            return True
+        if not self.profile.call_count(call):
+            return False
+        return (self._sizes[_id] <= self._limit(_id) or
+                self.profile.call_share(call) >= self.hot_share)
+
+    # --Statements
+    def _inline_block(self, node: NodeBase) -> NodeBase:
+        '''
+        Inlines calls in a block or single statement keeping its scope
+        '''
+        if isinstance(node, NodeStatementBlock):
+            self._scopes.append(set())
+            node.nodes = tuple(self._inline_statements(node.nodes))
+            self._scopes.pop()
+            return node
+        statements = self._inline_statements((node,))
+        return statements[0] if len(statements) == 1 else NodeStatementBlock(tuple(statements))
+
+    def _inline_statements(self, statements: tuple[NodeBase, ...] | list[NodeBase]) -> list[NodeBase]:
+        '''
+        Inlines calls in a statement list splicing expanded bodies in front
+        of the statement using their result
+        '''
+        inlined: list[NodeBase] = []
+        for statement in statements:
+            if isinstance(statement, NodeFunctionDeclaration):
+                inlined.append(statement)
+                continue
+            if isinstance(statement, NodeStatementBlock):
+                inlined.append(self._inline_block(statement))
+                continue
+            if isinstance(statement, NodeLoop):
+                statement.body = self._inline_block(statement.body)
+                inlined.append(statement)
+                continue
+            inlined.extend(self._inline_statement(statement))
+            if isinstance(statement, NodeConditional):
+                statement.true_block = self._inline_block(statement.true_block)
+                if statement.false_block is not None:
+                    statement.false_block = self._inline_block(statement.false_block)
+            elif isinstance(statement, NodeVarDeclaration) and self._scopes:
+                self._scopes[-1].add(statement.id)
+        return inlined
+
+    def _inline_statement(self, statement: NodeBase) -> list[NodeBase]:
+        '''
+        Repeatedly expands the first extractable call of a statement
+        Returns the expansions followed by the rewritten statement
+        '''
+        expanded: list[NodeBase] = []
+        while (expression := self._expression(statement)) is not None:
+            if (call := self._find_call(expression)) is None:
+                break
+            used = call is not statement
+            expanded.extend(self._expand(call, used))
+            if not used:
+                return expanded
+            assert isinstance(call.callee, NodeLiteral)
+            result = build_identifier(
+                (call.callee.file, call.callee.position), self._result_id(self._expansions - 1)
+            )
+            statement = _substitute(statement, call, result)
+        expanded.append(statement)
+        return expanded
+
+    def _expression(self, statement: NodeBase) -> NodeBase | None:
+        '''
+        Returns the part of a statement evaluated once before anything else
+        '''
+        if isinstance(statement, NodeConditional):
+            return statement.condition
+        elif isinstance(statement, NodeVarDeclaration):
+            return statement.initializer
+        elif isinstance(statement, NodeVarAssignment):
+            return statement.rvalue
+        elif is_return(statement):
+            assert isinstance(statement, NodeExpressionUnary)
+            return statement.node
+        return statement
+
+    def _find_call(self, expression: NodeBase) -> NodeFunctionCall | None:
+        '''
+        Finds the first call in evaluation order that can be expanded in
+        front of its statement
+        '''
+        visible = set().union(*self._scopes)
+        for call in evaluation_order(expression):
+            if not isinstance(call, NodeFunctionCall):
+                continue
+            _id = callee(call)
+            if _id is None or _id not in self._candidates:
+                continue
+            if call.argument_count != self._functions[_id].arity:
+                continue
+            if not self._profitable(call, _id):
+                continue
+            free, local = self._candidates[_id]
+            if free & visible:
+                continue
+            if call is expression:
+                return call
+            if self._effect_free(call) and self._pure_except(expression, call):
+                return call
+        return None
+
+    def _effect_free(self, call: NodeFunctionCall) -> bool:
+        '''
+        Checks if a call writes nothing; its callee must be a local candidate
+        '''
+        _id = callee(call)
+        return (_id in self._candidates and self._candidates[_id][1] and
+                all(is_pure(argument) for argument in call.arguments or ()))
+
+    def _pure_except(self, expression: NodeBase, call: NodeBase) -> bool:
+        '''
+        Checks if everything in an expression outside of a call's subtree is
+        pure or an effect-free call, so the call may be evaluated first
+        '''
+        stack: list[NodeBase] = [expression]
+        while stack:
+            node = stack.pop()
+            if node is call:
+                continue
+            if isinstance(node, NodeFunctionCall) and self._effect_free(node):
+                continue
+            if not is_pure_node(node):
+                return False
+            stack.extend(children(node))
+        return True
+
+    # --Expansion
+    def _result_id(self, expansion: int) -> str:
+        return f"{TEMPORARY_PREFIX}{expansion}_return"
+
+    def _expand(self, call: NodeFunctionCall, used: bool) -> list[NodeBase]:
+        '''
+        Expands a call into its renamed body block preceded by the
+        result declaration if the value is used
+        '''
+        _id = callee(call)
+        assert _id is not None and isinstance(call.callee, NodeLiteral)
+        function = self._functions[_id]
+        context: Type_Context = (call.callee.file, call.callee.position)
+        prefix = f"{TEMPORARY_PREFIX}{self._expansions}_"
+        result = self._result_id(self._expansions)
+        flag = prefix + "done"
+        self._expansions += 1
+        self.inlined += 1
+        self.sites[_id] = self.sites.get(_id, 0) + 1
+        # -Parameters
+        statements: list[NodeBase] = []
+        names: dict[str, str] = {}
+        types = function.parameter_types or (None,) * function.arity
+        for parameter, _type, argument in zip(
+            function.parameters or (), types, call.arguments or ()
+        ):
+            names[parameter] = prefix + parameter
+            statements.append(NodeVarDeclaration(*context, prefix + parameter, argument, _type))
+        # -Body
+        body = clone(function.body)
+        self._rename(body, [names], set(), set(), prefix)
+        nodes = body.nodes if isinstance(body, NodeStatementBlock) else (body,)
+        guarded = self._returns_early(nodes)
+        if guarded:
+            statements.append(NodeVarDeclaration(*context, flag, build_boolean(context, False)))
+        statements.extend(self._rewrite_returns(
+            nodes, context, result if used else None, flag if guarded else None
+        ))
+        expanded: list[NodeBase] = []
+        if used:
+            expanded.append(NodeVarDeclaration(
+                *context, result, build_number(context, 0), function.return_type
+            ))
+        expanded.append(NodeStatementBlock(tuple(statements)))
+        return expanded
+
+    def _rename(
+        self, node: NodeBase, scopes: list[dict[str, str]],
+        free: set[str], written: set[str], prefix: str | None = None
+    ) -> NodeBase:
+        '''
+        Renames parameters and locals in a cloned body following scopes
+        Collects free symbols and free symbols written; Returns the node
+        '''
+        if isinstance(node, NodeStatementBlock):
+            scopes.append({})
+            node.nodes = tuple(self._rename(child, scopes, free, written, prefix)
+                               for child in node.nodes)
+            scopes.pop()
+            return node
+        elif isinstance(node, NodeVarDeclaration):
+            if node.initializer is not None:
+                node.initializer = self._rename(node.initializer, scopes, free, written, prefix)
+            scopes[-1][node.id] = prefix + node.id if prefix else node.id
+            node.id = scopes[-1][node.id]
+            return node
+        elif isinstance(node, NodeFunctionCall):
+            if node.arguments:
+                node.arguments = tuple(self._rename(argument, scopes, free, written, prefix)
+                                       for argument in node.arguments)
+            return node
+        elif isinstance(node, NodeVarAssignment):
+            if (_id := identifier(node.lvalue)) is not None and not any(_id in s for s in scopes):
+                written.add(_id)
+        elif (_id := identifier(node)) is not None:
+            for scope in reversed(scopes):
+                if _id in scope:
+                    node.value = scope[_id]
+                    return node
+            free.add(_id)
+            return node
+        return map_children(node, lambda child: self._rename(child, scopes, free, written, prefix))
+
+    def _returns_early(self, statements: tuple[NodeBase, ...]) -> bool:
+        '''
+        Checks if any return may be followed by more statements
+        '''
+        for index, statement in enumerate(statements):
+            if definitely_returns(statement):
+                return self._returns_early_within(statement)
+            if any(is_return(node) for node in walk(statement, False)):
+                if index < len(statements) - 1 or self._returns_early_within(statement):
+                    return True
+        return False
+
+    def _returns_early_within(self, statement: NodeBase) -> bool:
+        if isinstance(statement, NodeStatementBlock):
+            return self._returns_early(statement.nodes)
+        elif isinstance(statement, NodeConditional):
+            return (self._returns_early_within(statement.true_block) or
+                    (statement.false_block is not None and
+                     self._returns_early_within(statement.false_block)))
+        return False
+
+    def _rewrite_returns(
+        self, statements: tuple[NodeBase, ...], context: Type_Context,
+        result: str | None, flag: str | None
+    ) -> list[NodeBase]:
+        '''
+        Rewrites returns into result assignments; statements after a
+        possible return are guarded by the done flag and after a definite
+        return dropped
+        '''
+        rewritten: list[NodeBase] = []
+        for index, statement in enumerate(statements):
+            returns = any(is_return(node) for node in walk(statement, False))
+            ends = definitely_returns(statement)
+            rewritten.append(self._rewrite_return(statement, context, result, flag))
+            if ends:
+                break
+            if returns and flag is not None and index < len(statements) - 1:
+                guard = NodeExpressionUnary(
+                    *context, NodeExpressionUnary.Type.Not, build_identifier(context, flag)
+                )
+                rest = self._rewrite_returns(statements[index + 1:], context, result, flag)
+                rewritten.append(NodeConditional(guard, NodeStatementBlock(tuple(rest)), None))
+                break
+        return rewritten
+
+    def _rewrite_return(
+        self, statement: NodeBase, context: Type_Context,
+        result: str | None, flag: str | None
+    ) -> NodeBase:
+        if is_return(statement):
+            assert isinstance(statement, NodeExpressionUnary)
+            statements: list[NodeBase] = [
+                build_assignment(context, result, statement.node) if result else statement.node
+            ]
+            if flag is not None:
+                statements.append(build_assignment(context, flag, build_boolean(context, True)))
+            return NodeStatementBlock(tuple(statements))
+        elif isinstance(statement, NodeStatementBlock):
+            return NodeStatementBlock(tuple(
+                self._rewrite_returns(statement.nodes, context, result, flag)
+            ))
+        elif isinstance(statement, NodeConditional):
+            statement.true_block = self._rewrite_return(statement.true_block, context, result, flag)
+            if statement.false_block is not None:
+                statement.false_block = self._rewrite_return(
+                    statement.false_block, context, result, flag
+                )
+        return statement
@@ -0,0 +1,103 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Interval Arithmetic   ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from ..nodes import NodeExpressionBinary, NodeExpressionUnary, DataType
+
+## Constants
+Type_Interval = tuple[int, int]
+BOOLEAN: Type_Interval = (0, 1)
+COMPARISONS: tuple[NodeExpressionBinary.Type, ...] = (
+    NodeExpressionBinary.Type.Lt, NodeExpressionBinary.Type.Gt,
+    NodeExpressionBinary.Type.LtEq, NodeExpressionBinary.Type.GtEq,
+    NodeExpressionBinary.Type.EqEq, NodeExpressionBinary.Type.BangEq,
+)
+
+
+## Functions
+def _divide(lhs: int, rhs: int) -> int:
+    """
+    Integer division truncating towards zero
+    """
+    quotient = abs(lhs) // abs(rhs)
+    return quotient if (lhs < 0) == (rhs < 0) else -quotient
+
+
+def of_type(data_type: DataType) -> Type_Interval:
+    """
+    Returns the interval of every value a type can hold
+    """
+    return (data_type.minimum, data_type.maximum)
+
+
+def contains(outer: Type_Interval, inner: Type_Interval) -> bool:
+    """
+    Checks if an interval lies within another
+    """
+    return outer[0] <= inner[0] and inner[1] <= outer[1]
+
+
+def union(lhs: Type_Interval, rhs: Type_Interval) -> Type_Interval:
+    """
+    Returns the smallest interval holding both intervals
+    """
+    return (min(lhs[0], rhs[0]), max(lhs[1], rhs[1]))
+
+
+def intersect(lhs: Type_Interval, rhs: Type_Interval) -> Type_Interval | None:
+    """
+    Returns the overlap of two intervals or None if they are disjoint
+    """
+    low, high = max(lhs[0], rhs[0]), min(lhs[1], rhs[1])
+    return (low, high) if low <= high else None
+
+
+def binary(
+    operator: NodeExpressionBinary.Type, lhs: Type_Interval, rhs: Type_Interval
+) -> Type_Interval:
+    """
+    Returns the interval of a binary operation over operand intervals
+    Divisors of zero trap so they are left out of division and modulo
+    """
+    if operator in COMPARISONS:
+        return BOOLEAN
+    match operator:
+        case NodeExpressionBinary.Type.Add:
+            return (lhs[0] + rhs[0], lhs[1] + rhs[1])
+        case NodeExpressionBinary.Type.Sub:
+            return (lhs[0] - rhs[1], lhs[1] - rhs[0])
+        case NodeExpressionBinary.Type.Mul:
+            products = [a * b for a in lhs for b in rhs]
+            return (min(products), max(products))
+        case NodeExpressionBinary.Type.Div:
+            divisors = [
+                divisor for divisor in (rhs[0], rhs[1], -1, 1)
+                if divisor != 0 and rhs[0] <= divisor <= rhs[1]
+            ]
+            if not divisors:
+                return (0, 0)
+            quotients = [_divide(a, b) for a in lhs for b in divisors]
+            return (min(quotients), max(quotients))
+        case NodeExpressionBinary.Type.Mod:
+            magnitude = max(abs(rhs[0]), abs(rhs[1])) - 1
+            return (min(0, max(lhs[0], -magnitude)), max(0, min(lhs[1], magnitude)))
+    raise NotImplementedError(f"Unhandled type '{operator.name}'")
+
+
+def unary(operator: NodeExpressionUnary.Type, value: Type_Interval) -> Type_Interval:
+    """
+    Returns the interval of a unary operation over an operand interval
+    """
+    match operator:
+        case NodeExpressionUnary.Type.Not:
+            return BOOLEAN
+        case NodeExpressionUnary.Type.Negate:
+            return (-value[1], -value[0])
+    raise NotImplementedError(f"Unhandled type '{operator.name}'")
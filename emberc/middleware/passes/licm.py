@@ -0,0 +1,95 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Loop Invariant Motion ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from .common import (
+    map_children, clone, calls, is_invariant, symbols_written, build_identifier,
+)
+from .visitor import ScopedTransformer
+from ..nodes import (
+    NodeBase, NodeStatementBlock, NodeConditional, NodeLoop,
+    NodeFunctionDeclaration, NodeVarDeclaration,
+    NodeExpressionBinary, NodeExpressionUnary, NodeExpressionCast,
+)
+
+## Constants
+TEMPORARY_PREFIX: str = "__licm_"
+
+
+## Classes
+class LoopInvariantCodeMotion(ScopedTransformer):
+    """
+    Ember Middleware Pass: Loop-Invariant Code Motion
+    - Hoists pure subexpressions of a loop's condition and body whose
+    operands are never written inside the loop into temporaries
+    computed once before it
+    While loops are rotated into a guarded do..while so hoisted values
+    are only computed when the body runs at least once; do..while loops
+    (run_before_eval) already do and hoist directly
+    If the loop calls functions only symbols local to the enclosing
+    function are considered invariant since calls may write globals
+    """
+
+    # -Constructor
+    def __init__(self, ast: list[NodeBase]) -> None:
+        super().__init__()
+        self.ast: list[NodeBase] = ast
+        self.hoisted: int = 0
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"LoopInvariantCodeMotion(hoisted={self.hoisted})"
+
+    # -Instance Methods
+    def run(self) -> list[NodeBase]:
+        '''
+        Hoists invariant expressions out of every loop in the AST
+        Inner loops are handled first so their temporaries can move further out
+        '''
+        return self.transform(self.ast)
+
+    def _visit_loop(self, node: NodeLoop) -> NodeBase:
+        node.body = self.visit(node.body)
+        return self._hoist(node)
+
+    def _hoist(self, loop: NodeLoop) -> NodeBase:
+        '''
+        Replaces a loop's invariant expressions with temporaries
+        Returns the loop or the block/guard wrapping it
+        '''
+        written = symbols_written(loop)
+        protected = self.locals if calls(loop) else None
+        hoisted: dict[str, tuple[str, NodeBase]] = {}
+
+        def replace(node: NodeBase) -> NodeBase:
+            if isinstance(node, NodeFunctionDeclaration):
+                return node
+            if (isinstance(node, (
+                NodeExpressionBinary, NodeExpressionUnary, NodeExpressionCast
+            )) and is_invariant(node, written, protected)):
+                key = str(node)
+                if key not in hoisted:
+                    hoisted[key] = (f"{TEMPORARY_PREFIX}{self.hoisted + len(hoisted)}", node)
+                return build_identifier((node.file, node.position), hoisted[key][0])
+            return map_children(node, replace)
+
+        guard = clone(loop.condition) if not loop.run_before_eval else None
+        map_children(loop, replace)
+        if not hoisted:
+            return loop
+        self.hoisted += len(hoisted)
+        declarations = tuple(
+            NodeVarDeclaration(node.file, node.position, _id, node)  # type: ignore[attr-defined]
+            for _id, node in hoisted.values()
+        )
+        if guard is None:
+            return NodeStatementBlock((*declarations, loop))
+        loop.run_before_eval = True
+        return NodeConditional(guard, NodeStatementBlock((*declarations, loop)), None)
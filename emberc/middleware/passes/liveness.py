@@ -0,0 +1,194 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Liveness / Slots      ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import heapq
+
+from .common import functions, children, identifier
+from ..nodes import (
+    NodeBase, NodeStatementBlock, NodeLoop,
+    NodeFunctionDeclaration, NodeVarDeclaration, DataType,
+)
+
+## Constants
+WORD_BYTES: int = 8  # -width of an untyped slot
+
+
+## Functions
+def _width(data_type: DataType | None) -> int:
+    """
+    Returns the bytes a value of the given type occupies in a slot
+    """
+    if data_type is None:
+        return WORD_BYTES
+    return max(1, data_type.bits // 8)
+
+
+## Classes
+class StackSlotAllocator:
+    """
+    Ember Middleware Pass: Liveness Analysis / Stack Slot Allocation
+    - Numbers every node of a function body in evaluation order and computes
+    the live interval of each parameter and local from its definition to
+    its last use; locals live on entry to a loop and used inside it are kept
+    alive until the loop ends since the back edge reads them again
+    Intervals that never overlap are coloured into a shared frame slot
+    (greedy by start point, optimal for interval graphs) and the slot is
+    annotated on every declaration (node.slot, function.parameter_slots)
+    along with the function's frame size (function.frame_size)
+
+    fn f() { { int32 a = 1; g(a); } { int32 b = 2; g(b); } } => a, b: slot 0
+    """
+
+    # -Constructor
+    def __init__(self, ast: list[NodeBase]) -> None:
+        self.ast: list[NodeBase] = ast
+        self.frames: list[StackSlotAllocator.Frame] = []
+        self._point: int = 0
+        self._scopes: list[dict[str, int]] = []
+        self._intervals: list[list[int]] = []
+        self._loops: list[tuple[int, int]] = []
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"StackSlotAllocator(frames={len(self.frames)}, "
+                f"naive={sum(frame.naive for frame in self.frames)}, "
+                f"shared={sum(frame.size for frame in self.frames)})")
+
+    # -Instance Methods
+    def run(self) -> list[NodeBase]:
+        '''
+        Allocates a frame for every function (nested ones get their own)
+        '''
+        self.frames = [self._allocate(function) for function in functions(self.ast)]
+        return self.ast
+
+    def report(self) -> dict[str, tuple[int, int, int]]:
+        '''
+        Returns (naive slots, shared slots, shared bytes) per function
+        '''
+        return {frame.id: (frame.naive, frame.size, frame.bytes) for frame in self.frames}
+
+    def _allocate(self, function: NodeFunctionDeclaration) -> StackSlotAllocator.Frame:
+        '''
+        Computes live intervals for a function and colours them into slots
+        '''
+        parameters = function.parameters or ()
+        self._point = 1  # -point 0 is the entry defining parameters
+        self._scopes = [{parameter: index for index, parameter in enumerate(parameters)}]
+        self._intervals = [[0, 0] for _ in parameters]
+        self._loops = []
+        declarations: list[NodeVarDeclaration | None] = [None] * len(parameters)
+        widths: list[int] = [
+            _width(_type) for _type in (function.parameter_types or (None,) * len(parameters))
+        ]
+        self._visit(function.body, function, declarations, widths)
+        # -Loops are recorded innermost first so extensions carry outwards
+        for start, end in self._loops:
+            for interval in self._intervals:
+                if interval[0] < start <= interval[1] < end:
+                    interval[1] = end
+        slots = self._colour()
+        slot_bytes = [0] * (max(slots, default=-1) + 1)
+        for slot, width in zip(slots, widths):
+            slot_bytes[slot] = max(slot_bytes[slot], width)
+        for slot, declaration in zip(slots, declarations):
+            if declaration is not None:
+                declaration.slot = slot
+        function.parameter_slots = tuple(slots[:len(parameters)])
+        function.frame_size = len(slot_bytes)
+        return StackSlotAllocator.Frame(
+            function.id, len(slots), tuple(slot_bytes),
+            tuple((interval[0], interval[1]) for interval in self._intervals)
+        )
+
+    def _colour(self) -> list[int]:
+        '''
+        Greedy interval colouring reusing the lowest free slot
+        '''
+        slots: list[int] = [0] * len(self._intervals)
+        active: list[tuple[int, int]] = []
+        free: list[int] = []
+        count = 0
+        order = sorted(range(len(self._intervals)), key=lambda index: self._intervals[index][0])
+        for index in order:
+            start, end = self._intervals[index]
+            while active and active[0][0] < start:
+                heapq.heappush(free, heapq.heappop(active)[1])
+            if free:
+                slot = heapq.heappop(free)
+            else:
+                slot, count = count, count + 1
+            slots[index] = slot
+            heapq.heappush(active, (end, slot))
+        return slots
+
+    def _visit(
+        self, node: NodeBase, function: NodeFunctionDeclaration,
+        declarations: list[NodeVarDeclaration | None], widths: list[int]
+    ) -> None:
+        '''
+        Numbers a node's subtree extending intervals of the symbols it touches
+        Nested functions are skipped since they run in their own frame
+        '''
+        if isinstance(node, NodeFunctionDeclaration) and node is not function:
+            return
+        if isinstance(node, NodeStatementBlock):
+            self._scopes.append({})
+        start = self._point
+        for child in children(node):
+            self._visit(child, function, declarations, widths)
+        self._point += 1
+        if isinstance(node, NodeStatementBlock):
+            self._scopes.pop()
+        elif isinstance(node, NodeLoop):
+            self._loops.append((start, self._point))
+        elif isinstance(node, NodeVarDeclaration):
+            self._scopes[-1][node.id] = len(self._intervals)
+            self._intervals.append([self._point, self._point])
+            declarations.append(node)
+            widths.append(_width(node.data_type))
+        elif (_id := identifier(node)) is not None:
+            for scope in reversed(self._scopes):
+                if _id in scope:
+                    interval = self._intervals[scope[_id]]
+                    interval[1] = max(interval[1], self._point)
+                    break
+
+    # -Sub-Classes
+    class Frame:
+        '''
+        Ember Stack Frame
+        - Slot layout of one function: each slot is as wide as the
+        widest value sharing it; naive is one slot per parameter and local
+        '''
+
+        # -Constructor
+        def __init__(
+            self, _id: str, naive: int, slots: tuple[int, ...],
+            intervals: tuple[tuple[int, int], ...]
+        ) -> None:
+            self.id: str = _id
+            self.naive: int = naive
+            self.slots: tuple[int, ...] = slots
+            self.intervals: tuple[tuple[int, int], ...] = intervals
+
+        # -Dunder Methods
+        def __repr__(self) -> str:
+            return (f"StackSlotAllocator.Frame(id={self.id}, naive={self.naive}, "
+                    f"size={self.size}, bytes={self.bytes})")
+
+        # -Properties
+        @property
+        def size(self) -> int:
+            return len(self.slots)
+
+        @property
+        def bytes(self) -> int:
+            return sum(self.slots)
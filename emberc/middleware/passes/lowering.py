@@ -0,0 +1,314 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Typed Lowering        ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from . import interval
+from .common import unshare_all, functions, context, identifier, callee, is_return
+from .interval import Type_Interval
+from ..nodes import (
+    NodeBase, NodeStatementBlock, NodeConditional, NodeLoop,
+    NodeFunctionDeclaration, NodeFunctionCall,
+    NodeVarDeclaration, NodeVarAssignment,
+    NodeExpressionBinary, NodeExpressionUnary, NodeExpressionCast, NodeLiteral,
+    DataType,
+)
+
+## Constants
+Type_Typed = tuple[NodeBase, Type_Interval | None]
+COMPARISON_TYPES: tuple[DataType, ...] = (
+    DataType.Int8, DataType.Int16, DataType.Int32, DataType.Int64, DataType.UInt64,
+)
+
+
+## Functions
+def _constant(node: NodeBase) -> int | None:
+    """
+    Returns the value of a number literal or a negated one or None
+    """
+    if isinstance(node, NodeExpressionUnary) and node.type is NodeExpressionUnary.Type.Negate:
+        value = _constant(node.node)
+        return -value if value is not None else None
+    if isinstance(node, NodeLiteral) and node.type is NodeLiteral.Type.Number:
+        assert isinstance(node.value, int)
+        return node.value
+    return None
+
+
+## Classes
+class TypeCheckError(Exception):
+    """
+    Ember Language Type Error
+    - Raised when typed lowering finds an ill-typed program
+    """
+    pass
+
+
+class TypedLowering:
+    """
+    Ember Middleware Pass: Typed Fixed-Width Lowering
+    - Infers and checks a fixed-width data type for every expression and
+    annotates it (node.data_type) so engines can use unboxed machine
+    arithmetic; values wrap as two's complement in that type
+    Operands are promoted to their common type (at least int32) and
+    explicit casts are inserted only where a value's possible range does
+    not fit its destination: operands, assignments, arguments, returns
+    and operation results
+    Comparisons use the smallest type holding both operands' ranges
+
+    int8 a = b + 1 (int8 b) => int8 a = int8(b + 1)
+    int32 c = b + 1 (int8 b) => int32 c = b + 1
+    """
+
+    # -Constructor
+    def __init__(self, ast: list[NodeBase]) -> None:
+        self.ast: list[NodeBase] = ast
+        self.typed: int = 0
+        self.casts: int = 0
+        self._functions: dict[str, NodeFunctionDeclaration] = {}
+        self._scopes: list[dict[str, DataType]] = []
+        self._return: DataType | None = None
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"TypedLowering(typed={self.typed}, casts={self.casts})"
+
+    # -Instance Methods
+    def run(self) -> list[NodeBase]:
+        '''
+        Types every expression in the AST inserting casts where needed
+        Raises TypeCheckError on an ill-typed program
+        Hash-consed trees are unshared first: shared nodes may need
+        different types and casts at each occurrence
+        '''
+        unshare_all(self.ast)
+        self._functions = {function.id: function for function in functions(self.ast)}
+        self._scopes = [{
+            node.id: node.data_type for node in self.ast
+            if isinstance(node, NodeVarDeclaration) and node.data_type is not None
+        }]
+        self.ast[:] = [self._statement(node) for node in self.ast]
+        return self.ast
+
+    def _error(self, node: NodeBase, message: str) -> TypeCheckError:
+        '''
+        Builds a type error located at the node's file/position
+        '''
+        location = context(node)
+        if location is None:
+            return TypeCheckError(message)
+        return TypeCheckError(f"{location[0]}:{location[1][0]}:{location[1][1]}: {message}")
+
+    def _lookup(self, node: NodeBase, _id: str) -> DataType:
+        '''
+        Gets a symbol's type from the innermost scope declaring it
+        '''
+        for scope in reversed(self._scopes):
+            if _id in scope:
+                return scope[_id]
+        raise self._error(node, f"Use of undeclared symbol '{_id}'")
+
+    # --Statements
+    def _statement(self, node: NodeBase) -> NodeBase:
+        '''
+        Types a statement; Returns the node or its replacement
+        '''
+        if isinstance(node, NodeStatementBlock):
+            self._scopes.append({})
+            node.nodes = tuple(self._statement(child) for child in node.nodes)
+            self._scopes.pop()
+        elif isinstance(node, NodeConditional):
+            node.condition = self._value(node.condition)[0]
+            node.true_block = self._statement(node.true_block)
+            if node.false_block is not None:
+                node.false_block = self._statement(node.false_block)
+        elif isinstance(node, NodeLoop):
+            node.condition = self._value(node.condition)[0]
+            node.body = self._statement(node.body)
+        elif isinstance(node, NodeFunctionDeclaration):
+            self._function(node)
+        elif isinstance(node, NodeVarDeclaration):
+            self._declaration(node)
+        elif is_return(node):
+            assert isinstance(node, NodeExpressionUnary)
+            if self._return is None:
+                raise self._error(node, "Return outside of a function")
+            if self._return is DataType.Void:
+                raise self._error(node, "Void function returns a value")
+            node.node = self._convert(node.node, self._return)
+        else:
+            return self._expression(node)[0]
+        return node
+
+    def _function(self, node: NodeFunctionDeclaration) -> None:
+        '''
+        Types a function body in a frame of its parameters and the globals
+        '''
+        if node.return_type is None:
+            raise self._error(node, f"Function '{node.id}' has an unknown return type")
+        frame: dict[str, DataType] = {}
+        types = node.parameter_types or (None,) * node.arity
+        for parameter, _type in zip(node.parameters or (), types):
+            if _type is None or _type is DataType.Void:
+                raise self._error(
+                    node, f"Parameter '{parameter}' of '{node.id}' has no value type"
+                )
+            frame[parameter] = _type
+        scopes, _return = self._scopes, self._return
+        self._scopes, self._return = [self._scopes[0], frame], node.return_type
+        node.body = self._statement(node.body)
+        self._scopes, self._return = scopes, _return
+
+    def _declaration(self, node: NodeVarDeclaration) -> None:
+        '''
+        Types a declaration; Untyped ones take their initializer's type
+        '''
+        if node.data_type is DataType.Void:
+            raise self._error(node, f"Variable '{node.id}' declared void")
+        if node.initializer is not None:
+            if node.data_type is None:
+                node.initializer, _ = self._value(node.initializer)
+                node.data_type = node.initializer.data_type
+                if node.data_type is DataType.Bool:
+                    node.data_type = DataType.Int32
+            else:
+                node.initializer = self._convert(node.initializer, node.data_type)
+        elif node.data_type is None:
+            node.data_type = DataType.Int32
+        assert node.data_type is not None
+        self._scopes[-1][node.id] = node.data_type
+
+    # --Expressions
+    def _value(self, node: NodeBase) -> tuple[NodeBase, Type_Interval]:
+        '''
+        Types an expression that must produce a value
+        '''
+        node, _range = self._expression(node)
+        if _range is None:
+            raise self._error(node, f"Void expression '{node}' used as a value")
+        return (node, _range)
+
+    def _convert(self, node: NodeBase, target: DataType) -> NodeBase:
+        '''
+        Types an expression stored into a variable of the target type
+        Constants must fit; other values are cast when out of range
+        '''
+        value = _constant(node)
+        if value is not None and not target.contains(value, value):
+            raise self._error(node, f"Constant {value} does not fit in {target}")
+        node, _range = self._value(node)
+        return self._coerce(node, _range, target)[0]
+
+    def _coerce(self, node: NodeBase, _range: Type_Interval, target: DataType) -> Type_Typed:
+        '''
+        Casts a value to the target type if its range does not fit
+        '''
+        if interval.contains(interval.of_type(target), _range):
+            return (node, _range)
+        location = context(node)
+        assert location is not None
+        self.casts += 1
+        cast = NodeExpressionCast(*location, target, node)
+        return (cast, interval.of_type(target))
+
+    def _expression(self, node: NodeBase) -> Type_Typed:
+        '''
+        Types an expression; Returns the node or its replacement
+        and the range of its value (None if void)
+        '''
+        self.typed += 1
+        if isinstance(node, NodeLiteral):
+            return self._literal(node)
+        elif isinstance(node, NodeExpressionBinary):
+            return self._binary(node)
+        elif isinstance(node, NodeExpressionUnary):
+            return self._unary(node)
+        elif isinstance(node, NodeExpressionCast):
+            node.node, _range = self._value(node.node)
+            if interval.contains(interval.of_type(node.data_type), _range):
+                return (node, _range)
+            return (node, interval.of_type(node.data_type))
+        elif isinstance(node, NodeVarAssignment):
+            if (_id := identifier(node.lvalue)) is None:
+                raise self._error(node.lvalue, f"Invalid assignment target '{node.lvalue}'")
+            node.data_type = node.lvalue.data_type = self._lookup(node.lvalue, _id)
+            node.rvalue = self._convert(node.rvalue, node.data_type)
+            return (node, interval.of_type(node.data_type))
+        elif isinstance(node, NodeFunctionCall):
+            return self._call(node)
+        raise self._error(node, f"Unexpected statement '{node}' in expression")
+
+    def _literal(self, node: NodeLiteral) -> Type_Typed:
+        if node.type is NodeLiteral.Type.Identifier:
+            assert isinstance(node.value, str)
+            node.data_type = self._lookup(node, node.value)
+            return (node, interval.of_type(node.data_type))
+        assert not isinstance(node.value, str)
+        value = int(node.value)
+        if node.type is NodeLiteral.Type.Boolean:
+            node.data_type = DataType.Bool
+        elif (_type := DataType.fitting(value)) is not None:
+            node.data_type = _type
+        else:
+            raise self._error(node, f"Integer literal {value} does not fit in any type")
+        return (node, (value, value))
+
+    def _binary(self, node: NodeExpressionBinary) -> Type_Typed:
+        node.lhs, lhs_range = self._value(node.lhs)
+        node.rhs, rhs_range = self._value(node.rhs)
+        assert node.lhs.data_type is not None and node.rhs.data_type is not None
+        _type = DataType.promote(node.lhs.data_type, node.rhs.data_type)
+        # -Comparisons: exact when a type holds both operands
+        if node.type in interval.COMPARISONS:
+            covering = interval.union(lhs_range, rhs_range)
+            for candidate in (_type, *COMPARISON_TYPES):
+                if candidate.contains(*covering):
+                    _type = candidate
+                    break
+        node.lhs, lhs_range = self._coerce(node.lhs, lhs_range, _type)
+        node.rhs, rhs_range = self._coerce(node.rhs, rhs_range, _type)
+        if node.type in interval.COMPARISONS:
+            node.data_type = DataType.Bool
+            return (node, interval.BOOLEAN)
+        node.data_type = _type
+        return self._coerce(node, interval.binary(node.type, lhs_range, rhs_range), _type)
+
+    def _unary(self, node: NodeExpressionUnary) -> Type_Typed:
+        if node.type is NodeExpressionUnary.Type.Return:
+            raise self._error(node, "Return used as a value")
+        node.node, _range = self._value(node.node)
+        if node.type is NodeExpressionUnary.Type.Not:
+            node.data_type = DataType.Bool
+            return (node, interval.BOOLEAN)
+        assert node.node.data_type is not None
+        _type = DataType.promote(node.node.data_type, DataType.Int32)
+        node.node, _range = self._coerce(node.node, _range, _type)
+        node.data_type = _type
+        return self._coerce(node, interval.unary(node.type, _range), _type)
+
+    def _call(self, node: NodeFunctionCall) -> Type_Typed:
+        _id = callee(node)
+        if _id is None or _id not in self._functions:
+            raise self._error(node, f"Call to undeclared function '{node.callee}'")
+        function = self._functions[_id]
+        if node.argument_count != function.arity:
+            raise self._error(node, (
+                f"Function '{_id}' expects {function.arity} arguments, "
+                f"got {node.argument_count}"
+            ))
+        if node.arguments:
+            types = function.parameter_types or (None,) * function.arity
+            node.arguments = tuple(
+                self._convert(argument, _type) if _type is not None else self._value(argument)[0]
+                for argument, _type in zip(node.arguments, types)
+            )
+        node.data_type = function.return_type
+        if function.return_type is None or function.return_type is DataType.Void:
+            return (node, None)
+        return (node, interval.of_type(function.return_type))
@@ -0,0 +1,295 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Pass Manager          ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import time
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+from .branches import BranchOrderer
+from .callgraph import CallGraph, UnreachableFunctionEliminator
+from .cse import CommonSubexpressionEliminator
+from .ctfe import CompileTimeEvaluator, Type_Evaluator
+from .dce import DeadCodeEliminator
+from .induction import InductionVariableAnalysis
+from .inline import FunctionInliner
+from .licm import LoopInvariantCodeMotion
+from .liveness import StackSlotAllocator
+from .lowering import TypedLowering
+from .ranges import ValueRangeAnalysis
+from .tail_call import TailCallEliminator
+from .unroll import LoopUnroller
+from .common import unshare_all
+from .visitor import NodeCounter
+from ..hashing import clear_hashes
+from ..nodes import NodeBase
+from ..profile import Profile
+
+## Constants
+T = TypeVar('T')
+Type_Pass = Callable[..., Any]
+
+
+## Classes
+class PassError(Exception):
+    """
+    Ember Middleware Pass Error
+    - Raised for unknown passes and dependency cycles
+    """
+    pass
+
+
+class PassInfo:
+    """
+    Ember Middleware Pass Info
+    - Declares how the pass manager builds and orders a pass
+    requires: passes scheduled (and added if missing) before this one
+    after: passes this one follows only when both are in the pipeline
+    analyses: constructor keyword => analysis class given from the cache
+    preserves: analysis classes still valid after the pass runs
+    profiled: the pass takes the manager's profile (profile=) if it has one
+    evaluated: the pass takes the manager's evaluator (evaluator=) if it has one
+    """
+
+    # -Constructor
+    def __init__(
+        self, name: str, factory: Type_Pass,
+        requires: tuple[str, ...] = (), after: tuple[str, ...] = (),
+        analyses: dict[str, type] | None = None, preserves: tuple[type, ...] = (),
+        profiled: bool = False, evaluated: bool = False
+    ) -> None:
+        self.name: str = name
+        self.factory: Type_Pass = factory
+        self.requires: tuple[str, ...] = requires
+        self.after: tuple[str, ...] = after
+        self.analyses: dict[str, type] = analyses or {}
+        self.preserves: tuple[type, ...] = preserves
+        self.profiled: bool = profiled
+        self.evaluated: bool = evaluated
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"PassInfo(name={self.name}, requires={self.requires}, "
+                f"after={self.after})")
+
+
+class PassManager:
+    """
+    Ember Middleware Pass Manager
+    - Runs a pipeline of registered passes over an AST in an order that
+    honours every pass' declared dependencies (otherwise the order added)
+    Analyses are built once and cached until a pass that does not
+    preserve them runs; passes asking for one get the cached result
+    Every pass is timed (wall and CPU) and the AST's node count is
+    recorded after it so each pass' growth or shrinkage is known
+    A profile given to the manager reaches every profile-guided pass and
+    an evaluator (backend.constant_evaluator) every pass running code
+
+    PassManager(ast, ("inline", "dce")).run()
+    """
+    PASSES: dict[str, PassInfo] = {
+        info.name: info for info in (
+            PassInfo("tce", TailCallEliminator),
+            PassInfo(
+                "inline", FunctionInliner, after=("tce",),
+                analyses={"graph": CallGraph}, profiled=True
+            ),
+            PassInfo(
+                "strip", UnreachableFunctionEliminator, after=("inline",),
+                analyses={"graph": CallGraph}
+            ),
+            PassInfo("ctfe", CompileTimeEvaluator, after=("inline",), evaluated=True),
+            PassInfo(
+                "licm", LoopInvariantCodeMotion, after=("inline", "ctfe"),
+                preserves=(CallGraph,)
+            ),
+            PassInfo(
+                "induction", InductionVariableAnalysis, after=("licm",),
+                preserves=(CallGraph,)
+            ),
+            PassInfo(
+                "unroll", LoopUnroller, requires=("induction",),
+                preserves=(CallGraph,), profiled=True
+            ),
+            PassInfo(
+                "cse", CommonSubexpressionEliminator,
+                after=("inline", "ctfe", "licm", "unroll"), preserves=(CallGraph,)
+            ),
+            PassInfo(
+                "branches", BranchOrderer, after=("inline", "ctfe", "licm", "unroll", "cse"),
+                preserves=(CallGraph,), profiled=True
+            ),
+            PassInfo(
+                "dce", DeadCodeEliminator,
+                after=("inline", "strip", "ctfe", "licm", "unroll", "cse")
+            ),
+            PassInfo(
+                "lower", TypedLowering,
+                after=(
+                    "tce", "inline", "ctfe", "licm", "induction", "unroll", "cse",
+                    "branches", "dce"
+                ),
+                preserves=(CallGraph,)
+            ),
+            PassInfo("ranges", ValueRangeAnalysis, after=("lower",), preserves=(CallGraph,)),
+            PassInfo(
+                "slots", StackSlotAllocator, after=("lower", "ranges", "dce"),
+                preserves=(CallGraph,)
+            ),
+        )
+    }
+
+    # -Constructor
+    def __init__(
+        self, ast: list[NodeBase], passes: Iterable[str] = (), profile: Profile | None = None,
+        evaluator: Type_Evaluator | None = None
+    ) -> None:
+        self.ast: list[NodeBase] = ast
+        self.profile: Profile | None = profile
+        self.evaluator: Type_Evaluator | None = evaluator
+        self.records: list[PassManager.Record] = []
+        self.results: dict[str, Any] = {}
+        self.nodes: int | None = None
+        self._pipeline: list[str] = []
+        self._options: dict[str, dict[str, Any]] = {}
+        self._analyses: dict[type, Any] = {}
+        for name in passes:
+            self.add(name)
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"PassManager(pipeline={self._pipeline}, ran={len(self.records)})"
+
+    # -Instance Methods
+    def add(self, name: str, **options: Any) -> PassManager:
+        '''
+        Appends a registered pass with optional constructor options
+        '''
+        if name not in PassManager.PASSES:
+            raise PassError(f"Unknown pass '{name}'")
+        if name not in self._pipeline:
+            self._pipeline.append(name)
+        self._options.setdefault(name, {}).update(options)
+        return self
+
+    def schedule(self) -> list[str]:
+        '''
+        Returns the pipeline ordered by declared dependencies with
+        required passes added; ties keep the order passes were added
+        '''
+        pipeline: list[str] = []
+        pending = list(self._pipeline)
+        while pending:
+            name = pending.pop(0)
+            if name in pipeline:
+                continue
+            pipeline.append(name)
+            pending.extend(PassManager.PASSES[name].requires)
+        before: dict[str, set[str]] = {
+            name: {
+                other for other in (*PassManager.PASSES[name].requires,
+                                    *PassManager.PASSES[name].after)
+                if other in pipeline
+            } for name in pipeline
+        }
+        order: list[str] = []
+        while len(order) < len(pipeline):
+            ready = [
+                name for name in pipeline if name not in order and before[name] <= set(order)
+            ]
+            if not ready:
+                cycle = [name for name in pipeline if name not in order]
+                raise PassError(f"Pass dependency cycle between {', '.join(cycle)}")
+            order.append(ready[0])
+        return order
+
+    def analysis(self, kind: type[T]) -> T:
+        '''
+        Returns the cached result of an analysis building it if needed
+        '''
+        if kind not in self._analyses:
+            result: Any = kind(self.ast)  # type: ignore[call-arg]
+            if callable(getattr(result, "run", None)):
+                result.run()
+            self._analyses[kind] = result
+        return self._analyses[kind]
+
+    def invalidate(self, preserves: tuple[type, ...] = ()) -> None:
+        '''
+        Drops every cached analysis not preserved
+        '''
+        self._analyses = {
+            kind: result for kind, result in self._analyses.items() if kind in preserves
+        }
+
+    def run(self) -> list[NodeBase]:
+        '''
+        Runs every scheduled pass in order recording its cost
+        The AST is unshared first (passes rewrite nodes in place) so ASTs
+        from a hash-consed factory are safe to optimize
+        '''
+        unshare_all(self.ast)
+        if self.nodes is None:
+            self.nodes = NodeCounter(self.ast).total
+        for name in self.schedule():
+            info = PassManager.PASSES[name]
+            arguments = {key: self.analysis(kind) for key, kind in info.analyses.items()}
+            if info.profiled and self.profile is not None:
+                arguments.setdefault("profile", self.profile)
+            if info.evaluated and self.evaluator is not None:
+                arguments.setdefault("evaluator", self.evaluator)
+            wall, cpu = time.perf_counter(), time.process_time()
+            instance = info.factory(self.ast, **self._options.get(name, {}), **arguments)
+            instance.run()
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            self.invalidate(info.preserves)
+            nodes = NodeCounter(self.ast).total
+            self.records.append(PassManager.Record(name, wall, cpu, self.nodes, nodes))
+            self.results[name] = instance
+            self.nodes = nodes
+        # -Structural hashes taken before the passes may no longer hold
+        clear_hashes(self.ast)
+        return self.ast
+
+    def report(self) -> str:
+        '''
+        Returns a table of every pass run with its time and node delta
+        '''
+        lines = [f"{'pass':<12}{'wall ms':>10}{'cpu ms':>10}{'nodes':>8}{'delta':>8}"]
+        for record in self.records:
+            lines.append(
+                f"{record.name:<12}{record.wall * 1000:>10.3f}{record.cpu * 1000:>10.3f}"
+                f"{record.after:>8}{record.delta:>+8}"
+            )
+        return '\n'.join(lines)
+
+    # -Sub-Classes
+    class Record:
+        '''
+        Ember Pass Record
+        - Cost of one pass run: wall/CPU seconds and node counts around it
+        '''
+
+        # -Constructor
+        def __init__(self, name: str, wall: float, cpu: float, before: int, after: int) -> None:
+            self.name: str = name
+            self.wall: float = wall
+            self.cpu: float = cpu
+            self.before: int = before
+            self.after: int = after
+
+        # -Dunder Methods
+        def __repr__(self) -> str:
+            return (f"PassManager.Record(name={self.name}, wall={self.wall:.6f}, "
+                    f"delta={self.delta})")
+
+        # -Properties
+        @property
+        def delta(self) -> int:
+            return self.after - self.before
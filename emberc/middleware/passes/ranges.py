@@ -0,0 +1,387 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Value Range Analysis  ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from . import interval
+from .common import calls, identifier, is_return, symbols_written
+from .interval import Type_Interval
+from .lowering import TypedLowering
+from ..nodes import (
+    NodeBase, NodeStatementBlock, NodeConditional, NodeLoop,
+    NodeFunctionDeclaration, NodeFunctionCall,
+    NodeVarDeclaration, NodeVarAssignment,
+    NodeExpressionBinary, NodeExpressionUnary, NodeExpressionCast, NodeLiteral,
+    DataType,
+)
+
+## Constants
+Type_Symbol = tuple[int, str]
+Type_Environment = dict[Type_Symbol, Type_Interval]
+WIDEN_AFTER: int = 3
+NARROW_TYPES: tuple[DataType, ...] = (
+    DataType.Int8, DataType.UInt8, DataType.Int16, DataType.UInt16,
+)
+REFINE_LUT: dict[NodeExpressionBinary.Type, NodeExpressionBinary.Type] = {
+    NodeExpressionBinary.Type.Lt: NodeExpressionBinary.Type.GtEq,
+    NodeExpressionBinary.Type.GtEq: NodeExpressionBinary.Type.Lt,
+    NodeExpressionBinary.Type.Gt: NodeExpressionBinary.Type.LtEq,
+    NodeExpressionBinary.Type.LtEq: NodeExpressionBinary.Type.Gt,
+    NodeExpressionBinary.Type.EqEq: NodeExpressionBinary.Type.BangEq,
+    NodeExpressionBinary.Type.BangEq: NodeExpressionBinary.Type.EqEq,
+}
+SWAP_LUT: dict[NodeExpressionBinary.Type, NodeExpressionBinary.Type] = {
+    NodeExpressionBinary.Type.Lt: NodeExpressionBinary.Type.Gt,
+    NodeExpressionBinary.Type.Gt: NodeExpressionBinary.Type.Lt,
+    NodeExpressionBinary.Type.LtEq: NodeExpressionBinary.Type.GtEq,
+    NodeExpressionBinary.Type.GtEq: NodeExpressionBinary.Type.LtEq,
+    NodeExpressionBinary.Type.EqEq: NodeExpressionBinary.Type.EqEq,
+    NodeExpressionBinary.Type.BangEq: NodeExpressionBinary.Type.BangEq,
+}
+
+
+## Functions
+def _join(lhs: Type_Environment, rhs: Type_Environment) -> Type_Environment:
+    """
+    Returns the environment holding every value of both environments
+    """
+    joined = dict(lhs)
+    for symbol, _range in rhs.items():
+        joined[symbol] = interval.union(joined[symbol], _range) if symbol in joined else _range
+    return joined
+
+
+def _constrain(
+    operator: NodeExpressionBinary.Type, value: Type_Interval, other: Type_Interval
+) -> Type_Interval | None:
+    """
+    Returns the part of value for which `value operator other` can hold
+    """
+    match operator:
+        case NodeExpressionBinary.Type.Lt:
+            return interval.intersect(value, (value[0], other[1] - 1))
+        case NodeExpressionBinary.Type.LtEq:
+            return interval.intersect(value, (value[0], other[1]))
+        case NodeExpressionBinary.Type.Gt:
+            return interval.intersect(value, (other[0] + 1, value[1]))
+        case NodeExpressionBinary.Type.GtEq:
+            return interval.intersect(value, (other[0], value[1]))
+        case NodeExpressionBinary.Type.EqEq:
+            return interval.intersect(value, other)
+    return value
+
+
+## Classes
+class ValueRangeAnalysis:
+    """
+    Ember Middleware Pass: Value Range Analysis
+    - Propagates value intervals through the typed AST from literals,
+    declared types, assignments, conditional guards and loop conditions
+    (loops iterate to a fixed point, widening to the type's bounds)
+    Annotates every expression with node.value_range; casts whose operand
+    provably fits are dropped since they can never wrap, so the remaining
+    arithmetic provably does not overflow its type
+    Locals whose every stored value fits a narrower type of the same
+    promotion (int8/uint8/int16/uint16 for int32) have their declared
+    storage type narrowed; expressions keep their computed types
+    Calls may write any global so globals reset to their type's range
+    """
+
+    # -Constructor
+    def __init__(self, ast: list[NodeBase], narrow: bool = True) -> None:
+        self.ast: list[NodeBase] = ast
+        self.narrow: bool = narrow
+        self.removed: int = 0
+        self.narrowed: int = 0
+        self._names: list[dict[str, Type_Symbol]] = []
+        self._types: dict[Type_Symbol, DataType] = {}
+        self._globals: set[Type_Symbol] = set()
+        self._locals: dict[Type_Symbol, NodeVarDeclaration] = {}
+        self._stored: Type_Environment = {}
+        self._environment: Type_Environment = {}
+        self._ranges: dict[int, Type_Interval | None] = {}
+        self._mutate: bool = True
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"ValueRangeAnalysis(removed={self.removed}, narrowed={self.narrowed})"
+
+    # -Instance Methods
+    def run(self) -> list[NodeBase]:
+        '''
+        Types the AST, propagates value ranges dropping casts that can
+        not wrap, then narrows local declarations
+        '''
+        # -Also unshares the AST: ranges are annotated per occurrence
+        TypedLowering(self.ast).run()
+        self._names = [{}]
+        for node in self.ast:
+            if isinstance(node, NodeVarDeclaration):
+                assert node.data_type is not None
+                symbol = (id(node), node.id)
+                self._names[0][node.id] = symbol
+                self._types[symbol] = node.data_type
+                self._globals.add(symbol)
+        self.ast[:] = [self._statement(node) for node in self.ast]
+        if self.narrow:
+            self._narrow()
+        return self.ast
+
+    def _narrow(self) -> None:
+        '''
+        Narrows locals to the smallest type holding every stored value
+        '''
+        for symbol, declaration in self._locals.items():
+            assert declaration.data_type is not None
+            _type, stored = declaration.data_type, self._stored.get(symbol)
+            if stored is None:
+                continue
+            for candidate in NARROW_TYPES:
+                if (candidate.bits < _type.bits and candidate.contains(*stored) and
+                        DataType.promote(candidate, candidate) is DataType.promote(_type, _type)):
+                    declaration.data_type = candidate
+                    self.narrowed += 1
+                    break
+
+    # --Environment
+    def _declare(self, _id: str, owner: NodeBase, _type: DataType) -> Type_Symbol:
+        '''
+        Declares a symbol owned by a declaration or function in the current scope
+        '''
+        symbol = (id(owner), _id)
+        self._names[-1][_id] = symbol
+        self._types[symbol] = _type
+        return symbol
+
+    def _resolve(self, node: NodeBase) -> Type_Symbol | None:
+        '''
+        Returns the symbol an identifier refers to or None
+        '''
+        if (_id := identifier(node)) is None:
+            return None
+        for names in reversed(self._names):
+            if _id in names:
+                return names[_id]
+        return None
+
+    def _store(self, symbol: Type_Symbol, _range: Type_Interval) -> None:
+        '''
+        Sets a symbol's range recording every range ever stored to it
+        '''
+        self._environment[symbol] = _range
+        stored = self._stored.get(symbol)
+        self._stored[symbol] = interval.union(stored, _range) if stored else _range
+
+    def _clobber_globals(self) -> None:
+        '''
+        Resets every global to its type's range
+        '''
+        for symbol in self._globals:
+            self._environment[symbol] = interval.of_type(self._types[symbol])
+
+    def _widen(self, old: Type_Environment, new: Type_Environment) -> Type_Environment:
+        '''
+        Pushes every bound still moving to its type's limit
+        '''
+        widened = dict(new)
+        for symbol, (low, high) in new.items():
+            if symbol not in old:
+                continue
+            limit = interval.of_type(self._types[symbol])
+            widened[symbol] = (
+                limit[0] if low < old[symbol][0] else low,
+                limit[1] if high > old[symbol][1] else high,
+            )
+        return widened
+
+    def _refine(self, condition: NodeBase, truth: bool) -> None:
+        '''
+        Narrows the environment to the values for which the condition
+        evaluates to truth; conditions writing symbols or calling are skipped
+        '''
+        if symbols_written(condition) or calls(condition):
+            return
+        if (isinstance(condition, NodeExpressionUnary) and
+                condition.type is NodeExpressionUnary.Type.Not):
+            self._refine(condition.node, not truth)
+            return
+        if not (isinstance(condition, NodeExpressionBinary) and
+                condition.type in interval.COMPARISONS):
+            return
+        operator = condition.type if truth else REFINE_LUT[condition.type]
+        for value, other, comparison in (
+            (condition.lhs, condition.rhs, operator),
+            (condition.rhs, condition.lhs, SWAP_LUT[operator]),
+        ):
+            # -Casts that can not wrap compare the symbol itself
+            if isinstance(value, NodeExpressionCast):
+                inner = self._ranges.get(id(value.node))
+                if inner is None or not value.data_type.contains(*inner):
+                    continue
+                value = value.node
+            symbol = self._resolve(value)
+            bound = self._ranges.get(id(other))
+            if symbol is None or symbol not in self._environment or bound is None:
+                continue
+            refined = _constrain(comparison, self._environment[symbol], bound)
+            if refined is not None:
+                self._environment[symbol] = refined
+
+    # --Statements
+    def _statement(self, node: NodeBase) -> NodeBase:
+        '''
+        Analyzes a statement; Returns the node or its replacement
+        '''
+        if isinstance(node, NodeStatementBlock):
+            self._names.append({})
+            node.nodes = tuple(self._statement(child) for child in node.nodes)
+            self._names.pop()
+        elif isinstance(node, NodeConditional):
+            node.condition = self._expression(node.condition)[0]
+            before = dict(self._environment)
+            self._refine(node.condition, True)
+            node.true_block = self._statement(node.true_block)
+            after = self._environment
+            self._environment = before
+            self._refine(node.condition, False)
+            if node.false_block is not None:
+                node.false_block = self._statement(node.false_block)
+            self._environment = _join(after, self._environment)
+        elif isinstance(node, NodeLoop):
+            self._loop(node)
+        elif isinstance(node, NodeFunctionDeclaration):
+            self._function(node)
+        elif isinstance(node, NodeVarDeclaration):
+            assert node.data_type is not None
+            _range: Type_Interval = (0, 0)
+            if node.initializer is not None:
+                node.initializer, value = self._expression(node.initializer)
+                assert value is not None
+                _range = value
+            symbol = self._declare(node.id, node, node.data_type)
+            if symbol not in self._globals:
+                self._locals[symbol] = node
+            self._store(symbol, _range)
+        elif is_return(node):
+            assert isinstance(node, NodeExpressionUnary)
+            node.node = self._expression(node.node)[0]
+        else:
+            return self._expression(node)[0]
+        return node
+
+    def _function(self, node: NodeFunctionDeclaration) -> None:
+        '''
+        Analyzes a function body; parameters and globals start at their type's range
+        '''
+        environment, names = self._environment, self._names
+        self._environment, self._names = {}, [self._names[0], {}]
+        self._clobber_globals()
+        types = node.parameter_types or (None,) * node.arity
+        for parameter, _type in zip(node.parameters or (), types):
+            assert _type is not None
+            symbol = self._declare(parameter, node, _type)
+            self._environment[symbol] = interval.of_type(_type)
+        node.body = self._statement(node.body)
+        self._environment, self._names = environment, names
+
+    def _loop(self, node: NodeLoop) -> None:
+        '''
+        Iterates a loop's body to a fixed point without changing it, then
+        analyzes it once more from the stable entry state
+        '''
+        mutate, self._mutate = self._mutate, False
+        state = dict(self._environment)
+        iteration = 0
+        while True:
+            self._environment = dict(state)
+            self._loop_iteration(node)
+            new = _join(state, self._environment)
+            if new == state:
+                break
+            iteration += 1
+            state = self._widen(state, new) if iteration >= WIDEN_AFTER else new
+        self._mutate = mutate
+        self._environment = dict(state)
+        exit = self._loop_iteration(node)
+        self._environment = exit
+
+    def _loop_iteration(self, node: NodeLoop) -> Type_Environment:
+        '''
+        Analyzes one pass from the loop's entry back to it
+        Leaves the state re-entering the loop; Returns the state leaving it
+        '''
+        if node.run_before_eval:
+            node.body = self._statement(node.body)
+        node.condition = self._expression(node.condition)[0]
+        exit = dict(self._environment)
+        self._refine(node.condition, True)
+        if not node.run_before_eval:
+            node.body = self._statement(node.body)
+        # -Leaving state
+        environment = self._environment
+        self._environment = exit
+        self._refine(node.condition, False)
+        exit, self._environment = self._environment, environment
+        return exit
+
+    # --Expressions
+    def _expression(self, node: NodeBase) -> tuple[NodeBase, Type_Interval | None]:
+        '''
+        Analyzes an expression; Returns the node or its replacement and
+        the range of its value (None if void)
+        '''
+        _range: Type_Interval | None = None
+        if isinstance(node, NodeLiteral):
+            if node.type is NodeLiteral.Type.Identifier:
+                symbol = self._resolve(node)
+                if symbol is not None and symbol in self._environment:
+                    _range = self._environment[symbol]
+                elif node.data_type is not None:
+                    _range = interval.of_type(node.data_type)
+            else:
+                assert not isinstance(node.value, str)
+                _range = (int(node.value), int(node.value))
+        elif isinstance(node, NodeExpressionBinary):
+            node.lhs, lhs = self._expression(node.lhs)
+            node.rhs, rhs = self._expression(node.rhs)
+            assert lhs is not None and rhs is not None
+            _range = interval.binary(node.type, lhs, rhs)
+        elif isinstance(node, NodeExpressionUnary):
+            node.node, value = self._expression(node.node)
+            assert value is not None
+            _range = interval.unary(node.type, value)
+        elif isinstance(node, NodeExpressionCast):
+            node.node, value = self._expression(node.node)
+            assert value is not None
+            limit = interval.of_type(node.data_type)
+            if interval.contains(limit, value):
+                if self._mutate:
+                    self.removed += 1
+                    self._ranges[id(node)] = value
+                    return (node.node, value)
+                _range = value
+            else:
+                _range = limit
+        elif isinstance(node, NodeVarAssignment):
+            node.rvalue, _range = self._expression(node.rvalue)
+            assert _range is not None
+            if (symbol := self._resolve(node.lvalue)) is not None:
+                self._store(symbol, _range)
+        elif isinstance(node, NodeFunctionCall):
+            if node.arguments:
+                node.arguments = tuple(
+                    self._expression(argument)[0] for argument in node.arguments
+                )
+            self._clobber_globals()
+            if node.data_type is not None and node.data_type is not DataType.Void:
+                _range = interval.of_type(node.data_type)
+        self._ranges[id(node)] = _range
+        if self._mutate:
+            node.value_range = _range
+        return (node, _range)
@@ -0,0 +1,262 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Tail Call Elimination ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from .common import (
+    Type_Context, functions, walk, calls, callee, identifier, is_return,
+    definitely_returns, symbols_read, local_symbols,
+    build_identifier, build_number, build_boolean, build_assignment,
+)
+from ..nodes import (
+    NodeBase, NodeStatementBlock, NodeConditional, NodeLoop,
+    NodeFunctionDeclaration, NodeFunctionCall, NodeVarDeclaration,
+    NodeExpressionBinary, NodeExpressionUnary,
+)
+
+## Constants
+FLAG_ID: str = "__tce_loop"
+ACCUMULATOR_ID: str = "__tce_acc"
+TEMPORARY_PREFIX: str = "__tce_"
+ACCUMULATOR_IDENTITY: dict[NodeExpressionBinary.Type, int] = {
+    NodeExpressionBinary.Type.Add: 0,
+    NodeExpressionBinary.Type.Mul: 1,
+}
+
+
+## Classes
+class TailCallEliminator:
+    """
+    Ember Middleware Pass: Tail Call Elimination
+    - Rewrites self-recursive calls in tail position into parameter
+    reassignment inside a loop so recursion runs in constant stack
+    Optionally introduces an accumulator for `return e op f(..)` where
+    op is associative (`+`, `*`) to turn them into tail calls as well
+
+    fn f(params) { body } => fn f(params) {
+        __tce_loop = true; __tce_acc = identity;
+        while(__tce_loop) { __tce_loop = false; body' }
+    }
+    """
+
+    # -Constructor
+    def __init__(self, ast: list[NodeBase], accumulate: bool = True) -> None:
+        self.ast: list[NodeBase] = ast
+        self.accumulate: bool = accumulate
+        self.eliminated: dict[str, int] = {}
+        # -Function state
+        self._function: NodeFunctionDeclaration | None = None
+        self._context: Type_Context | None = None
+        self._operator: NodeExpressionBinary.Type | None = None
+        self._count: int = 0
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"TailCallEliminator(accumulate={self.accumulate}, eliminated={self.eliminated})"
+
+    # -Instance Methods
+    def run(self) -> list[NodeBase]:
+        '''
+        Rewrites every eligible function in the AST in place
+        Returns the AST and records rewritten call counts per function
+        '''
+        for function in list(functions(self.ast)):
+            if count := self._eliminate(function):
+                self.eliminated[function.id] = count
+        return self.ast
+
+    def _eliminate(self, function: NodeFunctionDeclaration) -> int:
+        '''
+        Rewrites a single function's tail calls
+        Returns the number of rewritten calls
+        '''
+        if not calls(function.body, function.id):
+            return 0
+        # -Parameters shadowed by locals can't be reassigned safely
+        parameters = set(function.parameters or ())
+        for node in walk(function.body, False):
+            if isinstance(node, NodeVarDeclaration) and node.id in parameters:
+                return 0
+        self._function = function
+        self._context = (function.file, function.position)
+        self._operator = self._find_operator() if self.accumulate else None
+        self._count = 0
+        statements = (function.body.nodes if isinstance(function.body, NodeStatementBlock)
+                      else (function.body,))
+        body = self._rewrite_statements(statements)
+        if self._count == 0:
+            return 0
+        # -Build loop
+        prologue: list[NodeBase] = [NodeVarDeclaration(
+            *self._context, FLAG_ID, build_boolean(self._context, True)
+        )]
+        if self._operator is not None:
+            prologue.append(NodeVarDeclaration(
+                *self._context, ACCUMULATOR_ID,
+                build_number(self._context, ACCUMULATOR_IDENTITY[self._operator]),
+                function.return_type
+            ))
+        loop_body = NodeStatementBlock((
+            build_assignment(self._context, FLAG_ID, build_boolean(self._context, False)),
+            *body
+        ))
+        loop = NodeLoop(build_identifier(self._context, FLAG_ID), loop_body, False)
+        function.body = NodeStatementBlock((*prologue, loop))
+        return self._count
+
+    def _find_operator(self) -> NodeExpressionBinary.Type | None:
+        '''
+        Finds the single associative operator joining a self call with
+        a call-free local expression across all returns; None if not unique
+        '''
+        assert self._function is not None
+        operators: set[NodeExpressionBinary.Type] = set()
+        for node in walk(self._function.body, False):
+            if is_return(node) and self._split_accumulation(node.node, True):
+                assert isinstance(node.node, NodeExpressionBinary)
+                operators.add(node.node.type)
+        return operators.pop() if len(operators) == 1 else None
+
+    def _split_accumulation(
+        self, node: NodeBase, any_operator: bool = False
+    ) -> tuple[NodeBase, NodeFunctionCall] | None:
+        '''
+        Splits `e op f(..)` or `f(..) op e` into (e, call) or None
+        '''
+        assert self._function is not None
+        if not isinstance(node, NodeExpressionBinary):
+            return None
+        if node.type not in ACCUMULATOR_IDENTITY:
+            return None
+        if not any_operator and node.type is not self._operator:
+            return None
+        if callee(node.rhs) == self._function.id:
+            value, call = node.lhs, node.rhs
+        elif callee(node.lhs) == self._function.id:
+            value, call = node.rhs, node.lhs
+        else:
+            return None
+        assert isinstance(call, NodeFunctionCall)
+        if calls(value) or not symbols_read(value) <= local_symbols(self._function):
+            return None
+        return (value, call)
+
+    # --Rewriting
+    def _rewrite_statements(self, statements: tuple[NodeBase, ...]) -> list[NodeBase]:
+        '''
+        Rewrites a statement list in tail context; unreachable statements after
+        a return are dropped and statements after a possible tail call are
+        guarded so nothing runs once the loop has been re-entered
+        '''
+        assert self._context is not None
+        rewritten: list[NodeBase] = []
+        for index, statement in enumerate(statements):
+            count = self._count
+            ends = definitely_returns(statement)
+            rewritten.append(self._rewrite_statement(statement))
+            if ends:
+                break
+            if self._count != count and index < len(statements) - 1:
+                guard = NodeExpressionUnary(
+                    *self._context, NodeExpressionUnary.Type.Not,
+                    build_identifier(self._context, FLAG_ID)
+                )
+                rest = self._rewrite_statements(statements[index + 1:])
+                rewritten.append(NodeConditional(guard, NodeStatementBlock(tuple(rest)), None))
+                break
+        return rewritten
+
+    def _rewrite_statement(self, statement: NodeBase) -> NodeBase:
+        '''
+        Rewrites a statement in tail context
+        '''
+        if is_return(statement):
+            assert isinstance(statement, NodeExpressionUnary)
+            return self._rewrite_return(statement)
+        elif isinstance(statement, NodeStatementBlock):
+            return NodeStatementBlock(tuple(self._rewrite_statements(statement.nodes)))
+        elif isinstance(statement, NodeConditional):
+            statement.true_block = self._rewrite_branch(statement.true_block)
+            if statement.false_block is not None:
+                statement.false_block = self._rewrite_branch(statement.false_block)
+        elif isinstance(statement, NodeLoop) and self._operator is not None:
+            # -Returns inside loops are not tail positions but still need the accumulator
+            for node in walk(statement, False):
+                if is_return(node):
+                    assert isinstance(node, NodeExpressionUnary)
+                    node.node = self._accumulate(node.node)
+        return statement
+
+    def _rewrite_branch(self, branch: NodeBase) -> NodeBase:
+        '''
+        Rewrites a conditional branch keeping its scope
+        '''
+        if isinstance(branch, NodeStatementBlock):
+            return self._rewrite_statement(branch)
+        rewritten = self._rewrite_statements((branch,))
+        return rewritten[0] if len(rewritten) == 1 else NodeStatementBlock(tuple(rewritten))
+
+    def _rewrite_return(self, statement: NodeExpressionUnary) -> NodeBase:
+        '''
+        Rewrites `return f(..)` or `return e op f(..)` into a loop restart
+        Other returns are combined with the accumulator if one is used
+        '''
+        assert self._function is not None and self._context is not None
+        value: NodeBase | None = None
+        call: NodeBase = statement.node
+        if self._operator is not None and (split := self._split_accumulation(call)):
+            value, call = split
+        if callee(call) != self._function.id:
+            statement.node = self._accumulate(statement.node)
+            return statement
+        assert isinstance(call, NodeFunctionCall)
+        if call.argument_count != self._function.arity:
+            statement.node = self._accumulate(statement.node)
+            return statement
+        self._count += 1
+        statements: list[NodeBase] = []
+        # -Accumulate
+        if value is not None:
+            assert self._operator is not None
+            statements.append(build_assignment(self._context, ACCUMULATOR_ID, self._accumulate(value)))
+        # -Reassign parameters
+        parameters = self._function.parameters or ()
+        arguments = call.arguments or ()
+        changed = [
+            (parameter, argument) for parameter, argument in zip(parameters, arguments)
+            if identifier(argument) != parameter
+        ]
+        if len(changed) == 1:
+            statements.append(build_assignment(self._context, *changed[0]))
+        else:
+            types = dict(zip(parameters, self._function.parameter_types or ()))
+            for parameter, argument in changed:
+                statements.append(NodeVarDeclaration(
+                    *self._context, TEMPORARY_PREFIX + parameter, argument, types.get(parameter)
+                ))
+            for parameter, _ in changed:
+                statements.append(build_assignment(
+                    self._context, parameter,
+                    build_identifier(self._context, TEMPORARY_PREFIX + parameter)
+                ))
+        # -Restart loop
+        statements.append(build_assignment(self._context, FLAG_ID, build_boolean(self._context, True)))
+        return NodeStatementBlock(tuple(statements))
+
+    def _accumulate(self, node: NodeBase) -> NodeBase:
+        '''
+        Combines a value with the accumulator if one is used
+        '''
+        assert self._context is not None
+        if self._operator is None:
+            return node
+        return NodeExpressionBinary(
+            *self._context, self._operator,
+            build_identifier(self._context, ACCUMULATOR_ID), node
+        )
@@ -0,0 +1,172 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Loop Unrolling        ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+
+from .common import walk, clone, calls, build_identifier, build_number
+from .induction import InductionVariableAnalysis
+from .visitor import ScopedTransformer
+from ..profile import Profile
+from ..nodes import (
+    NodeBase, NodeStatementBlock, NodeLoop,
+    NodeFunctionDeclaration, NodeExpressionBinary, NodeLiteral, DataType,
+)
+
+## Constants
+INCREASING: tuple[NodeExpressionBinary.Type, ...] = (
+    NodeExpressionBinary.Type.Lt, NodeExpressionBinary.Type.LtEq,
+)
+DECREASING: tuple[NodeExpressionBinary.Type, ...] = (
+    NodeExpressionBinary.Type.Gt, NodeExpressionBinary.Type.GtEq,
+)
+
+
+## Classes
+class LoopUnroller(ScopedTransformer):
+    """
+    Ember Middleware Pass: Loop Unrolling
+    - Unrolls counted loops recorded by induction variable analysis
+    Loops with a constant trip count whose body fits the code-size
+    budget are replaced by copies of their body; others are unrolled
+    by factor with a remainder (copies when the trip count is known,
+    otherwise the original loop)
+    Loops calling functions are only unrolled when their counter is
+    function-local, and partially only when the shifted test
+    `i + (factor - 1) * step` provably fits the counter's type
+
+    With a profile, loops never entered are left alone and partial
+    unrolling is kept for loops taking at least hot_share of all profiled
+    iterations that averaged factor iterations per entry
+
+    while(i < n) { body } => while(i + (factor - 1) * step < n) { body * factor }
+                             while(i < n) { body }
+    """
+
+    # -Constructor
+    def __init__(
+        self, ast: list[NodeBase], factor: int = 4, budget: int = 256,
+        profile: Profile | None = None, hot_share: float = 0.05
+    ) -> None:
+        super().__init__()
+        self.ast: list[NodeBase] = ast
+        self.factor: int = factor
+        self.budget: int = budget
+        self.profile: Profile | None = profile
+        self.hot_share: float = hot_share
+        self.unrolled: int = 0
+        self.partial: int = 0
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"LoopUnroller(factor={self.factor}, budget={self.budget}, "
+                f"unrolled={self.unrolled}, partial={self.partial})")
+
+    # -Instance Methods
+    def run(self) -> list[NodeBase]:
+        '''
+        Unrolls every eligible loop in the AST, inner loops first
+        '''
+        InductionVariableAnalysis(self.ast, False).run()
+        return self.transform(self.ast)
+
+    def _visit_loop(self, node: NodeLoop) -> NodeBase:
+        node.body = self.visit(node.body)
+        return self._unroll(node)
+
+    def _unroll(self, loop: NodeLoop) -> NodeBase:
+        '''
+        Unrolls a single loop; Returns its replacement or the loop
+        '''
+        induction = loop.induction
+        if induction is None:
+            return loop
+        if any(isinstance(node, NodeFunctionDeclaration) for node in walk(loop.body)):
+            return loop
+        # -A callee may write a global counter behind the loop's back
+        if calls(loop) and induction.id not in self.locals:
+            return loop
+        if self.profile is not None and self.profile.trip_count(loop) is None:
+            return loop
+        size = sum(1 for _ in walk(loop.body))
+        count = induction.trip_count
+        # -Full
+        if count is not None and count * size <= self.budget:
+            self.unrolled += 1
+            return NodeStatementBlock(tuple(clone(loop.body) for _ in range(count)))
+        # -Partial
+        factor = min(self.factor, self.budget // size)
+        if factor < 2 or not self._hot(loop, factor):
+            return loop
+        if not ((induction.comparison in INCREASING and induction.step > 0) or
+                (induction.comparison in DECREASING and induction.step < 0)):
+            return loop
+        if not self._fits(induction, factor):
+            return loop
+        self.partial += 1
+        context = (induction.bound.file, induction.bound.position)  # type: ignore[attr-defined]
+        condition = NodeExpressionBinary(
+            *context, induction.comparison,
+            NodeExpressionBinary(
+                *context, NodeExpressionBinary.Type.Add,
+                build_identifier(context, induction.id),
+                build_number(context, (factor - 1) * induction.step)
+            ),
+            clone(induction.bound)
+        )
+        main = NodeLoop(
+            condition, NodeStatementBlock(tuple(clone(loop.body) for _ in range(factor))), False
+        )
+        # -Remainder
+        if count is not None:
+            return NodeStatementBlock((
+                main, *(clone(loop.body) for _ in range(count % factor))
+            ))
+        statements: list[NodeBase] = []
+        if loop.run_before_eval:
+            statements.append(clone(loop.body))
+            loop.run_before_eval = False
+        loop.induction = NodeLoop.Induction(
+            induction.id, None, induction.step, induction.comparison, induction.bound, None
+        )
+        return NodeStatementBlock((*statements, main, loop))
+
+    def _fits(self, induction: NodeLoop.Induction, factor: int) -> bool:
+        '''
+        Checks if `i + (factor - 1) * step` cannot overflow at any test of the
+        unrolled loop: the counter is narrower than the int32 it is added in,
+        or its start and bound are constants keeping it in range
+        '''
+        _type = self._type(induction.id)
+        if _type is None or _type is DataType.Bool:
+            return False
+        offset = (factor - 1) * induction.step
+        result = DataType.promote(_type, DataType.Int32)
+        if result.contains(_type.minimum + offset, _type.maximum + offset):
+            return True
+        bound = induction.bound
+        if (induction.start is None or not isinstance(bound, NodeLiteral) or
+                not isinstance(bound.value, int) or bound.type is not NodeLiteral.Type.Number):
+            return False
+        # -Tested values: the start, then at most one step past the bound
+        edge = bound.value + induction.step
+        if induction.step > 0:
+            value = max(induction.start, edge) + offset
+        else:
+            value = min(induction.start, edge) + offset
+        return result.contains(value, value)
+
+    def _hot(self, loop: NodeLoop, factor: int) -> bool:
+        '''
+        Checks if a loop ran enough (when profiled) to pay for partial unrolling
+        '''
+        if self.profile is None:
+            return True
+        trips = self.profile.trip_count(loop)
+        return (trips is not None and trips >= factor and
+                self.profile.loop_share(loop) >= self.hot_share)
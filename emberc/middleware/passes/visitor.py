@@ -0,0 +1,222 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Passes: Visitors              ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from .common import CHILDREN_LUT, MAP_CHILDREN_LUT, Type_Children, Type_MapChildren
+from ..nodes import (
+    NodeBase, NodeStatementBlock, NodeConditional, NodeLoop,
+    NodeFunctionDeclaration, NodeFunctionCall,
+    NodeVarDeclaration, NodeVarAssignment,
+    NodeExpressionBinary, NodeExpressionUnary, NodeExpressionCast, NodeLiteral,
+    DataType,
+)
+
+## Constants
+Type_Handler = Callable[[Any, NodeBase], Any]
+Type_Entry = tuple[Type_Handler, Type_Children, Type_MapChildren]
+HANDLER_LUT: dict[type[NodeBase], str] = {
+    NodeStatementBlock: "_visit_block",
+    NodeConditional: "_visit_conditional",
+    NodeLoop: "_visit_loop",
+    NodeFunctionDeclaration: "_visit_function_declaration",
+    NodeFunctionCall: "_visit_function_call",
+    NodeVarDeclaration: "_visit_var_declaration",
+    NodeVarAssignment: "_visit_var_assignment",
+    NodeExpressionBinary: "_visit_expression_binary",
+    NodeExpressionUnary: "_visit_expression_unary",
+    NodeExpressionCast: "_visit_expression_cast",
+    NodeLiteral: "_visit_literal",
+}
+
+
+## Functions
+def _build_dispatch(cls: type) -> dict[type[NodeBase], Type_Entry]:
+    """
+    Builds a visitor class' node class => (handler, children accessor,
+    children mapper) table; node classes without a handler method go to
+    the class' _visit_children
+    """
+    return {
+        node_type: (
+            getattr(cls, name, cls._visit_children),
+            CHILDREN_LUT[node_type], MAP_CHILDREN_LUT[node_type]
+        )
+        for node_type, name in HANDLER_LUT.items()
+    }
+
+
+## Classes
+class NodeVisitor:
+    """
+    Ember Middleware Visitor
+    - Walks nodes dispatching on the node's class through a table built
+    once per visitor class instead of an isinstance chain per node; the
+    table also holds each class' children accessors for the defaults
+    Subclasses define handlers named after the node (_visit_loop,
+    _visit_expression_binary, ..); the rest visit their children
+    """
+    _dispatch: dict[type[NodeBase], Type_Entry] = {}
+
+    # -Dunder Methods
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = _build_dispatch(cls)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    # -Instance Methods
+    def visit(self, node: NodeBase) -> Any:
+        '''
+        Calls the handler for the node's class
+        '''
+        return self._dispatch[type(node)][0](self, node)
+
+    def visit_all(self, ast: list[NodeBase]) -> None:
+        '''
+        Visits every top-level statement
+        '''
+        for node in ast:
+            self.visit(node)
+
+    def _visit_children(self, node: NodeBase) -> Any:
+        for child in self._dispatch[type(node)][1](node):
+            self.visit(child)
+        return None
+
+
+class NodeTransformer(NodeVisitor):
+    """
+    Ember Middleware Transformer
+    - Visitor whose handlers return a node replacing the visited one;
+    by default children are replaced in place by their visited results
+    """
+
+    # -Instance Methods
+    def transform(self, ast: list[NodeBase]) -> list[NodeBase]:
+        '''
+        Replaces every top-level statement with its transformed result
+        '''
+        ast[:] = [self.visit(node) for node in ast]
+        return ast
+
+    def _visit_children(self, node: NodeBase) -> NodeBase:
+        self._dispatch[type(node)][2](node, self.visit)
+        return node
+
+
+class ScopedTransformer(NodeTransformer):
+    """
+    Ember Middleware Scoped Transformer
+    - Transformer over statements keeping the declared types of globals
+    and of the function-local scopes (the parameters, then one per block)
+    Expressions hold no statements so they are returned as is
+    """
+
+    # -Constructor
+    def __init__(self) -> None:
+        self._globals: dict[str, DataType | None] = {}
+        self._scopes: list[dict[str, DataType | None]] = []
+
+    # -Instance Methods
+    def _visit_block(self, node: NodeStatementBlock) -> NodeBase:
+        self._scopes.append({})
+        node.nodes = tuple(self.visit(child) for child in node.nodes)
+        self._scopes.pop()
+        return node
+
+    def _visit_conditional(self, node: NodeConditional) -> NodeBase:
+        node.true_block = self._visit_body(node.true_block)
+        if node.false_block is not None:
+            node.false_block = self._visit_body(node.false_block)
+        return node
+
+    def _visit_loop(self, node: NodeLoop) -> NodeBase:
+        node.body = self._visit_body(node.body)
+        return node
+
+    def _visit_function_declaration(self, node: NodeFunctionDeclaration) -> NodeBase:
+        scopes = self._scopes
+        parameters = node.parameters or ()
+        self._scopes = [dict(zip(parameters, node.parameter_types or (None,) * len(parameters)))]
+        node.body = self._visit_body(node.body)
+        self._scopes = scopes
+        return node
+
+    def _visit_var_declaration(self, node: NodeVarDeclaration) -> NodeBase:
+        (self._scopes[-1] if self._scopes else self._globals)[node.id] = node.data_type
+        return node
+
+    def _visit_expression(self, node: NodeBase) -> NodeBase:
+        return node
+
+    _visit_function_call = _visit_expression
+    _visit_var_assignment = _visit_expression
+    _visit_expression_binary = _visit_expression
+    _visit_expression_unary = _visit_expression
+    _visit_expression_cast = _visit_expression
+    _visit_literal = _visit_expression
+
+    def _visit_body(self, node: NodeBase) -> NodeBase:
+        '''
+        Visits the statement nested in a conditional, loop or function
+        '''
+        return self.visit(node)
+
+    def _type(self, _id: str) -> DataType | None:
+        '''
+        Returns the declared type of the symbol in scope (None if unknown)
+        '''
+        for scope in reversed(self._scopes):
+            if _id in scope:
+                return scope[_id]
+        return self._globals.get(_id)
+
+    # -Properties
+    @property
+    def locals(self) -> set[str]:
+        '''
+        Symbols local to the function being visited (empty outside one)
+        '''
+        return set().union(*self._scopes)
+
+
+class NodeCounter(NodeVisitor):
+    """
+    Ember Middleware Analysis: Node Counter
+    - Counts the nodes of an AST by node class
+    """
+
+    # -Constructor
+    def __init__(self, ast: list[NodeBase]) -> None:
+        self.counts: Counter[str] = Counter()
+        self.visit_all(ast)
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"NodeCounter(total={self.total})"
+
+    # -Instance Methods
+    def _visit_children(self, node: NodeBase) -> None:
+        self.counts[type(node).__name__] += 1
+        for child in self._dispatch[type(node)][1](node):
+            self.visit(child)
+
+    # -Properties
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+## Body
+NodeVisitor._dispatch = _build_dispatch(NodeVisitor)
@@ -0,0 +1,186 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Execution Profile             ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import json
+from collections import Counter
+from pathlib import Path
+
+from .nodes import NodeBase, NodeConditional, NodeLoop, NodeFunctionCall
+from .nodes.base import NodeContextBase
+
+## Constants
+VERSION: int = 1
+Type_Site = tuple[str, int, int]
+
+
+## Functions
+def site(node: NodeBase) -> Type_Site | None:
+    """
+    Returns the source position identifying a loop (its condition),
+    conditional (its condition) or call (its callee): (file, row, column)
+    Copies of a node made by passes keep their position so they share it
+    """
+    match node:
+        case NodeLoop() | NodeConditional():
+            anchor = node.condition
+        case NodeFunctionCall():
+            anchor = node.callee
+        case _:
+            anchor = node
+    # -First node in the anchor carrying a position (left-most operand)
+    while not isinstance(anchor, NodeContextBase):
+        match anchor:
+            case NodeFunctionCall():
+                anchor = anchor.callee
+            case _:
+                return None
+    return (str(anchor.file), anchor.row, anchor.column)
+
+
+## Classes
+class ProfileError(Exception):
+    """
+    Ember Profile Error
+    - Raised when a profile file is malformed or of another version
+    """
+    pass
+
+
+class Profile:
+    """
+    Ember Execution Profile
+    - Execution counts keyed by source position, written by a profiling
+    run and read by profile-guided passes:
+    loops: times entered and body iterations
+    branches: times each arm of a conditional was taken
+    calls: times a call site was executed
+    Shares are relative to the whole profile so thresholds do not depend
+    on how long the profiled run was
+    """
+
+    # -Constructor
+    def __init__(self) -> None:
+        self.loop_entries: Counter[Type_Site] = Counter()
+        self.loop_iterations: Counter[Type_Site] = Counter()
+        self.branches_true: Counter[Type_Site] = Counter()
+        self.branches_false: Counter[Type_Site] = Counter()
+        self.calls: Counter[Type_Site] = Counter()
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"Profile(loops={len(self.loop_entries)}, "
+                f"branches={len(self.branches_true | self.branches_false)}, "
+                f"calls={len(self.calls)})")
+
+    # -Instance Methods
+    # --Recording
+    def record_loop(self, node: NodeLoop, iterations: int) -> None:
+        if (key := site(node)) is not None:
+            self.loop_entries[key] += 1
+            self.loop_iterations[key] += iterations
+
+    def record_branch(self, node: NodeConditional, taken: bool) -> None:
+        # -Counted in source orientation: an inverted conditional's arms are swapped
+        if (key := site(node)) is not None:
+            (self.branches_true if taken != node.inverted else self.branches_false)[key] += 1
+
+    def record_call(self, node: NodeFunctionCall) -> None:
+        if (key := site(node)) is not None:
+            self.calls[key] += 1
+
+    def merge(self, other: Profile) -> None:
+        '''
+        Adds another run's counts to this profile
+        '''
+        self.loop_entries.update(other.loop_entries)
+        self.loop_iterations.update(other.loop_iterations)
+        self.branches_true.update(other.branches_true)
+        self.branches_false.update(other.branches_false)
+        self.calls.update(other.calls)
+
+    # --Queries
+    def iterations(self, node: NodeLoop) -> int:
+        key = site(node)
+        return self.loop_iterations[key] if key is not None else 0
+
+    def trip_count(self, node: NodeLoop) -> float | None:
+        '''
+        Returns the average iterations per entry of a loop (None if never entered)
+        '''
+        key = site(node)
+        if key is None or not self.loop_entries[key]:
+            return None
+        return self.loop_iterations[key] / self.loop_entries[key]
+
+    def branch(self, node: NodeConditional) -> tuple[int, int]:
+        '''
+        Returns how often a conditional's true and false arms were taken,
+        as the arms currently stand (swapped for an inverted conditional)
+        '''
+        key = site(node)
+        if key is None:
+            return (0, 0)
+        if node.inverted:
+            return (self.branches_false[key], self.branches_true[key])
+        return (self.branches_true[key], self.branches_false[key])
+
+    def call_count(self, node: NodeFunctionCall) -> int:
+        key = site(node)
+        return self.calls[key] if key is not None else 0
+
+    def loop_share(self, node: NodeLoop) -> float:
+        total = self.loop_iterations.total()
+        return self.iterations(node) / total if total else 0.0
+
+    def call_share(self, node: NodeFunctionCall) -> float:
+        total = self.calls.total()
+        return self.call_count(node) / total if total else 0.0
+
+    # --Serialization
+    def save(self, path: Path) -> None:
+        path.write_text(json.dumps(self.to_dict()))
+
+    def to_dict(self) -> dict[str, object]:
+        loops = sorted(self.loop_entries | self.loop_iterations)
+        branches = sorted(self.branches_true | self.branches_false)
+        return {
+            "version": VERSION,
+            "loops": [[*key, self.loop_entries[key], self.loop_iterations[key]] for key in loops],
+            "branches": [
+                [*key, self.branches_true[key], self.branches_false[key]] for key in branches
+            ],
+            "calls": [[*key, count] for key, count in sorted(self.calls.items())],
+        }
+
+    @classmethod
+    def load(cls, path: Path) -> Profile:
+        try:
+            data = json.loads(path.read_text())
+        except ValueError as error:
+            raise ProfileError(f"'{path}' is not a profile: {error}") from None
+        return cls.from_dict(data, str(path))
+
+    @classmethod
+    def from_dict(cls, data: dict, name: str = "profile") -> Profile:
+        if not isinstance(data, dict) or data.get("version") != VERSION:
+            raise ProfileError(f"'{name}' is not a version {VERSION} profile")
+        profile = cls()
+        try:
+            for _file, row, column, entries, iterations in data["loops"]:
+                profile.loop_entries[(_file, row, column)] = entries
+                profile.loop_iterations[(_file, row, column)] = iterations
+            for _file, row, column, true, false in data["branches"]:
+                profile.branches_true[(_file, row, column)] = true
+                profile.branches_false[(_file, row, column)] = false
+            for _file, row, column, count in data["calls"]:
+                profile.calls[(_file, row, column)] = count
+        except (KeyError, TypeError, ValueError) as error:
+            raise ProfileError(f"'{name}' is malformed: {error}") from None
+        return profile
@@ -0,0 +1,118 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Middleware    ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Span Index                    ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+
+from .nodes import NodeBase
+from .passes.common import walk
+
+
+## Classes
+class SpanIndex:
+    """
+    Ember Span Index
+    - Interval index over the spans of an AST's nodes answering editor
+    queries (hover, go-to-definition, highlighting) without walking it
+    Spans are sorted by start (outer before inner on equal starts) with a
+    max-end tree above them: the nodes starting before a point whose
+    subtree reaches past it are the only ones descended into, so a query
+    costs O(log n) per node it returns
+    Built from the nodes a parser gave spans (Parser.spanned) alongside
+    the AST or by walking one (from_ast); shared nodes (hash-consed) are
+    indexed once at the span of their first construction
+    """
+
+    # -Constructor
+    def __init__(self, nodes: Iterable[NodeBase]) -> None:
+        # -No tuple per node: allocating ~1M tracked objects makes the
+        #  collector traverse the whole AST a few times over
+        nodes = [node for node in nodes if node.span is not None]
+        spans = [node.span for node in nodes]
+        # -Order by start then by end descending packed into one integer key
+        keys = [(span[0] << 32) - span[1] for span in spans]
+        order = sorted(range(len(nodes)), key=keys.__getitem__)
+        self.nodes: list[NodeBase] = [nodes[index] for index in order]
+        self.starts: list[int] = [spans[index][0] for index in order]
+        self.ends: list[int] = [spans[index][1] for index in order]
+        # -Heap-ordered max-end tree: leaf i at size + i, padding ends at -1
+        self._size: int = 1
+        while self._size < len(self.nodes):
+            self._size *= 2
+        self._tree: list[int] = [-1] * self._size + self.ends + [-1] * (self._size - len(self.nodes))
+        level = self._size
+        while level > 1:
+            children = self._tree[level:2 * level]
+            self._tree[level // 2:level] = map(max, children[0::2], children[1::2])
+            level //= 2
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"SpanIndex(nodes={len(self.nodes)})"
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    # -Instance Methods
+    @classmethod
+    def from_ast(cls, ast: list[NodeBase]) -> SpanIndex:
+        '''
+        Builds the index of an AST that was not parsed alongside (e.g. loaded)
+        '''
+        nodes: dict[int, NodeBase] = {}
+        for root in ast:
+            for node in walk(root):
+                if node.span is not None:
+                    nodes.setdefault(id(node), node)
+        return cls(nodes.values())
+
+    def at(self, offset: int) -> NodeBase | None:
+        '''
+        Returns the innermost node whose span contains an offset (None if none does)
+        '''
+        indices = self._reaching(bisect_right(self.starts, offset), offset)
+        return self.nodes[indices[-1]] if indices else None
+
+    def containing(self, offset: int) -> list[NodeBase]:
+        '''
+        Returns the nodes whose span contains an offset from outermost to innermost
+        '''
+        return [self.nodes[index] for index in self._reaching(bisect_right(self.starts, offset), offset)]
+
+    def overlapping(self, start: int, end: int) -> list[NodeBase]:
+        '''
+        Returns the nodes whose span overlaps [start, end) in source order
+        '''
+        return [self.nodes[index] for index in self._reaching(bisect_left(self.starts, end), start)]
+
+    def _reaching(self, limit: int, offset: int) -> list[int]:
+        '''
+        Returns the indices below limit (spans starting early enough) whose
+        span ends past offset in ascending order, pruning subtrees whose
+        spans all end by it or start too late
+        '''
+        found: list[int] = []
+        tree, size = self._tree, self._size
+        stack = [1]
+        while stack:
+            index = stack.pop()
+            if tree[index] <= offset:
+                continue
+            depth = index.bit_length() - 1
+            width = size >> depth
+            first = (index - (1 << depth)) * width
+            if first >= limit:
+                continue
+            if index >= size:
+                found.append(first)
+                continue
+            stack.append(2 * index + 1)
+            stack.append(2 * index)
+        return found
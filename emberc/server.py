@@ -0,0 +1,233 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Compile Server                ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import argparse
+import fcntl
+import io
+import json
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from .client import compiler_version, default_socket, request
+from .driver import build_arguments, main
+
+## Constants
+IDLE_TIMEOUT: float = 600.0
+POLL_INTERVAL: float = 0.5
+MAX_WORKERS: int = 8
+CACHE_ENTRIES: int = 256
+
+
+## Classes
+class CompileServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Ember Compile Server
+    - Keeps the compiler imported in a long-lived process listening on a
+    Unix socket; every connection carries one JSON request line and gets
+    one JSON reply line with the exit code and captured output
+    Requests run on their own thread (at most workers at once), plain
+    compiles are cached by file, mtime and size, the server stops after
+    idle_timeout seconds without requests and stops taking new requests
+    as soon as a client with other compiler sources connects, so that
+    client can start a fresh server on the same socket
+    """
+    daemon_threads = False
+    block_on_close = True
+
+    # -Constructor
+    def __init__(
+        self, path: Path, idle_timeout: float = IDLE_TIMEOUT, workers: int = MAX_WORKERS,
+        cache_entries: int = CACHE_ENTRIES
+    ) -> None:
+        self.path: Path = path
+        self.idle_timeout: float = idle_timeout
+        self.cache_entries: int = cache_entries
+        self.version: str = compiler_version()
+        self.requests: int = 0
+        self.cache_hits: int = 0
+        self._cache: OrderedDict[tuple[Any, ...], dict[str, Any]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        # -tracemalloc is process-wide so --stats compiles must not overlap
+        self._trace_lock: threading.Lock = threading.Lock()
+        self._workers: threading.BoundedSemaphore = threading.BoundedSemaphore(workers)
+        self._active: int = 0
+        self._last_request: float = time.monotonic()
+        self._stopping: bool = False
+        super().__init__(str(path), CompileServer.Handler)
+        self.timeout = POLL_INTERVAL
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"CompileServer(path={self.path}, requests={self.requests}, "
+                f"cache_hits={self.cache_hits})")
+
+    # -Instance Methods
+    def run(self) -> None:
+        '''
+        Serves until idle or retired, then waits for running requests
+        '''
+        try:
+            while not self._stopping:
+                self.handle_request()
+        finally:
+            self.retire()
+            self.server_close()
+
+    def retire(self) -> None:
+        '''
+        Stops taking requests; the socket is removed at once so a new
+        server can listen on it while running requests finish
+        '''
+        with self._lock:
+            if self._stopping:
+                return
+            self._stopping = True
+            self.path.unlink(missing_ok=True)
+
+    def handle_timeout(self) -> None:
+        with self._lock:
+            idle = self._active == 0 and time.monotonic() - self._last_request > self.idle_timeout
+        if idle:
+            self.retire()
+
+    def execute(self, message: dict[str, Any]) -> dict[str, Any]:
+        '''
+        Answers one request
+        '''
+        match message.get("command"):
+            case "ping":
+                return {"status": "ok", "version": self.version}
+            case "stop":
+                self.retire()
+                return {"status": "ok"}
+            case "compile":
+                if message.get("version") != self.version:
+                    self.retire()
+                    return {"status": "restart"}
+                with self._workers:
+                    return self.compile(message["argv"], Path(message["cwd"]))
+            case command:
+                return {"status": "error", "error": f"unknown command '{command}'"}
+
+    def compile(self, argv: list[str], cwd: Path) -> dict[str, Any]:
+        key = self._cache_key(argv, cwd)
+        if key is not None:
+            with self._lock:
+                if (reply := self._cache.get(key)) is not None:
+                    self._cache.move_to_end(key)
+                    self.cache_hits += 1
+                    return reply
+        stdout, stderr = io.StringIO(), io.StringIO()
+        if "--stats" in argv:
+            with self._trace_lock:
+                code = self._run(argv, stdout, stderr, cwd)
+        else:
+            code = self._run(argv, stdout, stderr, cwd)
+        reply = {
+            "status": "ok", "code": code,
+            "stdout": stdout.getvalue(), "stderr": stderr.getvalue(),
+        }
+        if key is not None and code == 0:
+            with self._lock:
+                self._cache[key] = reply
+                if len(self._cache) > self.cache_entries:
+                    self._cache.popitem(last=False)
+        return reply
+
+    def _run(self, argv: list[str], stdout: io.StringIO, stderr: io.StringIO, cwd: Path) -> int:
+        try:
+            return main(argv, stdout, stderr, cwd)
+        except Exception as error:
+            print(f"emberc: {type(error).__name__}: {error}", file=stderr)
+            return 1
+
+    def _cache_key(self, argv: list[str], cwd: Path) -> tuple[Any, ...] | None:
+        '''
+        Returns the cache key of a compile without reports (None otherwise)
+        '''
+        arguments = build_arguments(io.StringIO(), io.StringIO())
+        try:
+            options = arguments.parse_args(argv)
+        except SystemExit:
+            return None
+        if (options.file is None or options.time_passes or options.stats or
+                options.profile_generate or options.profile_use):
+            return None
+        path = cwd / options.file
+        try:
+            status = path.stat()
+        except OSError:
+            return None
+        return (str(path.resolve()), status.st_mtime_ns, status.st_size, options.passes)
+
+    # -Sub-Classes
+    class Handler(socketserver.StreamRequestHandler):
+        """
+        Ember Compile Server Request
+        """
+        server: CompileServer
+
+        def handle(self) -> None:
+            server = self.server
+            with server._lock:
+                server._active += 1
+                server.requests += 1
+            try:
+                try:
+                    reply = server.execute(json.loads(self.rfile.readline()))
+                except ValueError as error:
+                    reply = {"status": "error", "error": f"malformed request: {error}"}
+                self.wfile.write(json.dumps(reply).encode() + b'\n')
+            finally:
+                with server._lock:
+                    server._active -= 1
+                    server._last_request = time.monotonic()
+
+
+## Functions
+def serve(path: Path, idle_timeout: float = IDLE_TIMEOUT, workers: int = MAX_WORKERS) -> bool:
+    """
+    Serves on path unless a server already answers there (a stale socket
+    is replaced); Returns whether this process served
+    """
+    with open(f"{path}.lock", 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if path.exists():
+            try:
+                request(str(path), {"command": "ping"})
+                return False
+            except OSError:
+                path.unlink()
+        server = CompileServer(path, idle_timeout, workers)
+    server.run()
+    return True
+
+
+## Body
+if __name__ == "__main__":
+    arguments = argparse.ArgumentParser(prog="emberc.server", description="Ember Compile Server")
+    arguments.add_argument("--socket", type=Path, default=Path(default_socket()))
+    arguments.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT,
+                           help="seconds without requests before the server exits")
+    arguments.add_argument("--workers", type=int, default=MAX_WORKERS,
+                           help="compiles running at once")
+    arguments.add_argument("--stop", action="store_true", help="stop the running server")
+    options = arguments.parse_args()
+    if options.stop:
+        try:
+            request(str(options.socket), {"command": "stop"})
+        except OSError:
+            pass
+    else:
+        serve(options.socket, options.idle_timeout, options.workers)
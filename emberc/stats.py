@@ -0,0 +1,147 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Compile Statistics            ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import json
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any
+
+from .frontend import Token
+from .middleware.nodes import NodeBase
+from .middleware.passes import NodeCounter, PassManager
+
+
+## Classes
+class CompileStatistics:
+    """
+    Ember Compile Statistics
+    - Collects what a compile costs: wall and CPU time per phase (and per
+    pass), token counts by type, node counts by class, peak traced memory
+    and throughput; only built when the driver asks for a report
+    """
+
+    # -Constructor
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.phases: dict[str, tuple[float, float]] = {}
+        self.passes: list[PassManager.Record] = []
+        self.cache: tuple[int, int] | None = None
+        self.tokens: Counter[str] = Counter()
+        self.nodes: Counter[str] = Counter()
+        self.lines: int = 0
+        self.peak_memory: int | None = None
+        self.trace_memory: bool = trace_memory
+        if trace_memory:
+            tracemalloc.start()
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"CompileStatistics(phases={len(self.phases)}, "
+                f"tokens={self.tokens.total()}, nodes={self.nodes.total()})")
+
+    # -Instance Methods
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        '''
+        Times the body of a with statement as a named phase
+        '''
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.phases[name] = (time.perf_counter() - wall, time.process_time() - cpu)
+
+    def count_tokens(self, tokens: list[Token]) -> None:
+        self.tokens.update(token.type.name for token in tokens)
+
+    def count_nodes(self, ast: list[NodeBase]) -> None:
+        self.nodes = NodeCounter(ast).counts
+
+    def finish(self) -> None:
+        '''
+        Stops memory tracing keeping the peak
+        '''
+        if self.trace_memory and tracemalloc.is_tracing():
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    def rates(self) -> dict[str, float]:
+        '''
+        Returns throughput of the lex and parse phases
+        '''
+        rates: dict[str, float] = {}
+        if (lex := self.phases.get("lex")) and lex[0] > 0:
+            rates["tokens_per_second"] = self.tokens.total() / lex[0]
+        if (parse := self.phases.get("parse")) and parse[0] > 0:
+            rates["nodes_per_second"] = self.nodes.total() / parse[0]
+        elapsed = sum(
+            self.phases[name][0] for name in ("lex", "parse") if name in self.phases
+        )
+        if elapsed > 0:
+            rates["lines_per_second"] = self.lines / elapsed
+        return rates
+
+    def to_dict(self, timing: bool = True, counts: bool = True) -> dict[str, Any]:
+        '''
+        Returns the report as JSON-serializable data
+        '''
+        report: dict[str, Any] = {}
+        if timing:
+            report["phases"] = {
+                name: {"wall": wall, "cpu": cpu} for name, (wall, cpu) in self.phases.items()
+            }
+            report["passes"] = [
+                {"name": record.name, "wall": record.wall, "cpu": record.cpu,
+                 "nodes": record.after, "delta": record.delta} for record in self.passes
+            ]
+            if self.cache is not None:
+                report["cache"] = {"hits": self.cache[0], "misses": self.cache[1]}
+        if counts:
+            report["lines"] = self.lines
+            report["tokens"] = dict(self.tokens.most_common())
+            report["nodes"] = dict(self.nodes.most_common())
+            report["peak_memory"] = self.peak_memory
+            report["rates"] = self.rates()
+        return report
+
+    def to_json(self, timing: bool = True, counts: bool = True) -> str:
+        return json.dumps(self.to_dict(timing, counts), indent=2)
+
+    def to_text(self, timing: bool = True, counts: bool = True) -> str:
+        '''
+        Returns the report as human-readable tables
+        '''
+        lines: list[str] = []
+        if timing:
+            lines.append(f"{'phase':<16}{'wall ms':>12}{'cpu ms':>12}")
+            for name, (wall, cpu) in self.phases.items():
+                lines.append(f"{name:<16}{wall * 1000:>12.3f}{cpu * 1000:>12.3f}")
+            for record in self.passes:
+                lines.append(
+                    f"  {record.name:<14}{record.wall * 1000:>12.3f}{record.cpu * 1000:>12.3f}"
+                    f"{record.after:>8} nodes ({record.delta:+})"
+                )
+            if self.cache is not None:
+                lines.append(f"  function cache: {self.cache[0]} hits, {self.cache[1]} misses")
+        if counts:
+            if lines:
+                lines.append('')
+            lines.append(f"lines: {self.lines}")
+            lines.append(f"tokens: {self.tokens.total()}")
+            lines.extend(f"  {name:<24}{count:>10}" for name, count in self.tokens.most_common())
+            lines.append(f"nodes: {self.nodes.total()}")
+            lines.extend(f"  {name:<24}{count:>10}" for name, count in self.nodes.most_common())
+            if self.peak_memory is not None:
+                lines.append(f"peak memory: {self.peak_memory / 1024:.1f} KiB")
+            for name, rate in self.rates().items():
+                lines.append(f"{name.replace('_', ' ')}: {rate:.0f}")
+        return '\n'.join(lines)
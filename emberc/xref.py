@@ -0,0 +1,392 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler                ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Cross-Reference Database      ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .frontend import Lexer, Parser
+from .middleware.nodes import (
+    NodeBase, NodeFunctionCall, NodeFunctionDeclaration,
+    NodeVarAssignment, NodeVarDeclaration, NodeLiteral,
+)
+from .middleware.nodes.base import NodeContextBase
+from .middleware.passes.common import callee, children, identifier
+
+## Constants
+# -Bumped whenever the schema or what gets recorded changes: databases
+#  of another version are rebuilt from scratch
+SCHEMA: int = 1
+DATABASE: Path = Path(".ember-xref.db")
+EXTENSION: str = ".ember"
+CHUNK_SIZE: int = 16
+FUNCTION: str = "function"
+CALL: str = "call"
+VARIABLE: str = "variable"
+ASSIGNMENT: str = "assignment"
+KINDS: tuple[str, ...] = (FUNCTION, CALL, VARIABLE, ASSIGNMENT)
+Type_Row = tuple[str, str, str | None, int, int, int, int | None, int | None]
+TABLES: str = """
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    error TEXT
+);
+CREATE TABLE refs (
+    file INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    scope TEXT,
+    row INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    span_start INTEGER,
+    span_end INTEGER
+);
+CREATE INDEX refs_name ON refs(name, kind);
+CREATE INDEX refs_scope ON refs(scope, kind);
+CREATE INDEX refs_file ON refs(file);
+"""
+
+
+## Functions
+def references(ast: list[NodeBase]) -> list[Type_Row]:
+    """
+    Returns the (kind, name, scope, row, column, offset, span start,
+    span end) of every function declaration, call site, variable
+    declaration and assignment of an AST in source order
+    Scope is the innermost function around it (None at top level)
+    """
+    rows: list[Type_Row] = []
+    stack: list[tuple[NodeBase, str | None]] = [(node, None) for node in reversed(ast)]
+    while stack:
+        node, scope = stack.pop()
+        # -Exact classes (node classes are not subclassed) skip the ABC
+        #  isinstance checks; literals, most nodes, have nothing to record
+        kind = node.__class__
+        if kind is NodeLiteral:
+            continue
+        inner = scope
+        if kind is NodeFunctionDeclaration:
+            rows.append(_row(FUNCTION, node.id, scope, node, node))
+            inner = node.id
+        elif kind is NodeVarDeclaration:
+            rows.append(_row(VARIABLE, node.id, scope, node, node))
+        elif kind is NodeFunctionCall:
+            if (name := callee(node)) is not None:
+                rows.append(_row(CALL, name, scope, node.callee, node))
+        elif kind is NodeVarAssignment:
+            if (name := identifier(node.lvalue)) is not None:
+                rows.append(_row(ASSIGNMENT, name, scope, node.lvalue, node))
+        stack.extend((child, inner) for child in reversed(children(node)))
+    return rows
+
+
+def _row(kind: str, name: str, scope: str | None, context: NodeBase, node: NodeBase) -> Type_Row:
+    position = context.position if isinstance(context, NodeContextBase) else (0, 0, 0)
+    span = node.span if node.span is not None else (None, None)
+    return (kind, name, scope, *position, *span)
+
+
+def _parse(path: Path, source: bytes) -> tuple[list[Type_Row], str | None]:
+    '''
+    Returns the references of a file's source or the error it failed with
+    '''
+    try:
+        return references(Parser(Lexer(path, source).lex()).parse()), None
+    except (AssertionError, UnicodeDecodeError) as exception:
+        # -TODO: Catch compiler errors once the frontend raises them
+        return [], str(exception) or type(exception).__name__
+
+
+def _sources(paths: Iterable[Path]) -> tuple[list[Path], list[Path]]:
+    '''
+    Returns the source files found under paths (directories are searched
+    recursively) and the paths resolved
+    '''
+    files: list[Path] = []
+    roots: list[Path] = []
+    for path in paths:
+        path = path.resolve()
+        roots.append(path)
+        if path.is_dir():
+            files.extend(sorted(path.rglob(f"*{EXTENSION}")))
+        elif path.exists():
+            files.append(path)
+    return files, roots
+
+
+def main(argv: list[str]) -> int:
+    '''
+    Updates or queries a cross-reference database; Returns the exit code
+    '''
+    arguments = argparse.ArgumentParser(
+        prog="emberc.xref", description="Ember cross-reference database"
+    )
+    arguments.add_argument("--database", type=Path, default=DATABASE)
+    commands = arguments.add_subparsers(dest="command", required=True)
+    index = commands.add_parser("index", help="index changed files under the given paths")
+    index.add_argument("paths", nargs='+', type=Path)
+    index.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                       help="processes parsing changed files")
+    for command, description in (
+        ("definitions", "functions declared with a name"),
+        ("callers", "call sites of a function"),
+        ("callees", "call sites inside a function"),
+        ("declarations", "variables declared with a name"),
+        ("assignments", "assignments to a variable"),
+    ):
+        query = commands.add_parser(command, help=description)
+        query.add_argument("name")
+    commands.add_parser("stats", help="count indexed files and references")
+    options = arguments.parse_args(argv)
+    with CrossReference(options.database) as xref:
+        if options.command == "index":
+            indexed, unchanged, removed = xref.update(options.paths, options.jobs)
+            for path, error in xref.failed:
+                print(f"{path}: could not parse: {error}", file=sys.stderr)
+            print(f"indexed={indexed} unchanged={unchanged} removed={removed}")
+        elif options.command == "stats":
+            for name, count in xref.statistics().items():
+                print(f"{name}={count}")
+        else:
+            for reference in getattr(xref, options.command)(options.name):
+                print(reference)
+    return 0
+
+
+## Classes
+class Reference:
+    """
+    Ember Cross-Reference
+    - One recorded declaration, call site or assignment of a name
+    Positions are those of the name's token; spans the whole node's
+    """
+
+    # -Constructor
+    def __init__(
+        self, kind: str, name: str, scope: str | None, file: Path,
+        position: tuple[int, int, int], span: tuple[int, int] | None
+    ) -> None:
+        self.kind: str = kind
+        self.name: str = name
+        self.scope: str | None = scope
+        self.file: Path = file
+        self.position: tuple[int, int, int] = position
+        self.span: tuple[int, int] | None = span
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return (f"Reference(kind={self.kind}, name={self.name}, scope={self.scope}, "
+                f"file={self.file}, position={self.position}, span={self.span})")
+
+    def __str__(self) -> str:
+        where = f" in {self.scope}" if self.scope is not None else ""
+        return f"{self.file}:{self.row}:{self.column}: {self.kind} {self.name}{where}"
+
+    # -Properties
+    @property
+    def column(self) -> int:
+        return self.position[1]
+
+    @property
+    def offset(self) -> int:
+        return self.position[2]
+
+    @property
+    def row(self) -> int:
+        return self.position[0]
+
+
+class CrossReference:
+    """
+    Ember Cross-Reference Database
+    - SQLite database of the function declarations, call sites, variable
+    declarations and assignments of a set of source files answering
+    "who calls f" or "where is x assigned" from indices instead of
+    parsing the corpus again
+    Updates are incremental per file: files whose modification time and
+    size are unchanged are not read, files whose content hash is
+    unchanged are not parsed, and a changed file's references are
+    replaced as a whole (in one transaction with the rest of the update)
+    Names are matched as written: references are not resolved to the
+    declaration they bind to, scope only tells which function they are in
+    """
+
+    # -Constructor
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+        self.failed: list[tuple[Path, str]] = []  # -by the last update
+        self._connection: sqlite3.Connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA:
+            with self._connection:
+                self._connection.execute("DROP TABLE IF EXISTS refs")
+                self._connection.execute("DROP TABLE IF EXISTS files")
+            self._connection.executescript(TABLES)
+            self._connection.execute(f"PRAGMA user_version = {SCHEMA}")
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"CrossReference(path={self.path})"
+
+    def __enter__(self) -> CrossReference:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    # -Instance Methods
+    def close(self) -> None:
+        self._connection.close()
+
+    # --Indexing
+    def update(self, paths: Iterable[Path], workers: int = 1) -> tuple[int, int, int]:
+        '''
+        Indexes the changed source files under paths (parsing them in
+        worker processes if more than one) and forgets indexed files under
+        them that were deleted; Returns the number of files (re)indexed,
+        unchanged and removed
+        '''
+        files, roots = _sources(paths)
+        unchanged = removed = 0
+        self.failed = []
+        known = {
+            path: (_id, mtime, size, digest) for _id, path, mtime, size, digest
+            in self._connection.execute("SELECT id, path, mtime, size, digest FROM files")
+        }
+        changed: list[tuple[Path, bytes, str, int, int]] = []
+        with self._connection:
+            for path in files:
+                status = path.stat()
+                stored = known.get(str(path))
+                if stored is not None and stored[1:3] == (status.st_mtime_ns, status.st_size):
+                    unchanged += 1
+                    continue
+                source = path.read_bytes()
+                digest = hashlib.sha1(source).hexdigest()
+                if stored is not None and stored[3] == digest:
+                    self._connection.execute(
+                        "UPDATE files SET mtime = ?, size = ? WHERE id = ?",
+                        (status.st_mtime_ns, status.st_size, stored[0])
+                    )
+                    unchanged += 1
+                    continue
+                changed.append((path, source, digest, status.st_mtime_ns, status.st_size))
+            sources = ([path for path, *_ in changed], [source for _, source, *_ in changed])
+            if workers > 1 and len(changed) > workers:
+                with ProcessPoolExecutor(workers) as executor:
+                    self._store(changed, executor.map(_parse, *sources, chunksize=CHUNK_SIZE))
+            else:
+                self._store(changed, map(_parse, *sources))
+            found = {str(path) for path in files}
+            for path, stored in known.items():
+                if path not in found and any(Path(path).is_relative_to(root) for root in roots):
+                    self._connection.execute("DELETE FROM files WHERE id = ?", (stored[0],))
+                    removed += 1
+        return len(changed), unchanged, removed
+
+    def _store(
+        self, changed: list[tuple[Path, bytes, str, int, int]],
+        results: Iterable[tuple[list[Type_Row], str | None]]
+    ) -> None:
+        '''
+        Replaces the references of changed files with their parse results
+        Files that failed to parse are kept without references
+        '''
+        for (path, _, digest, mtime, size), (rows, error) in zip(changed, results):
+            if error is not None:
+                self.failed.append((path, error))
+            self._connection.execute("DELETE FROM files WHERE path = ?", (str(path),))
+            _id = self._connection.execute(
+                "INSERT INTO files (path, mtime, size, digest, error) VALUES (?, ?, ?, ?, ?)",
+                (str(path), mtime, size, digest, error)
+            ).lastrowid
+            self._connection.executemany(
+                "INSERT INTO refs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ((_id, *row) for row in rows)
+            )
+
+    # --Queries
+    def definitions(self, name: str) -> list[Reference]:
+        '''
+        Returns the declarations of functions named name
+        '''
+        return self._query("name = ? AND kind = ?", (name, FUNCTION))
+
+    def callers(self, name: str) -> list[Reference]:
+        '''
+        Returns the call sites of a function (scope is the calling function)
+        '''
+        return self._query("name = ? AND kind = ?", (name, CALL))
+
+    def callees(self, name: str) -> list[Reference]:
+        '''
+        Returns the call sites inside functions named name
+        '''
+        return self._query("scope = ? AND kind = ?", (name, CALL))
+
+    def declarations(self, name: str) -> list[Reference]:
+        '''
+        Returns the declarations of variables named name
+        '''
+        return self._query("name = ? AND kind = ?", (name, VARIABLE))
+
+    def assignments(self, name: str) -> list[Reference]:
+        '''
+        Returns the assignments to variables named name
+        '''
+        return self._query("name = ? AND kind = ?", (name, ASSIGNMENT))
+
+    def errors(self) -> list[tuple[Path, str]]:
+        '''
+        Returns the indexed files that failed to parse with their error
+        '''
+        return [
+            (Path(path), error) for path, error in self._connection.execute(
+                "SELECT path, error FROM files WHERE error IS NOT NULL ORDER BY path"
+            )
+        ]
+
+    def statistics(self) -> dict[str, int]:
+        '''
+        Returns the number of indexed files and of references of each kind
+        '''
+        (files,) = self._connection.execute("SELECT COUNT(*) FROM files").fetchone()
+        counts = dict(self._connection.execute("SELECT kind, COUNT(*) FROM refs GROUP BY kind"))
+        return {"files": files, **{kind: counts.get(kind, 0) for kind in KINDS}}
+
+    def _query(self, where: str, parameters: tuple[str, ...]) -> list[Reference]:
+        return [
+            Reference(kind, name, scope, Path(path), (row, column, offset),
+                      (start, end) if start is not None else None)
+            for kind, name, scope, path, row, column, offset, start, end
+            in self._connection.execute(
+                "SELECT kind, name, scope, path, row, col, offset, span_start, span_end "
+                f"FROM refs JOIN files ON refs.file = files.id WHERE {where} "
+                "ORDER BY path, offset", parameters
+            )
+        ]
+
+
+## Body
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
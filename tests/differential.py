@@ -0,0 +1,92 @@
+#!/usr/bin/python
+##-------------------------------##
+## Ember Compiler: Tests         ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Differential Pass Check       ##
+##-------------------------------##
+
+## Imports
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from emberc.backend import Interpreter, ProfilingInterpreter, constant_evaluator
+from emberc.cache import FunctionCache
+from emberc.frontend import Lexer, Parser
+from emberc.middleware.nodes import NodeBase, NodeFactory, NodeFactoryHashConsed
+from emberc.middleware.passes import PassManager
+from emberc.middleware.profile import Profile
+
+## Constants
+TESTS: Path = Path(__file__).parent
+# -Every pass alone, then the full pipeline in its usual order
+PIPELINES: tuple[tuple[str, ...], ...] = (
+    *((name,) for name in PassManager.PASSES),
+    tuple(PassManager.PASSES),
+)
+FACTORIES: tuple[type[NodeFactory], ...] = (NodeFactory, NodeFactoryHashConsed)
+
+
+## Functions
+def build(
+    src: Path, passes: tuple[str, ...], factory: type[NodeFactory], profile: Profile | None,
+    cache: FunctionCache | None = None
+) -> list[NodeBase]:
+    """
+    Parses a program and runs passes on it (through a function cache if
+    given); lower runs last unless the pipeline ran it so narrow types
+    wrap as compiled code would
+    """
+    ast = Parser(Lexer(src).lex(), factory()).parse()
+    if "lower" not in passes:
+        passes = (*passes, "lower")
+    if cache is not None:
+        cache.compile(ast, passes, profile)
+    else:
+        PassManager(ast, passes, profile, constant_evaluator).run()
+    return ast
+
+
+def check(src: Path) -> int:
+    """
+    Runs a program lowered only and after every pipeline, each compiled
+    whole with every factory then through a function cache (stored, then
+    loaded); Returns the number of builds changing its result (programs
+    not running skip)
+    """
+    try:
+        baseline = ProfilingInterpreter(build(src, (), NodeFactory, None))
+        expected = baseline.run()
+    except Exception as error:
+        print(f"{src.name}: skipped ({type(error).__name__}: {error})")
+        return 0
+    builds = 0
+    failures = 0
+    with tempfile.TemporaryDirectory() as directory:
+        for passes in PIPELINES:
+            cache = FunctionCache(Path(directory) / ','.join(passes))
+            variants = [(factory.__name__, factory, None) for factory in FACTORIES]
+            variants += [(f"cache {run}", NodeFactory, cache) for run in ("store", "load")]
+            for name, factory, _cache in variants:
+                builds += 1
+                try:
+                    ast = build(src, passes, factory, baseline.profile, _cache)
+                    result = Interpreter(ast).run()
+                except Exception as error:
+                    result = f"{type(error).__name__}: {error}"
+                if result != expected:
+                    failures += 1
+                    print(f"{src.name}: {','.join(passes)} ({name}) "
+                          f"returned {result}, expected {expected}")
+    print(f"{src.name}: result={expected} {builds - failures}/{builds} match")
+    return failures
+
+
+## Body
+if __name__ == '__main__':
+    files = [Path(name) for name in sys.argv[1:]] or sorted(TESTS.glob("*.ember"))
+    failed = sum(check(src) for src in files)
+    sys.exit(1 if failed else 0)